@@ -0,0 +1,376 @@
+from dataclasses import dataclass
+from math import acos, cos, hypot, sin, sqrt
+
+import numpy as np
+
+from kinematics import G
+from shared import DEFAULT_CONFIG, Flight, Point, Role, SimulationConfig
+
+
+@dataclass
+class AdaptiveResult:
+    """Класс для хранения результата моделирования с адаптивным шагом."""
+
+    flight: Flight  # данные о полете в моменты принятых шагов интегратора
+    captured: bool  # достигнут ли радиус перехвата
+    capture_time: float  # момент перехвата или наибольшего сближения (с)
+    miss_distance: float  # расстояние до цели в этот момент (м)
+    peak_overload: float  # пиковая перегрузка (G)
+    nfev: int  # количество вычислений правой части
+
+
+def lineMotion(aim: Role, config: SimulationConfig = DEFAULT_CONFIG):
+    """
+    Строит закон движения цели по прямой, как в targeting.UpdatePointOnLine.
+
+    Args:
+        aim (Role): Объект цели
+        config (SimulationConfig): Параметры моделирования
+
+    Returns:
+        Функция t -> (позиция, скорость, ускорение) в виде кортежей (x, y)
+    """
+    QR = config.q0 * np.pi / 180
+    vx = aim.velocity * cos(QR)
+    vy = aim.velocity * sin(QR)
+
+    def motion(t: float):
+        return (vx * t + config.d0, vy * t), (vx, vy), (0.0, 0.0)
+
+    return motion
+
+
+def circleMotion(
+    aim: Role, center: Point, start: Point, config: SimulationConfig = DEFAULT_CONFIG
+):
+    """
+    Строит закон движения цели по окружности, как в targeting.UpdatePointOnCircle.
+
+    Args:
+        aim (Role): Объект цели
+        center (Point): Центр окружности
+        start (Point): Начальная фаза движения по окружности
+        config (SimulationConfig): Параметры моделирования
+
+    Returns:
+        Функция t -> (позиция, скорость, ускорение) в виде кортежей (x, y)
+    """
+    r = config.r
+    omega = aim.velocity / r
+
+    def motion(t: float):
+        cos_x = cos(omega * t + start.x)
+        sin_y = sin(omega * t + start.y)
+        position = (r * cos_x + center.x, r * sin_y + center.y)
+        velocity = (
+            -r * omega * sin(omega * t + start.x),
+            r * omega * cos(omega * t + start.y),
+        )
+        acceleration = (-r * omega**2 * cos_x, -r * omega**2 * sin_y)
+        return position, velocity, acceleration
+
+    return motion
+
+
+def pursuitGuidance(interceptor: Role):
+    """
+    Строит закон наведения методом погони: скорость направлена на цель.
+
+    Returns:
+        Функции скорости перехватчика и необходимой перегрузки
+    """
+    v = interceptor.velocity
+
+    def velocity(position, target, target_velocity):
+        dx = target[0] - position[0]
+        dy = target[1] - position[1]
+        d = hypot(dx, dy)
+        return v * dx / d, v * dy / d
+
+    def overload(position, target, target_velocity, target_acceleration):
+        # Перегрузка n = v * |dλ/dt| / g, где λ - угол линии визирования
+        dx = target[0] - position[0]
+        dy = target[1] - position[1]
+        vx, vy = velocity(position, target, target_velocity)
+        rel_x = target_velocity[0] - vx
+        rel_y = target_velocity[1] - vy
+        los_rate = (dx * rel_y - dy * rel_x) / (dx**2 + dy**2)
+        return v * abs(los_rate) / G
+
+    return velocity, overload
+
+
+def parallelGuidance(interceptor: Role, los: tuple[float, float]):
+    """
+    Строит закон параллельного сближения: линия визирования не поворачивается.
+
+    Составляющая скорости перехватчика поперек линии визирования равна
+    составляющей скорости цели, оставшаяся скорость направлена вдоль нее.
+
+    Args:
+        interceptor (Role): Объект перехватчика
+        los (tuple[float, float]): Начальная линия визирования (перехватчик -> цель)
+
+    Returns:
+        Функции скорости перехватчика и необходимой перегрузки
+    """
+    v = interceptor.velocity
+    length = hypot(*los)
+    ex, ey = los[0] / length, los[1] / length
+    nx, ny = -ey, ex
+
+    def velocity(position, target, target_velocity):
+        u_perp = target_velocity[0] * nx + target_velocity[1] * ny
+        u_along = sqrt(max(v**2 - u_perp**2, 0.0))
+        return u_perp * nx + u_along * ex, u_perp * ny + u_along * ey
+
+    def overload(position, target, target_velocity, target_acceleration):
+        # |a| = |du_perp/dt| * v / sqrt(v^2 - u_perp^2)
+        u_perp = target_velocity[0] * nx + target_velocity[1] * ny
+        a_perp = target_acceleration[0] * nx + target_acceleration[1] * ny
+        u_along = sqrt(max(v**2 - u_perp**2, 0.0))
+        if u_along == 0:
+            return float("inf") if a_perp else 0.0
+        return abs(a_perp) * v / u_along / G
+
+    return velocity, overload
+
+
+def integrateFight(
+    aim: Role,
+    interceptor: Role,
+    motion,
+    guidance,
+    capture_radius: float,
+    t_max: float,
+    rtol: float = 1e-8,
+    atol: float = 1e-6,
+) -> AdaptiveResult:
+    """
+    Интегрирует уравнения движения перехватчика адаптивным методом Рунге-Кутты.
+
+    Интегрирование останавливается событием: расстояние до цели стало меньше
+    capture_radius (перехват) или начало расти (промах, момент наибольшего
+    сближения).
+
+    Args:
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        motion: Закон движения цели (lineMotion или circleMotion)
+        guidance: Закон наведения (pursuitGuidance или parallelGuidance)
+        capture_radius (float): Радиус перехвата (м)
+        t_max (float): Наибольшее время моделирования (с)
+        rtol (float): Относительная точность интегратора
+        atol (float): Абсолютная точность интегратора (м)
+
+    Returns:
+        AdaptiveResult: Данные о полете и характеристики перехвата
+    """
+    velocity, overload = guidance
+
+    def rhs(t, y):
+        target, target_velocity, _ = motion(t)
+        return velocity(y, target, target_velocity)
+
+    def capture(t, y):
+        target, _, _ = motion(t)
+        return hypot(target[0] - y[0], target[1] - y[1]) - capture_radius
+
+    def closest(t, y):
+        # Скорость изменения расстояния (с точностью до множителя 1 / D)
+        target, target_velocity, _ = motion(t)
+        vx, vy = velocity(y, target, target_velocity)
+        return (target[0] - y[0]) * (target_velocity[0] - vx) + (target[1] - y[1]) * (
+            target_velocity[1] - vy
+        )
+
+    capture.terminal = True
+    capture.direction = -1
+    closest.terminal = True
+    closest.direction = 1
+
+    # scipy загружается только при интегрировании, а не при импорте модуля
+    from scipy.integrate import solve_ivp
+
+    start = interceptor.trajectory[-1]
+    solution = solve_ivp(
+        rhs,
+        (0.0, t_max),
+        [start.x, start.y],
+        rtol=rtol,
+        atol=atol,
+        events=(capture, closest),
+        dense_output=True,
+    )
+
+    flight = Flight([], 0, [], [], [], [])
+    origin = motion(0.0)[0]
+    d0_x, d0_y = origin[0] - start.x, origin[1] - start.y
+    for t, x, y in zip(solution.t[1:], *solution.y[:, 1:]):
+        target, target_velocity, target_acceleration = motion(t)
+        vx, vy = velocity((x, y), target, target_velocity)
+        dx, dy = target[0] - x, target[1] - y
+        d = hypot(dx, dy)
+        tv = hypot(*target_velocity)
+        aim.trajectory.appendXY(*target)
+        interceptor.trajectory.appendXY(x, y)
+        flight.n.append(overload((x, y), target, target_velocity, target_acceleration))
+        flight.d.append(d)
+        # Угол ракурса - между скоростью цели и линией визирования
+        cos_q = (target_velocity[0] * dx + target_velocity[1] * dy) / (tv * d or 1)
+        flight.q.append(acos(min(1.0, max(-1.0, cos_q))))
+        # Угол визирования - между начальной линией визирования и скоростью перехватчика
+        cos_phi = (d0_x * vx + d0_y * vy) / (hypot(d0_x, d0_y) * hypot(vx, vy) or 1)
+        flight.phi.append(acos(min(1.0, max(-1.0, cos_phi))))
+        flight.t.append(float(t))
+    flight.steps = len(flight.t)
+
+    # Пиковая перегрузка уточняется по плотному выходу интегратора
+    dense_t = np.union1d(
+        solution.t, np.linspace(solution.t[0], solution.t[-1], 8 * len(solution.t))
+    )
+    peak = 0.0
+    for t, x, y in zip(dense_t, *solution.sol(dense_t)):
+        target, target_velocity, target_acceleration = motion(t)
+        peak = max(peak, overload((x, y), target, target_velocity, target_acceleration))
+
+    end_t = float(solution.t[-1])
+    target = motion(end_t)[0]
+    miss = hypot(target[0] - solution.y[0, -1], target[1] - solution.y[1, -1])
+    # Если шаг интегратора перескочил через цель, |D| - радиус не меняет знак,
+    # и перехват фиксируется по наибольшему сближению
+    captured = len(solution.t_events[0]) > 0 or (
+        len(solution.t_events[1]) > 0 and miss <= capture_radius
+    )
+    return AdaptiveResult(flight, captured, end_t, miss, peak, solution.nfev)
+
+
+def circleFightAdaptive(
+    aim: Role,
+    interceptor: Role,
+    center: Point,
+    start: Point,
+    capture_radius: float = 1.0,
+    t_max: float = 1000.0,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    rtol: float = 1e-8,
+) -> AdaptiveResult:
+    """
+    Моделирует перехват цели на окружности методом погони с адаптивным шагом.
+
+    Args:
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        center (Point): Центр окружности
+        start (Point): Начальная фаза движения по окружности
+        capture_radius (float): Радиус перехвата (м)
+        t_max (float): Наибольшее время моделирования (с)
+        config (SimulationConfig): Параметры моделирования
+        rtol (float): Относительная точность интегратора
+
+    Returns:
+        AdaptiveResult: Данные о полете и характеристики перехвата
+    """
+    motion = circleMotion(aim, center, start, config)
+    guidance = pursuitGuidance(interceptor)
+    return integrateFight(
+        aim, interceptor, motion, guidance, capture_radius, t_max, rtol
+    )
+
+
+def lineFightAdaptive(
+    aim: Role,
+    interceptor: Role,
+    capture_radius: float = 1.0,
+    t_max: float = 1000.0,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    rtol: float = 1e-8,
+) -> AdaptiveResult:
+    """
+    Моделирует перехват цели на прямой методом погони с адаптивным шагом.
+
+    Args:
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        capture_radius (float): Радиус перехвата (м)
+        t_max (float): Наибольшее время моделирования (с)
+        config (SimulationConfig): Параметры моделирования
+        rtol (float): Относительная точность интегратора
+
+    Returns:
+        AdaptiveResult: Данные о полете и характеристики перехвата
+    """
+    motion = lineMotion(aim, config)
+    guidance = pursuitGuidance(interceptor)
+    return integrateFight(
+        aim, interceptor, motion, guidance, capture_radius, t_max, rtol
+    )
+
+
+def _initialLos(motion, interceptor: Role) -> tuple[float, float]:
+    """Начальная линия визирования (перехватчик -> цель)."""
+    target = motion(0.0)[0]
+    start = interceptor.trajectory[-1]
+    return target[0] - start.x, target[1] - start.y
+
+
+def parallelFightAdaptive(
+    aim: Role,
+    interceptor: Role,
+    center: Point,
+    start: Point,
+    capture_radius: float = 1.0,
+    t_max: float = 1000.0,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    rtol: float = 1e-8,
+) -> AdaptiveResult:
+    """
+    Моделирует перехват цели на окружности параллельным сближением с адаптивным шагом.
+
+    Args:
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        center (Point): Центр окружности
+        start (Point): Начальная фаза движения по окружности
+        capture_radius (float): Радиус перехвата (м)
+        t_max (float): Наибольшее время моделирования (с)
+        config (SimulationConfig): Параметры моделирования
+        rtol (float): Относительная точность интегратора
+
+    Returns:
+        AdaptiveResult: Данные о полете и характеристики перехвата
+    """
+    motion = circleMotion(aim, center, start, config)
+    guidance = parallelGuidance(interceptor, _initialLos(motion, interceptor))
+    return integrateFight(
+        aim, interceptor, motion, guidance, capture_radius, t_max, rtol
+    )
+
+
+def parallelLineFightAdaptive(
+    aim: Role,
+    interceptor: Role,
+    capture_radius: float = 1.0,
+    t_max: float = 1000.0,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    rtol: float = 1e-8,
+) -> AdaptiveResult:
+    """
+    Моделирует перехват цели на прямой параллельным сближением с адаптивным шагом.
+
+    Args:
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        capture_radius (float): Радиус перехвата (м)
+        t_max (float): Наибольшее время моделирования (с)
+        config (SimulationConfig): Параметры моделирования
+        rtol (float): Относительная точность интегратора
+
+    Returns:
+        AdaptiveResult: Данные о полете и характеристики перехвата
+    """
+    motion = lineMotion(aim, config)
+    guidance = parallelGuidance(interceptor, _initialLos(motion, interceptor))
+    return integrateFight(
+        aim, interceptor, motion, guidance, capture_radius, t_max, rtol
+    )
@@ -0,0 +1,633 @@
+from dataclasses import dataclass
+from math import atan2, ceil, cos, hypot, pi, sin
+
+import numpy as np
+
+from shared import (
+    AIM_VELOCITY,
+    D0,
+    DEFAULT_CONFIG,
+    DELTA_T,
+    INTERCEPTOR_VELOCITY,
+    Q0,
+    R,
+    Flight,
+    Point,
+    Role,
+    SimulationConfig,
+)
+from kinematics import G, PURSUIT, BatchKinematicsKernel
+
+
+@dataclass
+class PursuitSolution:
+    """
+    Класс для хранения аналитического решения задачи погони за целью,
+    движущейся по прямой с постоянной скоростью.
+
+    Угол theta - угол между вектором скорости цели и линией визирования
+    (перехватчик -> цель). При погоне он монотонно убывает до нуля, а
+    дальность и время выражаются через него в замкнутом виде:
+
+        r(theta) = r0 * (tg(theta/2) / tg(theta0/2))^k * sin(theta0) / sin(theta)
+        t(theta) = T - r(theta) * (v + u cos(theta)) / (v^2 - u^2)
+    """
+
+    aim_start: Point  # начальная позиция цели
+    heading: float  # направление движения цели (рад)
+    aim_velocity: float  # скорость цели (м / с)
+    interceptor_velocity: float  # скорость перехватчика (м / с)
+    r0: float  # начальное расстояние (м)
+    theta0: float  # начальный угол между скоростью цели и линией визирования (рад)
+    sigma: float  # сторона линии визирования относительно скорости цели (+1 / -1)
+    capture_time: float  # время перехвата (с)
+
+
+def solveLinePursuit(
+    aim_start: Point,
+    aim_velocity: float,
+    heading: float,
+    interceptor_start: Point,
+    interceptor_velocity: float,
+) -> PursuitSolution:
+    """
+    Находит аналитическое решение задачи погони за целью, движущейся по прямой.
+
+    Args:
+        aim_start (Point): Начальная позиция цели
+        aim_velocity (float): Скорость цели
+        heading (float): Направление движения цели (рад)
+        interceptor_start (Point): Начальная позиция перехватчика
+        interceptor_velocity (float): Скорость перехватчика
+
+    Returns:
+        PursuitSolution: Параметры решения, включая время перехвата
+
+    Raises:
+        ValueError: Если перехватчик не быстрее цели
+    """
+    # Отрицательная скорость - движение в обратную сторону
+    if aim_velocity < 0:
+        aim_velocity, heading = -aim_velocity, heading + pi
+    u = aim_velocity
+    v = interceptor_velocity
+    if v <= u:
+        raise ValueError("аналитическое решение существует только при v > u")
+
+    los_x = aim_start.x - interceptor_start.x
+    los_y = aim_start.y - interceptor_start.y
+    r0 = hypot(los_x, los_y)
+    # Угол от направления скорости цели до линии визирования в (-pi, pi]
+    angle = atan2(los_y, los_x) - heading
+    angle = atan2(sin(angle), cos(angle))
+    theta0 = abs(angle)
+    sigma = 1.0 if angle >= 0 else -1.0
+
+    capture_time = r0 * (v + u * cos(theta0)) / (v**2 - u**2)
+    return PursuitSolution(aim_start, heading, u, v, r0, theta0, sigma, capture_time)
+
+
+def _rangeAt(solution: PursuitSolution, theta: np.ndarray) -> np.ndarray:
+    """Дальность r(theta) для theta в (0, theta0]."""
+    k = solution.interceptor_velocity / solution.aim_velocity
+    theta0 = solution.theta0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_r = (
+            np.log(solution.r0)
+            + k * (np.log(np.tan(theta / 2)) - np.log(np.tan(theta0 / 2)))
+            + np.log(sin(theta0))
+            - np.log(np.sin(theta))
+        )
+    return np.where(theta > 0, np.exp(log_r), 0.0)
+
+
+def _timeAt(solution: PursuitSolution, theta: np.ndarray) -> np.ndarray:
+    """Время t(theta), монотонно убывающее по theta."""
+    u = solution.aim_velocity
+    v = solution.interceptor_velocity
+    r = _rangeAt(solution, theta)
+    return solution.capture_time - r * (v + u * np.cos(theta)) / (v**2 - u**2)
+
+
+def _thetaAt(solution: PursuitSolution, t: np.ndarray) -> np.ndarray:
+    """
+    Обращает t(theta) сразу для всего массива времен.
+
+    Корень ищется по переменной w = ln(tg(theta/2)), для которой
+    dt/dw = -r / u: несколько шагов бисекции локализуют корень, затем метод
+    Ньютона уточняет его, не выходя из интервала.
+    """
+    u = solution.aim_velocity
+    k = solution.interceptor_velocity / u
+    w0 = np.log(np.tan(solution.theta0 / 2))
+    # Нижняя граница, при которой r(w) / r0 ~ 1e-17
+    low = np.full_like(t, w0 - min(700.0, 40.0 / (k - 1)))
+    high = np.full_like(t, w0)
+    for _ in range(12):
+        middle = (low + high) / 2
+        later = _timeAt(solution, 2 * np.arctan(np.exp(middle))) > t
+        low = np.where(later, middle, low)
+        high = np.where(later, high, middle)
+    w = (low + high) / 2
+    for _ in range(8):
+        theta = 2 * np.arctan(np.exp(w))
+        r = _rangeAt(solution, theta)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = (_timeAt(solution, theta) - t) * u / r
+        w = np.clip(w + np.nan_to_num(step), low, high)
+    theta = 2 * np.arctan(np.exp(w))
+    return np.where(t >= solution.capture_time, 0.0, theta)
+
+
+def pursuitState(
+    solution: PursuitSolution, times
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Вычисляет состояние погони в произвольные моменты времени без пошагового счета.
+
+    Моменты после перехвата заменяются временем перехвата.
+
+    Args:
+        solution (PursuitSolution): Аналитическое решение
+        times: Моменты времени (скаляр или массив)
+
+    Returns:
+        tuple: Позиции цели (N, 2), позиции перехватчика (N, 2), расстояния (N,),
+            углы theta (N,) и необходимые перегрузки (N,)
+    """
+    t = np.clip(np.atleast_1d(np.asarray(times, dtype=np.float64)), 0, None)
+    t = np.minimum(t, solution.capture_time)
+    u = solution.aim_velocity
+    v = solution.interceptor_velocity
+    heading = solution.heading
+
+    aim = np.stack(
+        (
+            solution.aim_start.x + u * t * cos(heading),
+            solution.aim_start.y + u * t * sin(heading),
+        ),
+        axis=1,
+    )
+
+    if 0 < solution.theta0 < pi:
+        theta = _thetaAt(solution, t)
+        r = _rangeAt(solution, theta)
+    else:
+        # Цель движется вдоль линии визирования: сближение по прямой
+        theta = np.full_like(t, solution.theta0)
+        r = solution.r0 - (v - u * cos(solution.theta0)) * t
+
+    los = heading + solution.sigma * theta
+    interceptor = aim - r[:, None] * np.stack((np.cos(los), np.sin(los)), axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n = np.where(r > 0, v * u * np.sin(theta) / (G * r), 0.0)
+    return aim, interceptor, r, theta, n
+
+
+def peakOverload(solution: PursuitSolution) -> float:
+    """
+    Находит наибольшую необходимую перегрузку за время погони без пошагового счета.
+
+    В переменной tau = tg(theta/2) перегрузка пропорциональна
+    tau^(2 - k) / (1 + tau^2)^2 и при k < 2 достигает максимума при
+    tau^2 = (2 - k) / (2 + k). При k > 2 перегрузка неограниченно растет
+    к моменту перехвата.
+
+    Args:
+        solution (PursuitSolution): Аналитическое решение
+
+    Returns:
+        float: Пиковая перегрузка (inf, если она не ограничена)
+    """
+    u = solution.aim_velocity
+    v = solution.interceptor_velocity
+    k = v / u
+    theta0 = solution.theta0
+    if not 0 < theta0 < pi:
+        return 0.0
+    if k > 2:
+        return float("inf")
+    # Постоянный множитель: n = c * tau^(2 - k) / (1 + tau^2)^2
+    tau0 = np.tan(theta0 / 2)
+    c = 4 * v * u * tau0**k / (G * solution.r0 * sin(theta0))
+    tau = min(tau0, np.sqrt((2 - k) / (2 + k)))
+    return float(c * tau ** (2 - k) / (1 + tau**2) ** 2)
+
+
+def solveLineFight(
+    aim: Role, interceptor: Role, config: SimulationConfig = DEFAULT_CONFIG
+) -> PursuitSolution:
+    """
+    Находит аналитическое решение для постановки targeting.lineFight.
+
+    Цель движется так же, как в targeting.UpdatePointOnLine: из точки (d0, 0)
+    под углом q0 к оси x.
+
+    Args:
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        config (SimulationConfig): Параметры моделирования
+
+    Returns:
+        PursuitSolution: Аналитическое решение
+    """
+    return solveLinePursuit(
+        Point(config.d0, 0),
+        aim.velocity,
+        config.q0 * pi / 180,
+        interceptor.trajectory[0],
+        interceptor.velocity,
+    )
+
+
+def analyticLineFight(
+    aim: Role, interceptor: Role, config: SimulationConfig = DEFAULT_CONFIG
+) -> Flight:
+    """
+    Строит данные о полете для targeting.lineFight по аналитическому решению.
+
+    Траектории заполняются на той же сетке времени, что и при пошаговом
+    моделировании. Столбцы имеют тот же смысл, что и в пошаговом lineFight:
+    расстояние - на начало шага, угол ракурса и перегрузка - по ядру
+    кинематики (kinematics.BatchKinematicsKernel) для точек траекторий.
+
+    Args:
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        config (SimulationConfig): Параметры моделирования
+
+    Returns:
+        Flight: Объект с данными о полете
+    """
+    solution = solveLineFight(aim, interceptor, config)
+    dt = config.delta_t
+    steps = max(1, ceil(solution.capture_time / dt))
+    times = dt * np.arange(1, steps + 1)
+    aim_xy, inter_xy, _, _, _ = pursuitState(solution, times)
+    _, _, r_prev, _, _ = pursuitState(solution, times - dt)
+
+    # Все шаги - строки одной пачки: начальный вектор визирования общий
+    aim_start = aim.trajectory[0]
+    inter_start = interceptor.trajectory[0]
+    kernel = BatchKinematicsKernel(
+        np.tile((aim_start.x, aim_start.y), (steps, 1)),
+        np.tile((inter_start.x, inter_start.y), (steps, 1)),
+        np.full(steps, float(aim.velocity)),
+        np.full(steps, float(interceptor.velocity)),
+        PURSUIT,
+        dt,
+        config.r,
+    )
+    aim_path = np.vstack(((aim.trajectory[-1].x, aim.trajectory[-1].y), aim_xy))
+    inter_path = np.vstack(
+        ((interceptor.trajectory[-1].x, interceptor.trajectory[-1].y), inter_xy)
+    )
+    state = kernel.update(aim_path[:-1], aim_path[1:], inter_path[:-1], inter_path[1:])
+
+    for (ax, ay), (ix, iy) in zip(aim_xy.tolist(), inter_xy.tolist()):
+        aim.trajectory.appendXY(ax, ay)
+        interceptor.trajectory.appendXY(ix, iy)
+    return Flight(
+        state.n.tolist(), steps, r_prev.tolist(), state.q.tolist(), [], times.tolist()
+    )
+
+
+def lineFightError(
+    flight: Flight,
+    aim: Role,
+    interceptor: Role,
+    config: SimulationConfig = DEFAULT_CONFIG,
+) -> tuple[float, float]:
+    """
+    Сравнивает результат пошагового targeting.lineFight с аналитическим решением.
+
+    Args:
+        flight (Flight): Результат lineFight
+        aim (Role): Объект цели после моделирования
+        interceptor (Role): Объект перехватчика после моделирования
+        config (SimulationConfig): Параметры моделирования
+
+    Returns:
+        tuple[float, float]: Разница времени перехвата (с) и наибольшее
+            отклонение точек перехватчика от аналитической траектории (м)
+    """
+    solution = solveLineFight(aim, interceptor, config)
+    times = np.asarray(flight.t)
+    _, inter_xy, _, _, _ = pursuitState(solution, times)
+    stepped = interceptor.trajectory.points[1 : len(times) + 1]
+    deviation = np.hypot(*(stepped - inter_xy[: len(stepped)]).T)
+    return times[-1] - solution.capture_time, float(deviation.max(initial=0.0))
+
+
+@dataclass
+class ParallelState:
+    """
+    Класс для хранения состояния параллельного сближения в заданные моменты.
+
+    Массивы имеют форму (N, T): N постановок, T моментов времени.
+    """
+
+    t: np.ndarray  # моменты времени (с)
+    aim: np.ndarray  # позиции цели, (N, T, 2)
+    interceptor: np.ndarray  # позиции перехватчика, (N, T, 2)
+    d: np.ndarray  # расстояние до цели (м)
+    q: np.ndarray  # угол ракурса (как в kinematics.KinematicsKernel)
+    n: np.ndarray  # необходимая перегрузка (NaN, если сближение невозможно)
+
+
+@dataclass
+class ParallelCapture:
+    """Класс для хранения итогов параллельного сближения (массивы (N,))."""
+
+    captured: np.ndarray  # достигнуто ли расстояние остановки
+    capture_time: np.ndarray  # точное время достижения расстояния остановки (с)
+    steps: np.ndarray  # количество шагов пошагового моделирования
+    peak_overload: np.ndarray  # пиковая перегрузка за эти шаги (NaN без шагов)
+
+
+def _rows(*values) -> list[np.ndarray]:
+    """Приводит скалярные параметры постановок к массивам одинаковой длины N."""
+    arrays = [np.asarray(v, dtype=np.float64) for v in values]
+    count = max([a.size for a in arrays if a.ndim > 0] or [1])
+    return [np.broadcast_to(a, (count,)).copy() for a in arrays]
+
+
+def _points(value, count: int) -> np.ndarray:
+    """Приводит точку (2,) или массив точек (N, 2) к форме (N, 2)."""
+    return np.broadcast_to(np.asarray(value, dtype=np.float64), (count, 2)).copy()
+
+
+def _lineTarget(va, q0, d0):
+    """Функция (t, rows) -> координаты цели на прямой (как UpdatePointOnLine)."""
+    heading = q0 * np.pi / 180
+
+    def points(t: np.ndarray, rows: np.ndarray):
+        s = va[rows, None] * t
+        return (
+            s * np.cos(heading[rows, None]) + d0[rows, None],
+            s * np.sin(heading[rows, None]),
+        )
+
+    return points
+
+
+def _circleTarget(va, r, center, start):
+    """Функция (t, rows) -> координаты цели на окружности (как UpdatePointOnCircle)."""
+    omega = va / r
+
+    def points(t: np.ndarray, rows: np.ndarray):
+        phase = omega[rows, None] * t
+        return (
+            r[rows, None] * np.cos(phase + start[rows, 0, None])
+            + center[rows, 0, None],
+            r[rows, None] * np.sin(phase + start[rows, 1, None])
+            + center[rows, 1, None],
+        )
+
+    return points
+
+
+def _positions(t: np.ndarray, target, rows, aim_start: np.ndarray, vi: np.ndarray):
+    """
+    Позиции цели и перехватчика после шага, завершающегося в момент t.
+
+    Перехватчик (старт из (0, 0)) смещается по y на смещение цели за шаг,
+    поэтому его ордината равна смещению цели от начальной точки, а
+    x = sqrt(|s^2 - y^2|), s = v t (как parallel.updateInterceptorPoint).
+    """
+    aim_x, aim_y = target(t, rows)
+    y = aim_y - aim_start[rows, 1, None]
+    x = np.sqrt(np.abs((vi[rows, None] * t) ** 2 - y**2))
+    return aim_x, aim_y, x, y
+
+
+def _parallelState(times, target, rows, aim_start, va, vi, dt) -> ParallelState:
+    """Состояние параллельного сближения в моменты times для строк rows."""
+    count = len(rows)
+    t = np.asarray(times, dtype=np.float64)
+    t = np.broadcast_to(t if t.ndim == 2 else t.reshape(1, -1), (count, t.shape[-1]))
+    aim_x, aim_y, x, y = _positions(t, target, rows, aim_start, vi)
+    # До первого шага - начальные позиции
+    start = t <= 0
+    aim0_x = aim_start[rows, 0, None]
+    aim0_y = aim_start[rows, 1, None]
+    aim_x = np.where(start, aim0_x, aim_x)
+    aim_y = np.where(start, aim0_y, aim_y)
+    x = np.where(start, 0.0, x)
+    y = np.where(start, 0.0, y)
+    d = np.hypot(aim_x - x, aim_y - y)
+
+    # Угол ракурса по перемещению цели за шаг (с особенностями KinematicsKernel:
+    # в y-компонентах векторов вычитается координата x)
+    prev_x, _ = target(t - dt, rows)
+    prev_x = np.where(t - dt < dt / 2, aim0_x, prev_x)
+    move_x = aim_x - prev_x
+    move_y = aim_y - prev_x
+    lengths = np.hypot(aim0_x, aim0_y) * np.hypot(move_x, move_y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_q = np.where(
+            lengths != 0, (aim0_x * move_x + aim0_y * move_y) / lengths, 0.0
+        )
+        q = np.arccos(np.clip(cos_q, -1.0, 1.0))
+        K = (vi[rows] / va[rows])[:, None]
+        n = np.abs((K * np.cos(q)) / np.sqrt(K**2 - np.sin(q) ** 2))
+    return ParallelState(
+        t,
+        np.stack((aim_x, aim_y), axis=2),
+        np.stack((x, y), axis=2),
+        d,
+        np.where(start, np.nan, q),
+        np.where(start, np.nan, n),
+    )
+
+
+def _parallelCapture(
+    target, aim_start, va, vi, stop, dt, max_steps, chunk
+) -> ParallelCapture:
+    """Итоги параллельного сближения без пошагового цикла."""
+    count = len(va)
+    # Моменты шагов накапливаются так же, как t += dt в цикле моделирования
+    times = np.cumsum(np.full(max_steps, dt))
+    distance = np.hypot(aim_start[:, 0], aim_start[:, 1])
+    captured = distance <= stop
+    steps = np.zeros(count, dtype=np.int64)
+    peak = np.full(count, np.nan)
+    bracket = np.full(count, -1, dtype=np.int64)  # шаг, после которого d <= stop
+    active = np.flatnonzero(~captured)
+
+    for begin in range(0, max_steps, chunk):
+        if not len(active):
+            break
+        t = times[begin : begin + chunk]
+        state = _parallelState(t, target, active, aim_start, va, vi, dt)
+        # Расстояние в начале каждого шага - после предыдущего шага
+        start = np.concatenate((distance[active, None], state.d[:, :-1]), axis=1)
+        done = start <= stop[active, None]
+        event = done | np.isnan(state.n)
+        found = event.any(axis=1)
+        first = np.where(found, event.argmax(axis=1), len(t) - 1)
+        window = np.where(np.arange(len(t)) <= first[:, None], state.n, np.nan)
+        peak[active] = np.fmax(peak[active], np.fmax.reduce(window, axis=1))
+        steps[active] = begin + first + 1
+        hit = found & done[np.arange(len(active)), first]
+        captured[active[hit]] = True
+        bracket[active[hit]] = begin + first[hit] - 1
+        distance[active] = state.d[:, -1]
+        active = active[~found]
+
+    # Точное время - пересечение расстояния остановки между шагами bracket - 1 и
+    # bracket (деление отрезка пополам)
+    capture_time = np.where(captured, 0.0, np.nan)
+    rows = np.flatnonzero(bracket >= 0)
+    if len(rows):
+        high = times[bracket[rows]]
+        low = np.where(bracket[rows] > 0, times[np.maximum(bracket[rows] - 1, 0)], 0.0)
+        for _ in range(60):
+            middle = (low + high) / 2
+            aim_x, aim_y, x, y = _positions(
+                middle[:, None], target, rows, aim_start, vi
+            )
+            inside = np.hypot(aim_x - x, aim_y - y)[:, 0] <= stop[rows]
+            high = np.where(inside, middle, high)
+            low = np.where(inside, low, middle)
+        capture_time[rows] = high
+    return ParallelCapture(captured, capture_time, steps, peak)
+
+
+def parallelLineState(
+    times,
+    aim_velocity=AIM_VELOCITY,
+    interceptor_velocity=INTERCEPTOR_VELOCITY,
+    d0=D0,
+    q0=Q0,
+    dt: float = DELTA_T,
+) -> ParallelState:
+    """
+    Вычисляет состояние parallel.lineFight в произвольные моменты без пошагового счета.
+
+    Положение перехватчика при параллельном сближении зависит только от
+    времени и смещения цели, поэтому все моменты и постановки считаются сразу.
+    Угол ракурса и перегрузка - как на шаге длиной dt, завершающемся в момент t.
+
+    Args:
+        times: Моменты времени, (T,) или (N, T)
+        aim_velocity: Скорости целей (скаляр или (N,))
+        interceptor_velocity: Скорости перехватчиков
+        d0: Начальные расстояния
+        q0: Углы направления движения целей в градусах
+        dt (float): Шаг по времени (для угла ракурса)
+
+    Returns:
+        ParallelState: Состояние, массивы (N, T)
+    """
+    va, vi, d0, q0 = _rows(aim_velocity, interceptor_velocity, d0, q0)
+    aim_start = np.stack((d0, np.zeros(len(d0))), axis=1)
+    target = _lineTarget(va, q0, d0)
+    return _parallelState(times, target, np.arange(len(va)), aim_start, va, vi, dt)
+
+
+def parallelCircleState(
+    times,
+    aim_velocity=AIM_VELOCITY,
+    interceptor_velocity=INTERCEPTOR_VELOCITY,
+    d0=D0,
+    r=R,
+    center=(0, 0),
+    start=(0, 0),
+    dt: float = DELTA_T,
+) -> ParallelState:
+    """
+    Вычисляет состояние parallel.fight в произвольные моменты без пошагового счета.
+
+    Args:
+        times: Моменты времени, (T,) или (N, T)
+        aim_velocity: Скорости целей (скаляр или (N,))
+        interceptor_velocity: Скорости перехватчиков
+        d0: Абсциссы начальных точек целей
+        r: Радиусы окружностей
+        center: Центры окружностей, (2,) или (N, 2)
+        start: Начальные фазы по осям x и y, (2,) или (N, 2)
+        dt (float): Шаг по времени (для угла ракурса)
+
+    Returns:
+        ParallelState: Состояние, массивы (N, T)
+    """
+    va, vi, d0, r = _rows(aim_velocity, interceptor_velocity, d0, r)
+    center, start = _points(center, len(va)), _points(start, len(va))
+    aim_start = np.stack((d0, np.zeros(len(d0))), axis=1)
+    target = _circleTarget(va, r, center, start)
+    return _parallelState(times, target, np.arange(len(va)), aim_start, va, vi, dt)
+
+
+def parallelLineCapture(
+    aim_velocity=AIM_VELOCITY,
+    interceptor_velocity=INTERCEPTOR_VELOCITY,
+    d0=D0,
+    q0=Q0,
+    d=20,
+    dt: float = DELTA_T,
+    max_steps: int = 10000,
+    chunk: int = 1024,
+) -> ParallelCapture:
+    """
+    Находит итоги parallel.lineFight без пошагового цикла.
+
+    Расстояния на всех шагах считаются блоками по chunk шагов сразу; шаг
+    завершения и пиковая перегрузка совпадают с пошаговым моделированием
+    (batch.batchParallelLineFight). Время достижения расстояния d уточняется
+    делением отрезка между шагами пополам и не округляется до шага.
+
+    Args:
+        aim_velocity: Скорости целей (скаляр или (N,))
+        interceptor_velocity: Скорости перехватчиков
+        d0: Начальные расстояния
+        q0: Углы направления движения целей в градусах
+        d: Расстояния остановки
+        dt (float): Шаг по времени
+        max_steps (int): Максимальное количество шагов
+        chunk (int): Количество шагов в одном блоке
+
+    Returns:
+        ParallelCapture: Итоги по каждой постановке
+    """
+    va, vi, d0, q0, d = _rows(aim_velocity, interceptor_velocity, d0, q0, d)
+    aim_start = np.stack((d0, np.zeros(len(d0))), axis=1)
+    target = _lineTarget(va, q0, d0)
+    return _parallelCapture(target, aim_start, va, vi, d, dt, max_steps, chunk)
+
+
+def parallelCircleCapture(
+    aim_velocity=AIM_VELOCITY,
+    interceptor_velocity=INTERCEPTOR_VELOCITY,
+    d0=D0,
+    r=R,
+    center=(0, 0),
+    start=(0, 0),
+    d=20,
+    dt: float = DELTA_T,
+    max_steps: int = 10000,
+    chunk: int = 1024,
+) -> ParallelCapture:
+    """
+    Находит итоги parallel.fight без пошагового цикла (см. parallelLineCapture).
+
+    Args:
+        aim_velocity: Скорости целей (скаляр или (N,))
+        interceptor_velocity: Скорости перехватчиков
+        d0: Абсциссы начальных точек целей
+        r: Радиусы окружностей
+        center: Центры окружностей, (2,) или (N, 2)
+        start: Начальные фазы по осям x и y, (2,) или (N, 2)
+        d: Расстояния остановки
+        dt (float): Шаг по времени
+        max_steps (int): Максимальное количество шагов
+        chunk (int): Количество шагов в одном блоке
+
+    Returns:
+        ParallelCapture: Итоги по каждой постановке
+    """
+    va, vi, d0, r, d = _rows(aim_velocity, interceptor_velocity, d0, r, d)
+    center, start = _points(center, len(va)), _points(start, len(va))
+    aim_start = np.stack((d0, np.zeros(len(d0))), axis=1)
+    target = _circleTarget(va, r, center, start)
+    return _parallelCapture(target, aim_start, va, vi, d, dt, max_steps, chunk)
@@ -0,0 +1,497 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from engine import GuidanceLaw
+from kinematics import BatchKinematicsKernel, _norm
+from parallel import ParallelApproach
+from shared import AIM_VELOCITY, D0, DELTA_T, INTERCEPTOR_VELOCITY, Q0, R
+from targeting import Pursuit
+
+
+@dataclass
+class BatchFlight:
+    """Класс для хранения данных о пачке одновременно смоделированных полетов."""
+
+    n: np.ndarray  # перегрузки, (N, шаги), NaN после завершения
+    d: np.ndarray  # расстояния, (N, шаги), NaN после завершения
+    q: np.ndarray  # углы ракурса, (N, шаги), NaN после завершения
+    t: np.ndarray  # временные метки шагов, (шаги,)
+    steps: np.ndarray  # количество шагов до завершения каждого полета, (N,)
+    miss: np.ndarray  # расстояние до цели на последнем шаге, (N,)
+    captured: np.ndarray  # завершился ли полет перехватом, (N,)
+    peak: np.ndarray | None = None  # пиковая перегрузка каждого полета, (N,)
+
+
+def _rows(count: int | None, *values) -> tuple[int, list[np.ndarray]]:
+    """
+    Приводит скалярные параметры к массивам одинаковой длины N.
+
+    Args:
+        count (int | None): Требуемое количество строк (по умолчанию по параметрам)
+        values: Скаляры или массивы формы (N,)
+
+    Returns:
+        tuple[int, list[np.ndarray]]: Количество строк и приведенные массивы
+    """
+    arrays = [np.asarray(v, dtype=np.float64) for v in values]
+    if count is None:
+        count = max([a.size for a in arrays if a.ndim > 0] or [1])
+    return count, [np.broadcast_to(a, (count,)).copy() for a in arrays]
+
+
+def pointsOnLine(
+    t: float, velocity: np.ndarray, q0: np.ndarray, d0: np.ndarray
+) -> np.ndarray:
+    """
+    Построчный аналог targeting.UpdatePointOnLine.
+
+    Args:
+        t (float): Текущее время
+        velocity (np.ndarray): Скорости целей, (N,)
+        q0 (np.ndarray): Углы направления движения целей в градусах, (N,)
+        d0 (np.ndarray): Начальные абсциссы целей, (N,)
+
+    Returns:
+        np.ndarray: Позиции целей, (N, 2)
+    """
+    QR = q0 * np.pi / 180
+    s = velocity * t
+    return np.stack((s * np.cos(QR) + d0, s * np.sin(QR)), axis=1)
+
+
+def pointsOnCircle(
+    t: float,
+    velocity: np.ndarray,
+    r: np.ndarray,
+    center: np.ndarray,
+    start: np.ndarray,
+) -> np.ndarray:
+    """
+    Построчный аналог targeting.UpdatePointOnCircle.
+
+    Args:
+        t (float): Текущее время
+        velocity (np.ndarray): Скорости целей, (N,)
+        r (np.ndarray): Радиусы окружностей, (N,)
+        center (np.ndarray): Центры окружностей, (N, 2)
+        start (np.ndarray): Начальные фазы по осям x и y, (N, 2)
+
+    Returns:
+        np.ndarray: Позиции целей, (N, 2)
+    """
+    omega = velocity / r
+    x = r * np.cos(omega * t + start[:, 0]) + center[:, 0]
+    y = r * np.sin(omega * t + start[:, 1]) + center[:, 1]
+    return np.stack((x, y), axis=1)
+
+
+def _engage(
+    count: int,
+    aim_velocity: np.ndarray,
+    interceptor_velocity: np.ndarray,
+    aim_start: np.ndarray,
+    interceptor_start: np.ndarray,
+    target,
+    law: GuidanceLaw,
+    dt: float,
+    max_steps: int,
+    r=R,
+    history: bool = True,
+) -> BatchFlight:
+    """
+    Общий цикл моделирования N перехватов, выполняемых синхронно.
+
+    Построчный аналог engine.engagementSteps. Завершенные полеты больше не
+    обновляются. Строки, для которых перегрузка не определена (NaN, например
+    K < sin q при параллельном сближении), завершаются без перехвата.
+
+    Args:
+        target: Функция t -> позиции целей (N, 2)
+        law (GuidanceLaw): Закон наведения (новый экземпляр на каждый вызов)
+        r: Радиусы окружностей (перегрузка при нулевом расстоянии)
+        history (bool): Сохранять перегрузки, расстояния и углы на каждом шаге
+            (без истории n, d и q имеют форму (N, 0), а память не растет с
+            количеством шагов)
+
+    Returns:
+        BatchFlight: Результаты моделирования по каждой строке
+    """
+    aim_cur = aim_start.copy()
+    inter_cur = interceptor_start.copy()
+    kernel = BatchKinematicsKernel(
+        aim_start,
+        interceptor_start,
+        aim_velocity,
+        interceptor_velocity,
+        law.overload_law,
+        dt,
+        r,
+    )
+    law.start(interceptor_velocity, dt)
+
+    captured = np.broadcast_to(law.capturedAtStart(kernel.d), (count,)).copy()
+    active = ~captured
+    steps = np.zeros(count, dtype=np.int64)
+    miss = np.where(active, np.nan, kernel.d)
+    peak = np.full(count, np.nan)
+    n_hist, d_hist, q_hist, t_hist = [], [], [], []
+
+    t = dt
+    step = 0
+    state = None
+    while active.any() and step < max_steps:
+        distance = kernel.d
+        aim_new = target(t)
+        inter_new = law.moveBatch(
+            aim_cur, aim_new, inter_cur, interceptor_velocity, t, dt, state
+        )
+        state = kernel.update(aim_cur, aim_new, inter_cur, inter_new)
+        n = law.overload(state)
+
+        peak = np.where(active, np.fmax(peak, n), peak)
+        if history:
+            n_hist.append(np.where(active, n, np.nan))
+            d_hist.append(np.where(active, distance, np.nan))
+            q_hist.append(np.where(active, state.q, np.nan))
+        t_hist.append(t)
+
+        done = active & law.capturedBatch(state, distance)
+        failed = active & ~done & (law.missed(state) | np.isnan(n))
+        aim_cur = np.where(active[:, None], aim_new, aim_cur)
+        inter_cur = np.where(active[:, None], inter_new, inter_cur)
+        t += dt
+        step += 1
+        steps[active] = step
+        miss[done | failed] = distance[done | failed]
+        captured |= done
+        active &= ~(done | failed)
+
+    gap = aim_cur - inter_cur
+    miss[active] = _norm(gap[:, 0], gap[:, 1])[active]
+    return BatchFlight(
+        n=np.stack(n_hist, axis=1) if n_hist else np.empty((count, 0)),
+        d=np.stack(d_hist, axis=1) if d_hist else np.empty((count, 0)),
+        q=np.stack(q_hist, axis=1) if q_hist else np.empty((count, 0)),
+        t=np.array(t_hist),
+        steps=steps,
+        miss=miss,
+        captured=captured,
+        peak=peak,
+    )
+
+
+def batchLineFight(
+    aim_velocity=AIM_VELOCITY,
+    interceptor_velocity=INTERCEPTOR_VELOCITY,
+    d0=D0,
+    q0=Q0,
+    pres: int = 1,
+    dt: float = DELTA_T,
+    max_steps: int = 10000,
+    count: int | None = None,
+) -> BatchFlight:
+    """
+    Моделирует N перехватов целей, движущихся по прямой, методом погони.
+
+    Каждый параметр - скаляр или массив формы (N,). Цель стартует из (d0, 0),
+    перехватчик - из начала координат, как в targeting.lineFight.
+
+    Args:
+        aim_velocity: Скорости целей
+        interceptor_velocity: Скорости перехватчиков
+        d0: Начальные расстояния
+        q0: Углы направления движения целей в градусах
+        pres (int): Точность округления угла коррекции
+        dt (float): Шаг по времени
+        max_steps (int): Максимальное количество шагов
+        count (int | None): Количество полетов, если все параметры скаляры
+
+    Returns:
+        BatchFlight: Результаты моделирования по каждой строке
+    """
+    count, (va, vi, d0, q0) = _rows(count, aim_velocity, interceptor_velocity, d0, q0)
+    aim_start = np.stack((d0, np.zeros(count)), axis=1)
+    interceptor_start = np.zeros((count, 2))
+    return _engage(
+        count,
+        va,
+        vi,
+        aim_start,
+        interceptor_start,
+        lambda t: pointsOnLine(t, va, q0, d0),
+        Pursuit(pres),
+        dt,
+        max_steps,
+    )
+
+
+def batchCircleFight(
+    aim_velocity=AIM_VELOCITY,
+    interceptor_velocity=INTERCEPTOR_VELOCITY,
+    d0=D0,
+    r=R,
+    center=(0, 0),
+    start=(0, 0),
+    pres: int = 1,
+    dt: float = DELTA_T,
+    max_steps: int = 10000,
+    count: int | None = None,
+) -> BatchFlight:
+    """
+    Моделирует N перехватов целей, движущихся по окружности, методом погони.
+
+    Скалярные параметры - скаляры или массивы (N,), центр и начальная фаза -
+    пары или массивы (N, 2). Начальные точки такие же, как в main.py:
+    цель в (d0, 0), перехватчик в начале координат.
+
+    Args:
+        aim_velocity: Скорости целей (отрицательная - движение по часовой стрелке)
+        interceptor_velocity: Скорости перехватчиков
+        d0: Начальные абсциссы целей
+        r: Радиусы окружностей
+        center: Центры окружностей
+        start: Начальные фазы движения по окружности
+        pres (int): Точность округления угла коррекции
+        dt (float): Шаг по времени
+        max_steps (int): Максимальное количество шагов
+        count (int | None): Количество полетов, если все параметры скаляры
+
+    Returns:
+        BatchFlight: Результаты моделирования по каждой строке
+    """
+    count, (va, vi, d0, r) = _rows(count, aim_velocity, interceptor_velocity, d0, r)
+    center = np.broadcast_to(np.asarray(center, dtype=np.float64), (count, 2))
+    start = np.broadcast_to(np.asarray(start, dtype=np.float64), (count, 2))
+    aim_start = np.stack((d0, np.zeros(count)), axis=1)
+    interceptor_start = np.zeros((count, 2))
+    return _engage(
+        count,
+        va,
+        vi,
+        aim_start,
+        interceptor_start,
+        lambda t: pointsOnCircle(t, va, r, center, start),
+        Pursuit(pres),
+        dt,
+        max_steps,
+        r,
+    )
+
+
+def batchParallelLineFight(
+    aim_velocity=AIM_VELOCITY,
+    interceptor_velocity=INTERCEPTOR_VELOCITY,
+    d0=D0,
+    q0=Q0,
+    d=20,
+    dt: float = DELTA_T,
+    max_steps: int = 10000,
+    count: int | None = None,
+) -> BatchFlight:
+    """
+    Моделирует N перехватов целей, движущихся по прямой, параллельным сближением.
+
+    Каждый параметр - скаляр или массив формы (N,). Начальные точки такие же,
+    как в parallel.lineFight.
+
+    Args:
+        aim_velocity: Скорости целей
+        interceptor_velocity: Скорости перехватчиков
+        d0: Начальные расстояния
+        q0: Углы направления движения целей в градусах
+        d: Расстояния, при которых моделирование завершается
+        dt (float): Шаг по времени
+        max_steps (int): Максимальное количество шагов
+        count (int | None): Количество полетов, если все параметры скаляры
+
+    Returns:
+        BatchFlight: Результаты моделирования по каждой строке
+    """
+    count, (va, vi, d0, q0, d) = _rows(
+        count, aim_velocity, interceptor_velocity, d0, q0, d
+    )
+    aim_start = np.stack((d0, np.zeros(count)), axis=1)
+    interceptor_start = np.zeros((count, 2))
+    return _engage(
+        count,
+        va,
+        vi,
+        aim_start,
+        interceptor_start,
+        lambda t: pointsOnLine(t, va, q0, d0),
+        ParallelApproach(d),
+        dt,
+        max_steps,
+    )
+
+
+def batchParallelCircleFight(
+    aim_velocity=AIM_VELOCITY,
+    interceptor_velocity=INTERCEPTOR_VELOCITY,
+    d0=D0,
+    r=R,
+    center=(0, 0),
+    start=(0, 0),
+    d=150,
+    dt: float = DELTA_T,
+    max_steps: int = 10000,
+    count: int | None = None,
+) -> BatchFlight:
+    """
+    Моделирует N перехватов целей, движущихся по окружности, параллельным сближением.
+
+    Параметры такие же, как у batchCircleFight; d - расстояния, при которых
+    моделирование завершается (как в parallel.fight).
+
+    Returns:
+        BatchFlight: Результаты моделирования по каждой строке
+    """
+    count, (va, vi, d0, r, d) = _rows(
+        count, aim_velocity, interceptor_velocity, d0, r, d
+    )
+    center = np.broadcast_to(np.asarray(center, dtype=np.float64), (count, 2))
+    start = np.broadcast_to(np.asarray(start, dtype=np.float64), (count, 2))
+    aim_start = np.stack((d0, np.zeros(count)), axis=1)
+    interceptor_start = np.zeros((count, 2))
+    return _engage(
+        count,
+        va,
+        vi,
+        aim_start,
+        interceptor_start,
+        lambda t: pointsOnCircle(t, va, r, center, start),
+        ParallelApproach(d),
+        dt,
+        max_steps,
+        r,
+    )
+
+
+def batchGuidedLineFight(
+    law: GuidanceLaw,
+    aim_velocity=AIM_VELOCITY,
+    interceptor_velocity=INTERCEPTOR_VELOCITY,
+    d0=D0,
+    q0=Q0,
+    dt: float = DELTA_T,
+    max_steps: int = 10000,
+    count: int | None = None,
+) -> BatchFlight:
+    """
+    Моделирует N перехватов целей, движущихся по прямой, по любому закону наведения.
+
+    Args:
+        law (GuidanceLaw): Закон наведения (например, engine.ProportionalNavigation)
+        aim_velocity: Скорости целей
+        interceptor_velocity: Скорости перехватчиков
+        d0: Начальные расстояния
+        q0: Углы направления движения целей в градусах
+        dt (float): Шаг по времени
+        max_steps (int): Максимальное количество шагов
+        count (int | None): Количество полетов, если все параметры скаляры
+
+    Returns:
+        BatchFlight: Результаты моделирования по каждой строке
+    """
+    count, (va, vi, d0, q0) = _rows(count, aim_velocity, interceptor_velocity, d0, q0)
+    aim_start = np.stack((d0, np.zeros(count)), axis=1)
+    interceptor_start = np.zeros((count, 2))
+    return _engage(
+        count,
+        va,
+        vi,
+        aim_start,
+        interceptor_start,
+        lambda t: pointsOnLine(t, va, q0, d0),
+        law,
+        dt,
+        max_steps,
+    )
+
+
+def batchGuidedCircleFight(
+    law: GuidanceLaw,
+    aim_velocity=AIM_VELOCITY,
+    interceptor_velocity=INTERCEPTOR_VELOCITY,
+    d0=D0,
+    r=R,
+    center=(0, 0),
+    start=(0, 0),
+    dt: float = DELTA_T,
+    max_steps: int = 10000,
+    count: int | None = None,
+) -> BatchFlight:
+    """
+    Моделирует N перехватов целей, движущихся по окружности, по любому закону наведения.
+
+    Параметры такие же, как у batchCircleFight; law - закон наведения.
+
+    Returns:
+        BatchFlight: Результаты моделирования по каждой строке
+    """
+    count, (va, vi, d0, r) = _rows(count, aim_velocity, interceptor_velocity, d0, r)
+    center = np.broadcast_to(np.asarray(center, dtype=np.float64), (count, 2))
+    start = np.broadcast_to(np.asarray(start, dtype=np.float64), (count, 2))
+    aim_start = np.stack((d0, np.zeros(count)), axis=1)
+    interceptor_start = np.zeros((count, 2))
+    return _engage(
+        count,
+        va,
+        vi,
+        aim_start,
+        interceptor_start,
+        lambda t: pointsOnCircle(t, va, r, center, start),
+        law,
+        dt,
+        max_steps,
+        r,
+    )
+
+
+def batchGuidedFight(
+    law: GuidanceLaw,
+    target,
+    aim_start,
+    interceptor_start,
+    aim_velocity=AIM_VELOCITY,
+    interceptor_velocity=INTERCEPTOR_VELOCITY,
+    r=R,
+    dt: float = DELTA_T,
+    max_steps: int = 10000,
+    history: bool = True,
+) -> BatchFlight:
+    """
+    Моделирует N перехватов с произвольными начальными позициями и движением целей.
+
+    Args:
+        law (GuidanceLaw): Закон наведения
+        target: Функция t -> позиции целей (N, 2)
+        aim_start: Начальные позиции целей, (N, 2)
+        interceptor_start: Начальные позиции перехватчиков, (N, 2)
+        aim_velocity: Скорости целей
+        interceptor_velocity: Скорости перехватчиков
+        r: Радиусы окружностей движения целей (перегрузка при нулевом расстоянии)
+        dt (float): Шаг по времени
+        max_steps (int): Максимальное количество шагов
+        history (bool): Сохранять историю перегрузок, расстояний и углов
+
+    Returns:
+        BatchFlight: Результаты моделирования по каждой строке
+    """
+    aim_start = np.asarray(aim_start, dtype=np.float64).reshape(-1, 2)
+    interceptor_start = np.asarray(interceptor_start, dtype=np.float64).reshape(-1, 2)
+    count, (va, vi, r) = _rows(len(aim_start), aim_velocity, interceptor_velocity, r)
+    return _engage(
+        count,
+        va,
+        vi,
+        aim_start,
+        interceptor_start,
+        target,
+        law,
+        dt,
+        max_steps,
+        r,
+        history,
+    )
@@ -0,0 +1,375 @@
+import argparse
+from dataclasses import replace
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from time import perf_counter
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import parallel
+import targeting
+from shared import (
+    DEFAULT_CONFIG,
+    Point,
+    Role,
+    SimulationConfig,
+    angleBetween,
+    correctionAngle,
+    distanceBetween,
+    findQAngle,
+)
+from kinematics import PURSUIT, KinematicsKernel
+from termination import TerminationPolicy
+
+# Методы наведения: имя -> (функция моделирования, движется ли цель по окружности,
+# условие остановки как в main.py)
+ENGINES = {
+    "targeting.circleFight": (targeting.circleFight, True, 1),
+    "targeting.lineFight": (targeting.lineFight, False, 1),
+    "parallel.fight": (parallel.fight, True, 150),
+    "parallel.lineFight": (parallel.lineFight, False, 20),
+}
+
+# Масштабы задачи: (шаг времени, множитель начального расстояния и радиуса)
+SCALES = ((1.0, 1.0), (0.1, 1.0), (1.0, 4.0), (0.1, 4.0), (0.01, 1.0))
+
+# Отрисовка на каждом шаге медленная, поэтому измеряется только на этих масштабах
+DRAW_SCALES = ((1.0, 1.0), (0.1, 1.0))
+
+# Ограничение на случай, если условие остановки метода не сработает
+POLICY = TerminationPolicy(max_steps=200_000, miss_after=50)
+
+# Модули расчета, которые должны импортироваться без библиотек отрисовки
+# и интерполяции (HEAVY) - они загружаются только при построении графиков.
+# Сюда входят все модули проекта, кроме plotting и bench
+IMPORTS = (
+    "shared",
+    "termination",
+    "instrument",
+    "kinematics",
+    "engine",
+    "motion",
+    "targeting",
+    "parallel",
+    "analytic",
+    "adaptive",
+    "batch",
+    "storage",
+    "cache",
+    "sweep",
+    "envelope",
+    "surrogate",
+    "raid",
+    "planner",
+    "realtime",
+    "compact",
+    "resample",
+    "cli",
+    "main",
+)
+HEAVY = ("matplotlib", "scipy")
+
+DEFAULT_THRESHOLD = 0.10  # допустимое замедление относительно базовой линии
+
+
+def _config(dt: float, scale: float) -> SimulationConfig:
+    """Параметры моделирования для масштаба задачи."""
+    return replace(
+        DEFAULT_CONFIG,
+        d0=DEFAULT_CONFIG.d0 * scale,
+        r=DEFAULT_CONFIG.r * scale,
+        delta_t=dt,
+    )
+
+
+def runEngine(name: str, config: SimulationConfig, draw: bool = False) -> int:
+    """
+    Моделирует один перехват.
+
+    Args:
+        name (str): Метод наведения (ключ ENGINES)
+        config (SimulationConfig): Параметры моделирования
+        draw (bool): Отрисовывать ли каждый шаг
+
+    Returns:
+        int: Количество шагов
+    """
+    fight, on_circle, stop = ENGINES[name]
+    aim = Role(config.aim_velocity, [Point(config.d0, 0)], 0, 0)
+    interceptor = Role(config.interceptor_velocity, [Point(0, 0)], 0, 0)
+    args = (Point(0, 0), Point(0, 0), stop) if on_circle else (stop,)
+    flight = fight(
+        aim, interceptor, *args, headless=not draw, config=config, policy=POLICY
+    )
+    if draw:
+        plt.close("all")
+    return flight.steps
+
+
+def benchEngine(
+    name: str, dt: float, scale: float, draw: bool, repeat: int
+) -> dict[str, float]:
+    """
+    Измеряет время и пиковую память одного перехвата.
+
+    Время - лучшее из repeat запусков, память измеряется отдельным запуском
+    под tracemalloc, чтобы трассировка не искажала время.
+
+    Args:
+        name (str): Метод наведения (ключ ENGINES)
+        dt (float): Шаг времени
+        scale (float): Множитель начального расстояния и радиуса
+        draw (bool): Отрисовывать ли каждый шаг
+        repeat (int): Количество запусков
+
+    Returns:
+        dict: steps, seconds (время перехвата), steps_per_sec, peak_kb
+    """
+    config = _config(dt, scale)
+    best = float("inf")
+    steps = 0
+    for _ in range(repeat):
+        started = perf_counter()
+        steps = runEngine(name, config, draw)
+        best = min(best, perf_counter() - started)
+
+    tracemalloc.start()
+    runEngine(name, config, draw)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "steps": steps,
+        "seconds": best,
+        "steps_per_sec": steps / best if best > 0 else float("inf"),
+        "peak_kb": peak / 1024,
+    }
+
+
+def benchMicro(repeat: int) -> dict[str, dict[str, float]]:
+    """
+    Измеряет время вызова геометрических функций shared.py.
+
+    Args:
+        repeat (int): Количество серий измерений
+
+    Returns:
+        dict: Имя функции -> {"ns_per_call": лучшее время вызова в наносекундах}
+    """
+    aim = Role(DEFAULT_CONFIG.aim_velocity, [Point(2500, 0), Point(2500, 250)], 0, 0)
+    interceptor = Role(
+        DEFAULT_CONFIG.interceptor_velocity, [Point(0, 0), Point(320, 240)], 0, 0
+    )
+    p1, p2 = Point(0, 0), Point(2500, 250)
+    kernel = KinematicsKernel(aim, interceptor, PURSUIT)
+    cases = {
+        "distanceBetween": lambda: distanceBetween(p1, p2),
+        "angleBetween": lambda: angleBetween(p1, p2),
+        "correctionAngle": lambda: correctionAngle(aim, interceptor, 1),
+        "findQAngle": lambda: findQAngle(aim, interceptor),
+        "KinematicsKernel.update": lambda: kernel.update(aim, interceptor),
+    }
+    result = {}
+    for name, call in cases.items():
+        timer = timeit.Timer(call)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+        result[name] = {"ns_per_call": best * 1e9}
+    return result
+
+
+def benchImports(repeat: int) -> dict[str, dict]:
+    """
+    Измеряет время импорта модулей расчета в новом процессе интерпретатора.
+
+    Args:
+        repeat (int): Количество запусков
+
+    Returns:
+        dict: Имя модуля -> {"seconds": лучшее время импорта,
+            "heavy": загруженные при этом модули из HEAVY}
+    """
+    result = {}
+    for module in IMPORTS:
+        code = (
+            "import sys, time\n"
+            "started = time.perf_counter()\n"
+            f"import {module}\n"
+            "print(time.perf_counter() - started)\n"
+            f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))\n"
+        )
+        best = float("inf")
+        heavy = []
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+            ).stdout.splitlines()
+            best = min(best, float(output[0]))
+            heavy = [name for name in output[1].split(",") if name]
+        result[module] = {"seconds": best, "heavy": heavy}
+    return result
+
+
+def heavyImports(results: dict) -> list[tuple[str, list[str]]]:
+    """
+    Находит модули расчета, при импорте которых загружаются модули из HEAVY.
+
+    Args:
+        results (dict): Результаты runBenchmarks
+
+    Returns:
+        list: Пары (модуль, загруженные тяжелые модули)
+    """
+    return [
+        (module, row["heavy"])
+        for module, row in results.get("imports", {}).items()
+        if row["heavy"]
+    ]
+
+
+def runBenchmarks(repeat: int = 3, quick: bool = False) -> dict:
+    """
+    Запускает все измерения.
+
+    Args:
+        repeat (int): Количество запусков каждого измерения
+        quick (bool): Только базовый масштаб задачи
+
+    Returns:
+        dict: Результаты: сведения об окружении, engines, micro и imports
+    """
+    scales = SCALES[:1] if quick else SCALES
+    draw_scales = DRAW_SCALES[:1] if quick else DRAW_SCALES
+    engines = {}
+    for name in ENGINES:
+        for draw, grid in ((False, scales), (True, draw_scales)):
+            for dt, scale in grid:
+                key = (
+                    f"{name}/dt={dt:g}/range={scale:g}/{'draw' if draw else 'headless'}"
+                )
+                engines[key] = benchEngine(name, dt, scale, draw, repeat)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "matplotlib": matplotlib.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "engines": engines,
+        "micro": benchMicro(repeat),
+        "imports": benchImports(repeat),
+    }
+
+
+def compare(
+    current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD
+) -> list[tuple[str, float, float, float]]:
+    """
+    Сравнивает результаты с базовой линией.
+
+    Args:
+        current (dict): Текущие результаты runBenchmarks
+        baseline (dict): Базовая линия
+        threshold (float): Допустимое относительное замедление
+
+    Returns:
+        list: Регрессии (имя, базовое время, текущее время, отношение)
+    """
+    regressions = []
+    groups = (("engines", "seconds"), ("micro", "ns_per_call"), ("imports", "seconds"))
+    for group, metric in groups:
+        for name, old in baseline.get(group, {}).items():
+            new = current.get(group, {}).get(name)
+            if new is None or old[metric] <= 0:
+                continue
+            ratio = new[metric] / old[metric]
+            if ratio > 1 + threshold:
+                regressions.append((name, old[metric], new[metric], ratio))
+    return regressions
+
+
+def printReport(results: dict, baseline: dict | None = None):
+    """Выводит таблицу результатов и, если задана, отношение к базовой линии."""
+    print(f"{'перехват':<52} {'шаги':>7} {'мс':>10} {'шаг/с':>11} {'КБ':>9}")
+    for name, row in results["engines"].items():
+        line = (
+            f"{name:<52} {row['steps']:>7} {row['seconds'] * 1e3:>10.3f} "
+            f"{row['steps_per_sec']:>11.0f} {row['peak_kb']:>9.1f}"
+        )
+        if baseline and name in baseline.get("engines", {}):
+            line += f"  x{row['seconds'] / baseline['engines'][name]['seconds']:.2f}"
+        print(line)
+    print(f"\n{'функция':<52} {'нс/вызов':>10}")
+    for name, row in results["micro"].items():
+        line = f"{name:<52} {row['ns_per_call']:>10.1f}"
+        if baseline and name in baseline.get("micro", {}):
+            line += (
+                f"  x{row['ns_per_call'] / baseline['micro'][name]['ns_per_call']:.2f}"
+            )
+        print(line)
+    print(f"\n{'импорт':<52} {'мс':>10}")
+    for name, row in results.get("imports", {}).items():
+        line = f"{name:<52} {row['seconds'] * 1e3:>10.1f}"
+        if baseline and name in baseline.get("imports", {}):
+            line += f"  x{row['seconds'] / baseline['imports'][name]['seconds']:.2f}"
+        if row["heavy"]:
+            line += f"  загружает {', '.join(row['heavy'])}"
+        print(line)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Измерение производительности методов наведения"
+    )
+    parser.add_argument("--output", help="сохранить результаты в JSON")
+    parser.add_argument("--compare", help="сравнить с базовой линией из JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="допустимое замедление (0.1 = 10%%)",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--quick", action="store_true", help="только базовый масштаб задачи"
+    )
+    args = parser.parse_args(argv)
+
+    results = runBenchmarks(args.repeat, args.quick)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+    printReport(results, baseline)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    failed = False
+    for module, heavy in heavyImports(results):
+        print(f"РЕГРЕССИЯ импорт {module} загружает {', '.join(heavy)}")
+        failed = True
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        for name, old, new, ratio in regressions:
+            print(f"РЕГРЕССИЯ {name}: {old:.6g} -> {new:.6g} (x{ratio:.2f})")
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+import argparse
+from dataclasses import asdict
+import hashlib
+import json
+import os
+import shutil
+import sys
+import uuid
+
+from shared import DEFAULT_CONFIG, Flight, Point, Role, SimulationConfig
+from storage import readFlight, readMeta, writeFlight
+from sweep import METHODS
+from termination import DEFAULT_POLICY, TerminationPolicy
+
+# Версия расчетной части: увеличивается при любом изменении, влияющем на результаты
+# моделирования, чтобы записи, рассчитанные прежней версией, не использовались
+ENGINE_VERSION = "4"
+
+DEFAULT_ROOT = ".cache/flights"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # наибольший размер кэша (байт)
+
+
+def _role(role: Role) -> dict:
+    """Описание роли для ключа кэша."""
+    return {
+        "velocity": role.velocity,
+        "trajectory": role.trajectory.points.tolist(),
+        "indent": [role.x_indent, role.y_indent],
+    }
+
+
+def cacheKey(
+    method: str,
+    aim: Role,
+    interceptor: Role,
+    args: tuple,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    policy: TerminationPolicy | None = None,
+) -> str:
+    """
+    Вычисляет ключ кэша: SHA-256 от всех входных данных моделирования.
+
+    Args:
+        method (str): Метод наведения (ключ sweep.METHODS)
+        aim (Role): Объект цели до моделирования
+        interceptor (Role): Объект перехватчика до моделирования
+        args (tuple): Остальные аргументы функции моделирования (центр, начальная
+            фаза, точность угла коррекции или расстояние остановки)
+        config (SimulationConfig): Параметры моделирования
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+            (None - termination.DEFAULT_POLICY, в ключ входят ее условия)
+
+    Returns:
+        str: Шестнадцатеричная строка ключа
+    """
+    if policy is None:
+        policy = DEFAULT_POLICY
+    data = {
+        "engine": ENGINE_VERSION,
+        "method": method,
+        "aim": _role(aim),
+        "interceptor": _role(interceptor),
+        "args": [[a.x, a.y] if isinstance(a, Point) else a for a in args],
+        "config": asdict(config),
+        "policy": asdict(policy),
+    }
+    text = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _size(path: str) -> int:
+    """Суммарный размер файлов каталога."""
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+
+class ResultCache:
+    """
+    Класс для хранения результатов моделирования на диске по ключу cacheKey.
+
+    Каждая запись - каталог storage.py с полетом и траекториями. Время
+    последнего обращения - время изменения каталога; при превышении max_bytes
+    удаляются записи, к которым дольше всего не обращались (LRU).
+    """
+
+    def __init__(self, root: str = DEFAULT_ROOT, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def get(self, key: str) -> tuple[Flight, Role, Role] | None:
+        """
+        Загружает запись кэша.
+
+        Args:
+            key (str): Ключ cacheKey
+
+        Returns:
+            tuple | None: Полет (столбцы - списки) и траектории цели и
+                перехватчика (Trajectory) или None, если записи нет
+        """
+        path = self._path(key)
+        try:
+            flight, aim, interceptor = readFlight(path, mmap=False)
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+        os.utime(path)
+        for column in ("n", "d", "q", "phi", "t"):
+            setattr(flight, column, getattr(flight, column).tolist())
+        return flight, aim, interceptor
+
+    def put(
+        self,
+        key: str,
+        flight: Flight,
+        aim: Role,
+        interceptor: Role,
+        meta: dict | None = None,
+    ):
+        """
+        Сохраняет запись кэша и удаляет старые записи сверх max_bytes.
+
+        Запись сначала создается во временном каталоге и затем переименовывается,
+        поэтому параллельные процессы не видят недописанных записей.
+
+        Args:
+            key (str): Ключ cacheKey
+            flight (Flight): Данные о полете
+            aim (Role): Объект цели после моделирования
+            interceptor (Role): Объект перехватчика после моделирования
+            meta (dict | None): Дополнительные сведения (например, метод наведения)
+        """
+        temp = self._path(f".{key}.{uuid.uuid4().hex}")
+        writeFlight(temp, flight, aim, interceptor, meta)
+        try:
+            os.rename(temp, self._path(key))
+        except OSError:
+            # Запись уже создана другим процессом
+            shutil.rmtree(temp, ignore_errors=True)
+        self.evict()
+
+    def entries(self) -> list[tuple[str, float, int]]:
+        """
+        Список записей кэша.
+
+        Returns:
+            list: (ключ, время последнего обращения, размер в байтах) от давних к новым
+        """
+        result = []
+        for entry in os.scandir(self.root):
+            if entry.is_dir() and not entry.name.startswith("."):
+                result.append((entry.name, entry.stat().st_mtime, _size(entry.path)))
+        return sorted(result, key=lambda item: item[1])
+
+    def evict(self):
+        """Удаляет давно использованные записи, пока размер кэша больше max_bytes."""
+        entries = self.entries()
+        total = sum(size for _, _, size in entries)
+        for key, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(self._path(key), ignore_errors=True)
+            total -= size
+
+    def invalidate(self, key: str | None = None, method: str | None = None) -> int:
+        """
+        Удаляет записи кэша.
+
+        Args:
+            key (str | None): Удалить только запись с этим ключом
+            method (str | None): Удалить только записи этого метода наведения
+
+        Returns:
+            int: Количество удаленных записей
+        """
+        removed = 0
+        for name, _, _ in self.entries():
+            if key is not None and name != key:
+                continue
+            if method is not None:
+                try:
+                    if readMeta(self._path(name)).get("method") != method:
+                        continue
+                except FileNotFoundError:
+                    pass
+            shutil.rmtree(self._path(name), ignore_errors=True)
+            removed += 1
+        if key is None and method is None:
+            # Полная очистка сбрасывает и отметки построенных графиков
+            shutil.rmtree(os.path.join(self.root, ".plots"), ignore_errors=True)
+        return removed
+
+    def _stampPath(self, path: str) -> str:
+        name = hashlib.sha256(os.path.abspath(path).encode()).hexdigest()
+        return os.path.join(self.root, ".plots", name)
+
+    def isCurrent(self, path: str, stamp: str) -> bool:
+        """
+        Проверяет, построен ли файл path по данным с отметкой stamp.
+
+        Args:
+            path (str): Путь к графику
+            stamp (str): Отметка данных (например, ключ кэша полета)
+
+        Returns:
+            bool: True, если файл существует и построен по тем же данным
+        """
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(self._stampPath(path)) as file:
+                return file.read() == stamp
+        except FileNotFoundError:
+            return False
+
+    def markCurrent(self, path: str, stamp: str):
+        """
+        Запоминает, что файл path построен по данным с отметкой stamp.
+
+        Args:
+            path (str): Путь к графику
+            stamp (str): Отметка данных
+        """
+        stamp_path = self._stampPath(path)
+        os.makedirs(os.path.dirname(stamp_path), exist_ok=True)
+        with open(stamp_path, "w") as file:
+            file.write(stamp)
+
+
+def cachedFight(
+    cache: ResultCache | None,
+    method: str,
+    aim: Role,
+    interceptor: Role,
+    *args,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    policy: TerminationPolicy | None = None,
+) -> tuple[Flight, str]:
+    """
+    Моделирует перехват без отрисовки или берет результат из кэша.
+
+    Как и функции моделирования, дополняет траектории цели и перехватчика.
+
+    Args:
+        cache (ResultCache | None): Кэш (None - всегда моделировать)
+        method (str): Метод наведения (ключ sweep.METHODS)
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        args: Остальные аргументы функции моделирования
+        config (SimulationConfig): Параметры моделирования
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+
+    Returns:
+        tuple[Flight, str]: Данные о полете и ключ кэша
+    """
+    key = cacheKey(method, aim, interceptor, args, config, policy)
+    cached = cache.get(key) if cache is not None else None
+    if cached is not None:
+        flight, aim_trajectory, interceptor_trajectory = cached
+        for role, trajectory in (
+            (aim, aim_trajectory),
+            (interceptor, interceptor_trajectory),
+        ):
+            for x, y in trajectory.points[len(role.trajectory) :].tolist():
+                role.trajectory.appendXY(x, y)
+        return flight, key
+
+    fight, _ = METHODS[method]
+    flight = fight(aim, interceptor, *args, headless=True, config=config, policy=policy)
+    if cache is not None:
+        cache.put(key, flight, aim, interceptor, {"method": method})
+    return flight, key
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Кэш результатов моделирования")
+    parser.add_argument("--root", default=DEFAULT_ROOT, help="каталог кэша")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("info", help="список записей")
+    invalidate = commands.add_parser("invalidate", help="удалить записи")
+    invalidate.add_argument("--key", help="только запись с этим ключом")
+    invalidate.add_argument("--method", choices=sorted(METHODS))
+    args = parser.parse_args(argv)
+
+    cache = ResultCache(args.root)
+    if args.command == "info":
+        entries = cache.entries()
+        for key, _, size in entries:
+            print(f"{key}  {size / 1024:.1f} КБ")
+        print(f"Записей: {len(entries)}, {sum(s for _, _, s in entries) / 1024:.1f} КБ")
+    else:
+        removed = cache.invalidate(args.key, args.method)
+        print(f"Удалено записей: {removed}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
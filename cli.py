@@ -0,0 +1,286 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+import os
+import sys
+import tomllib
+from time import perf_counter
+
+import numpy as np
+
+from shared import (
+    DEFAULT_CONFIG,
+    Flight,
+    Point,
+    Role,
+    SimulationConfig,
+    saveFlightData,
+)
+from cache import DEFAULT_ROOT, ResultCache, cachedFight
+from sweep import METHODS
+from termination import TerminationPolicy
+
+
+@dataclass
+class Scenario:
+    """Класс для хранения описания одного сценария моделирования."""
+
+    name: str  # имя сценария
+    method: str  # метод наведения (ключ sweep.METHODS)
+    stop: float  # точность угла коррекции или расстояние остановки
+    aim: dict  # цель: velocity, position, indent
+    interceptor: dict  # перехватчик: velocity, position, indent
+    center: tuple = (0.0, 0.0)  # центр окружности движения цели
+    start: tuple = (0.0, 0.0)  # начальная фаза движения по окружности
+    trajectory_plot: str | None = None  # путь к графику траекторий
+    overload_plot: str | None = None  # путь к графику перегрузок
+    data: str | None = None  # путь к текстовому файлу с данными о полете
+    message: str | None = None  # сообщение о завершении ({steps}, {outcome})
+    zero_last_overload: bool = False  # обнулить последнюю перегрузку в данных
+    config: dict = field(default_factory=dict)  # поля SimulationConfig
+    policy: dict | None = None  # поля TerminationPolicy
+
+
+def loadScenarios(path: str) -> list[Scenario]:
+    """
+    Загружает сценарии из TOML-файла (массив таблиц [[scenario]]).
+
+    Args:
+        path (str): Путь к файлу
+
+    Returns:
+        list[Scenario]: Сценарии в порядке описания
+    """
+    with open(path, "rb") as file:
+        data = tomllib.load(file)
+    scenarios = [Scenario(**entry) for entry in data.get("scenario", [])]
+    for scenario in scenarios:
+        if scenario.method not in METHODS:
+            raise ValueError(
+                f"{scenario.name}: неизвестный метод наведения {scenario.method}"
+            )
+    return scenarios
+
+
+def _role(spec: dict, velocity: float, position: tuple) -> Role:
+    """Создает роль по описанию из сценария."""
+    x, y = spec.get("position", position)
+    x_indent, y_indent = spec.get("indent", (0, 0))
+    return Role(spec.get("velocity", velocity), [Point(x, y)], x_indent, y_indent)
+
+
+def simulate(
+    scenario: Scenario, cache: ResultCache | None = None
+) -> tuple[Flight, Role, Role, str]:
+    """
+    Моделирует перехват по сценарию без отрисовки или берет результат из кэша.
+
+    Args:
+        scenario (Scenario): Сценарий
+        cache (ResultCache | None): Кэш результатов
+
+    Returns:
+        tuple[Flight, Role, Role, str]: Данные о полете, цель, перехватчик и
+            ключ кэша
+    """
+    config: SimulationConfig = replace(DEFAULT_CONFIG, **scenario.config)
+    aim = _role(scenario.aim, config.aim_velocity, (config.d0, 0))
+    interceptor = _role(scenario.interceptor, config.interceptor_velocity, (0, 0))
+    policy = TerminationPolicy(**scenario.policy) if scenario.policy else None
+    _, on_circle = METHODS[scenario.method]
+    if on_circle:
+        args = (Point(*scenario.center), Point(*scenario.start), scenario.stop)
+    else:
+        args = (scenario.stop,)
+    flight, key = cachedFight(
+        cache,
+        scenario.method,
+        aim,
+        interceptor,
+        *args,
+        config=config,
+        policy=policy,
+    )
+    return flight, aim, interceptor, key
+
+
+def _savePlot(figure, path: str, x_label: str, y_label: str):
+    """Подписывает оси и сохраняет отдельный рисунок в файл."""
+    ax = figure.axes[0]
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    figure.savefig(path)
+
+
+def plotScenario(
+    scenario: Scenario,
+    flight: Flight,
+    aim: Role,
+    interceptor: Role,
+    key: str | None = None,
+    cache: ResultCache | None = None,
+):
+    """
+    Строит графики траекторий и перегрузок для сценария.
+
+    Каждый график - отдельный объект Figure, глобальное состояние pyplot не
+    используется, поэтому сценарии можно строить в разных процессах.
+    matplotlib и scipy загружаются при первом вызове. Если задан кэш, графики,
+    уже построенные по полету с тем же ключом, не перестраиваются.
+
+    Args:
+        scenario (Scenario): Сценарий
+        flight (Flight): Данные о полете
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        key (str | None): Ключ кэша полета
+        cache (ResultCache | None): Кэш результатов
+    """
+    stamp = f"{key}:{scenario.zero_last_overload}"
+    paths = [
+        path
+        for path in (scenario.trajectory_plot, scenario.overload_plot)
+        if path and not (cache and key and cache.isCurrent(path, stamp))
+    ]
+    if not paths:
+        return
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+    from matplotlib.figure import Figure
+
+    from plotting import drawEngagement
+
+    if scenario.trajectory_plot in paths:
+        figure = Figure()
+        drawEngagement(aim, interceptor, flight.steps, ax=figure.add_subplot())
+        _savePlot(figure, scenario.trajectory_plot, "x, М", "y, М")
+
+    if scenario.overload_plot in paths:
+        from resample import resample
+
+        t_dense = np.linspace(min(flight.t), max(flight.t), 300)
+        figure = Figure()
+        figure.add_subplot().plot(t_dense, resample(flight, t_dense))
+        _savePlot(figure, scenario.overload_plot, "время, сек", "перегрузка, G")
+
+    if cache and key:
+        for path in paths:
+            cache.markCurrent(path, stamp)
+
+
+def runScenario(
+    scenario: Scenario, plot: bool = True, cache: ResultCache | None = None
+) -> dict:
+    """
+    Моделирует сценарий, сохраняет данные и графики.
+
+    Args:
+        scenario (Scenario): Сценарий
+        plot (bool): Строить ли графики
+        cache (ResultCache | None): Кэш результатов
+
+    Returns:
+        dict: name, steps, outcome, seconds (время счета) и message
+    """
+    started = perf_counter()
+    flight, aim, interceptor, key = simulate(scenario, cache)
+    if scenario.zero_last_overload:
+        flight.n[-1] = 0
+    if scenario.data:
+        os.makedirs(os.path.dirname(scenario.data) or ".", exist_ok=True)
+        saveFlightData(scenario.data, flight)
+    if plot:
+        plotScenario(scenario, flight, aim, interceptor, key, cache)
+    outcome = flight.outcome.value if flight.outcome is not None else None
+    message = scenario.message or "{name}: {steps} шагов ({outcome})"
+    return {
+        "name": scenario.name,
+        "steps": flight.steps,
+        "outcome": outcome,
+        "seconds": perf_counter() - started,
+        "message": message.format(
+            name=scenario.name, steps=flight.steps, outcome=outcome
+        ),
+    }
+
+
+def runScenarios(
+    scenarios: list[Scenario],
+    jobs: int | None = None,
+    plot: bool = True,
+    cache: ResultCache | None = None,
+) -> list[dict]:
+    """
+    Выполняет сценарии в пуле процессов.
+
+    Сообщения выводятся по мере завершения сценариев (при jobs=1 - по порядку).
+
+    Args:
+        scenarios (list[Scenario]): Сценарии
+        jobs (int | None): Количество процессов (1 - без пула, по умолчанию все ядра)
+        plot (bool): Строить ли графики
+        cache (ResultCache | None): Кэш результатов
+
+    Returns:
+        list[dict]: Результаты runScenario в порядке сценариев
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs == 1 or len(scenarios) <= 1:
+        results = []
+        for scenario in scenarios:
+            results.append(runScenario(scenario, plot, cache))
+            print(results[-1]["message"])
+        return results
+
+    results = [None] * len(scenarios)
+    with ProcessPoolExecutor(max_workers=min(jobs, len(scenarios))) as pool:
+        futures = {
+            pool.submit(runScenario, scenario, plot, cache): i
+            for i, scenario in enumerate(scenarios)
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            print(result["message"])
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Моделирование перехвата по сценариям из TOML-файлов"
+    )
+    parser.add_argument(
+        "scenarios", nargs="+", help="TOML-файлы со сценариями [[scenario]]"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None, help="количество процессов"
+    )
+    parser.add_argument("--no-plot", action="store_true", help="не строить графики")
+    parser.add_argument(
+        "--only", action="append", help="выполнить только сценарии с этим именем"
+    )
+    parser.add_argument("--cache", default=DEFAULT_ROOT, help="каталог кэша")
+    parser.add_argument(
+        "--cache-size", type=float, default=256, help="наибольший размер кэша (МБ)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="не использовать кэш")
+    args = parser.parse_args(argv)
+
+    cache = None
+    if not args.no_cache:
+        cache = ResultCache(args.cache, int(args.cache_size * 1024 * 1024))
+    scenarios = [s for path in args.scenarios for s in loadScenarios(path)]
+    if args.only:
+        scenarios = [s for s in scenarios if s.name in args.only]
+    started = perf_counter()
+    runScenarios(scenarios, args.jobs, not args.no_plot, cache)
+    print(f"Сценариев: {len(scenarios)}, время: {perf_counter() - started:.2f} с")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,367 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from shared import Flight, Step
+from termination import Outcome
+
+# Политики прореживания истории полета
+EVERY = "every"  # каждый k-й шаг (и последний)
+ENVELOPE = "envelope"  # шаги с наименьшим и наибольшим значением в окне из k шагов
+SUMMARY = "summary"  # итоговая статистика, первый и последний шаги
+
+COLUMNS = ("n", "d", "q")  # сохраняемые столбцы шага
+
+
+@dataclass(frozen=True)
+class Decimation:
+    """Класс для хранения политики прореживания истории полета."""
+
+    policy: str = EVERY  # EVERY, ENVELOPE или SUMMARY
+    k: int = 1  # шаг прореживания (EVERY) или длина окна (ENVELOPE)
+    key: str = "n"  # столбец, по которому выбираются шаги окна (ENVELOPE)
+
+    def __post_init__(self):
+        if self.policy not in (EVERY, ENVELOPE, SUMMARY):
+            raise ValueError(f"неизвестная политика прореживания: {self.policy}")
+        if self.k < 1:
+            raise ValueError("шаг прореживания должен быть положительным")
+        if self.key not in COLUMNS:
+            raise ValueError(f"неизвестный столбец: {self.key}")
+
+
+@dataclass
+class ColumnSummary:
+    """Класс для хранения итоговой статистики столбца по всем шагам."""
+
+    min: float = np.inf  # наименьшее значение
+    max: float = -np.inf  # наибольшее значение
+    mean: float = 0.0  # среднее значение
+    first: float = np.nan  # значение на первом шаге
+    last: float = np.nan  # значение на последнем шаге
+
+
+@dataclass
+class CompactFlight:
+    """
+    Класс для компактного хранения данных о полете.
+
+    Столбцы хранятся массивами NumPy заданного типа (float32 или float64) только
+    для сохраненных шагов. Время при равномерном шаге не хранится и
+    вычисляется по номерам шагов. Свойства n, d, q, phi и t совпадают по
+    смыслу с полями Flight, поэтому объект можно передавать в построение
+    графиков (cli.plotScenario).
+    """
+
+    steps: int  # количество шагов
+    index: np.ndarray  # номера сохраненных шагов
+    columns: dict[str, np.ndarray]  # значения сохраненных шагов по столбцам
+    summary: dict[str, ColumnSummary]  # статистика по всем шагам
+    t0: float = 0.0  # время первого шага
+    dt: float | None = None  # шаг по времени (None, если время хранится явно)
+    times: np.ndarray | None = None  # время сохраненных шагов при неравномерном шаге
+    aim: np.ndarray | None = None  # позиции цели на сохраненных шагах, (шаги, 2)
+    interceptor: np.ndarray | None = None  # позиции перехватчика, (шаги, 2)
+    outcome: Outcome | None = None  # итог моделирования
+    decimation: Decimation = field(default_factory=Decimation)  # политика прореживания
+    # Кэш сплайнов столбцов по времени (resample.py)
+    splines: dict = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def n(self) -> np.ndarray:
+        """Перегрузки на сохраненных шагах."""
+        return self.columns["n"]
+
+    @property
+    def d(self) -> np.ndarray:
+        """Расстояния на сохраненных шагах."""
+        return self.columns["d"]
+
+    @property
+    def q(self) -> np.ndarray:
+        """Углы ракурса на сохраненных шагах."""
+        return self.columns["q"]
+
+    @property
+    def phi(self) -> np.ndarray:
+        """Углы визирования (не записываются генераторами шагов)."""
+        return np.empty(0, dtype=self.n.dtype)
+
+    @property
+    def t(self) -> np.ndarray:
+        """Временные метки сохраненных шагов."""
+        if self.times is not None:
+            return self.times
+        return self.t0 + self.index * self.dt
+
+    @property
+    def nbytes(self) -> int:
+        """Объем массивов полета в байтах."""
+        arrays = [self.index, *self.columns.values()]
+        arrays += [a for a in (self.times, self.aim, self.interceptor) if a is not None]
+        return sum(a.nbytes for a in arrays)
+
+    def toFlight(self) -> Flight:
+        """
+        Преобразует в Flight со списками значений сохраненных шагов.
+
+        Returns:
+            Flight: Данные о полете
+        """
+        return Flight(
+            self.n.tolist(),
+            self.steps,
+            self.d.tolist(),
+            self.q.tolist(),
+            [],
+            self.t.tolist(),
+            self.outcome,
+        )
+
+
+class CompactRecorder:
+    """
+    Класс для записи шагов моделирования в CompactFlight.
+
+    Записи принимаются по одной (append), поэтому в памяти хранятся только
+    шаги, оставшиеся после прореживания, и текущее окно.
+    """
+
+    def __init__(
+        self,
+        decimation: Decimation = Decimation(),
+        dtype=np.float32,
+        positions: bool = False,
+    ):
+        """
+        Args:
+            decimation (Decimation): Политика прореживания
+            dtype: Тип значений столбцов (np.float32 или np.float64)
+            positions (bool): Сохранять ли позиции цели и перехватчика
+        """
+        self.decimation = decimation
+        self.dtype = np.dtype(dtype)
+        self.positions = positions
+        self.kept: list[tuple[int, Step]] = []  # сохраненные шаги (номер, запись)
+        self.count = 0  # количество принятых шагов
+        self.t0 = 0.0  # время первого шага
+        self.t1 = None  # время второго шага (для шага по времени)
+        self._stats = {column: ColumnSummary() for column in COLUMNS}
+        self._sums = dict.fromkeys(COLUMNS, 0.0)
+        self._first = None  # первый шаг (номер, запись)
+        self._last = None  # последний шаг (номер, запись)
+        self._low = None  # шаг окна с наименьшим значением
+        self._high = None  # шаг окна с наибольшим значением
+
+    def append(self, record: Step):
+        """
+        Принимает запись очередного шага.
+
+        Args:
+            record (Step): Состояние перехвата на шаге
+        """
+        i = self.count
+        for column in COLUMNS:
+            value = getattr(record, column)
+            stats = self._stats[column]
+            if i == 0:
+                stats.first = value
+            stats.last = value
+            stats.min = min(stats.min, value)
+            stats.max = max(stats.max, value)
+            self._sums[column] += value
+        if i == 0:
+            self.t0 = record.t
+            self._first = (i, record)
+        elif i == 1:
+            self.t1 = record.t
+        self._last = (i, record)
+        self.count += 1
+
+        decimation = self.decimation
+        if decimation.policy == EVERY:
+            if i % decimation.k == 0:
+                self.kept.append(self._last)
+        elif decimation.policy == ENVELOPE:
+            value = getattr(record, decimation.key)
+            if self._low is None or value < getattr(self._low[1], decimation.key):
+                self._low = self._last
+            if self._high is None or value > getattr(self._high[1], decimation.key):
+                self._high = self._last
+            if self.count % decimation.k == 0:
+                self._closeWindow()
+
+    def _closeWindow(self):
+        """Сохраняет шаги с наименьшим и наибольшим значением текущего окна."""
+        if self._low is None:
+            return
+        window = {self._low[0]: self._low, self._high[0]: self._high}
+        self.kept.extend(window[i] for i in sorted(window))
+        self._low = self._high = None
+
+    def finish(self, outcome: Outcome | None = None) -> CompactFlight:
+        """
+        Завершает запись.
+
+        Args:
+            outcome (Outcome | None): Итог моделирования
+
+        Returns:
+            CompactFlight: Компактные данные о полете
+        """
+        policy = self.decimation.policy
+        if policy == EVERY and self.kept and self.kept[-1][0] != self._last[0]:
+            self.kept.append(self._last)
+        elif policy == ENVELOPE:
+            self._closeWindow()
+        elif policy == SUMMARY and self.count:
+            # Крайние шаги сохраняются, чтобы у полета была ось времени для графиков
+            self.kept = [self._first]
+            if self._last[0] != 0:
+                self.kept.append(self._last)
+
+        records = [record for _, record in self.kept]
+        index = np.array([i for i, _ in self.kept], dtype=np.int32)
+        columns = {
+            column: np.array(
+                [getattr(record, column) for record in records], dtype=self.dtype
+            )
+            for column in COLUMNS
+        }
+        summary = self._stats
+        for column in COLUMNS:
+            if self.count:
+                summary[column].mean = self._sums[column] / self.count
+        flight = CompactFlight(
+            steps=self.count,
+            index=index,
+            columns=columns,
+            summary=summary,
+            outcome=outcome,
+            decimation=self.decimation,
+        )
+        times = np.array([record.t for record in records], dtype=np.float64)
+        dt = self.t1 - self.t0 if self.t1 is not None else None
+        # Время не хранится, если шаги равномерны
+        if dt and np.allclose(times, self.t0 + index * dt, rtol=0, atol=abs(dt) * 1e-6):
+            flight.t0, flight.dt = self.t0, dt
+        else:
+            flight.times = times
+        if self.positions:
+            flight.aim = np.array(
+                [(record.aim_x, record.aim_y) for record in records], dtype=self.dtype
+            ).reshape(-1, 2)
+            flight.interceptor = np.array(
+                [(record.interceptor_x, record.interceptor_y) for record in records],
+                dtype=self.dtype,
+            ).reshape(-1, 2)
+        return flight
+
+
+def recordCompact(
+    steps,
+    decimation: Decimation = Decimation(),
+    dtype=np.float32,
+    positions: bool = False,
+) -> CompactFlight:
+    """
+    Собирает компактные данные о полете из генератора шагов.
+
+    Args:
+        steps: Генератор записей Step (например, targeting.lineFightSteps)
+        decimation (Decimation): Политика прореживания
+        dtype: Тип значений столбцов (np.float32 или np.float64)
+        positions (bool): Сохранять ли позиции цели и перехватчика
+
+    Returns:
+        CompactFlight: Компактные данные о полете (итог генератора в outcome)
+    """
+    recorder = CompactRecorder(decimation, dtype, positions)
+    while True:
+        try:
+            record = next(steps)
+        except StopIteration as stop:
+            return recorder.finish(stop.value)
+        recorder.append(record)
+
+
+def compactFlight(
+    flight: Flight, decimation: Decimation = Decimation(), dtype=np.float32
+) -> CompactFlight:
+    """
+    Преобразует Flight в компактное представление.
+
+    Args:
+        flight (Flight): Данные о полете
+        decimation (Decimation): Политика прореживания
+        dtype: Тип значений столбцов (np.float32 или np.float64)
+
+    Returns:
+        CompactFlight: Компактные данные о полете
+    """
+    recorder = CompactRecorder(decimation, dtype)
+    for t, d, q, n in zip(flight.t, flight.d, flight.q, flight.n):
+        recorder.append(Step(t, np.nan, np.nan, np.nan, np.nan, d, q, n))
+    return recorder.finish(flight.outcome)
+
+
+def saveCompact(path: str, flight: CompactFlight):
+    """
+    Сохраняет компактные данные о полете в файл .npz.
+
+    Args:
+        path (str): Путь к файлу
+        flight (CompactFlight): Компактные данные о полете
+    """
+    arrays = {"column_" + name: values for name, values in flight.columns.items()}
+    for name in COLUMNS:
+        stats = flight.summary[name]
+        arrays["summary_" + name] = np.array(
+            [stats.min, stats.max, stats.mean, stats.first, stats.last]
+        )
+    for name in ("times", "aim", "interceptor"):
+        if getattr(flight, name) is not None:
+            arrays[name] = getattr(flight, name)
+    decimation = flight.decimation
+    np.savez(
+        path,
+        steps=flight.steps,
+        index=flight.index,
+        t0=flight.t0,
+        dt=np.nan if flight.dt is None else flight.dt,
+        outcome="" if flight.outcome is None else flight.outcome.value,
+        decimation=np.array([decimation.policy, str(decimation.k), decimation.key]),
+        **arrays,
+    )
+
+
+def loadCompact(path: str) -> CompactFlight:
+    """
+    Загружает компактные данные о полете из файла .npz.
+
+    Args:
+        path (str): Путь к файлу
+
+    Returns:
+        CompactFlight: Компактные данные о полете
+    """
+    with np.load(path) as data:
+        policy, k, key = data["decimation"].tolist()
+        dt = float(data["dt"])
+        outcome = str(data["outcome"])
+        return CompactFlight(
+            steps=int(data["steps"]),
+            index=data["index"],
+            columns={name: data["column_" + name] for name in COLUMNS},
+            summary={
+                name: ColumnSummary(*data["summary_" + name].tolist())
+                for name in COLUMNS
+            },
+            t0=float(data["t0"]),
+            dt=None if np.isnan(dt) else dt,
+            times=data["times"] if "times" in data else None,
+            aim=data["aim"] if "aim" in data else None,
+            interceptor=data["interceptor"] if "interceptor" in data else None,
+            outcome=Outcome(outcome) if outcome else None,
+            decimation=Decimation(policy, int(k), key),
+        )
@@ -0,0 +1,292 @@
+from dataclasses import dataclass
+from math import atan2, cos, isnan, sin
+
+import numpy as np
+
+from shared import (
+    DEFAULT_CONFIG,
+    Flight,
+    Role,
+    SimulationConfig,
+    makeStep,
+    recordFlight,
+    windowRole,
+)
+from instrument import Instrumentation, instrumented
+from kinematics import G, PURSUIT, Kinematics, KinematicsKernel
+from termination import DEFAULT_POLICY, Outcome, TerminationPolicy
+
+
+class GuidanceLaw:
+    """
+    Базовый класс закона наведения для общего цикла моделирования.
+
+    Закон определяет движение перехватчика на шаге, необходимую перегрузку и
+    условия завершения. Один экземпляр используется для одного перехвата
+    (или одной пачки перехватов в batch.py): start вызывается перед первым
+    шагом и может сохранять постоянные величины перехвата.
+
+    Методы, которые используются и в пакетном моделировании, получают скаляры
+    или массивы формы (N,) и должны работать с обоими видами значений.
+    """
+
+    overload_law = PURSUIT  # закон перегрузки KinematicsKernel
+
+    def start(self, velocity, dt: float):
+        """
+        Подготавливает закон к перехвату.
+
+        Args:
+            velocity: Скорость перехватчика (скаляр или массив (N,))
+            dt (float): Шаг по времени
+        """
+
+    def move(
+        self,
+        aim: Role,
+        interceptor: Role,
+        t: float,
+        config: SimulationConfig,
+        state: Kinematics | None,
+    ):
+        """
+        Добавляет в траекторию перехватчика позицию после шага.
+
+        Args:
+            aim (Role): Объект цели (уже после шага)
+            interceptor (Role): Объект перехватчика
+            t (float): Текущее время
+            config (SimulationConfig): Параметры моделирования
+            state (Kinematics | None): Кинематика после предыдущего шага
+                (None на первом шаге)
+        """
+        raise NotImplementedError
+
+    def moveBatch(
+        self,
+        aim_prev: np.ndarray,
+        aim: np.ndarray,
+        interceptor: np.ndarray,
+        velocity: np.ndarray,
+        t: float,
+        dt: float,
+        state,
+    ) -> np.ndarray:
+        """
+        Построчный аналог move для N перехватов.
+
+        Args:
+            aim_prev (np.ndarray): Позиции целей до шага, (N, 2)
+            aim (np.ndarray): Позиции целей после шага, (N, 2)
+            interceptor (np.ndarray): Позиции перехватчиков до шага, (N, 2)
+            velocity (np.ndarray): Скорости перехватчиков, (N,)
+            t (float): Текущее время
+            dt (float): Шаг по времени
+            state (BatchKinematics | None): Кинематика после предыдущего шага
+
+        Returns:
+            np.ndarray: Позиции перехватчиков после шага, (N, 2)
+        """
+        raise NotImplementedError
+
+    def overload(self, state):
+        """Необходимая перегрузка по кинематике шага."""
+        return state.n
+
+    def capturedAtStart(self, distance):
+        """Завершен ли перехват до первого шага (по начальному расстоянию)."""
+        return False
+
+    def captured(self, state: Kinematics, distance: float) -> bool:
+        """
+        Проверяет перехват после шага.
+
+        Args:
+            state (Kinematics): Кинематика после шага
+            distance (float): Расстояние до цели в начале шага
+
+        Returns:
+            bool: True, если цель перехвачена
+        """
+        raise NotImplementedError
+
+    def capturedBatch(self, state, distance: np.ndarray) -> np.ndarray:
+        """Построчный аналог captured."""
+        return self.captured(state, distance)
+
+    def missed(self, state):
+        """Проверяет промах после шага (по умолчанию промах не определяется)."""
+        return False
+
+
+@dataclass
+class ProportionalNavigation(GuidanceLaw):
+    """
+    Пропорциональная навигация.
+
+    Скорость поворота вектора скорости перехватчика пропорциональна угловой
+    скорости линии визирования: dγ/dt = N * dλ/dt. На первом шаге перехватчик
+    направлен на цель. Необходимая перегрузка n = N * v * |dλ/dt| / g.
+    Перехват - расстояние после шага не больше перемещения перехватчика за
+    шаг, промах - расстояние начинает расти.
+    """
+
+    gain: float = 3.0  # навигационная постоянная N
+
+    def start(self, velocity, dt: float):
+        self._velocity = velocity
+        self._s = velocity * dt
+        self._dt = dt
+        self._heading = None
+
+    def move(
+        self,
+        aim: Role,
+        interceptor: Role,
+        t: float,
+        config: SimulationConfig,
+        state: Kinematics | None,
+    ):
+        current = interceptor.trajectory[-1]
+        if state is None:
+            target = aim.trajectory[-1]
+            self._heading = atan2(target.y - current.y, target.x - current.x)
+        else:
+            self._heading += self.gain * state.los_rate * self._dt
+        interceptor.trajectory.appendXY(
+            current.x + self._s * cos(self._heading),
+            current.y + self._s * sin(self._heading),
+        )
+
+    def moveBatch(
+        self,
+        aim_prev: np.ndarray,
+        aim: np.ndarray,
+        interceptor: np.ndarray,
+        velocity: np.ndarray,
+        t: float,
+        dt: float,
+        state,
+    ) -> np.ndarray:
+        if state is None:
+            vec = aim - interceptor
+            self._heading = np.arctan2(vec[:, 1], vec[:, 0])
+        else:
+            self._heading = self._heading + self.gain * state.los_rate * self._dt
+        step = np.stack((np.cos(self._heading), np.sin(self._heading)), axis=1)
+        return interceptor + step * self._s[:, None]
+
+    def overload(self, state):
+        return self.gain * self._velocity * abs(state.los_rate) / G
+
+    def captured(self, state, distance):
+        return state.d <= self._s
+
+    def missed(self, state):
+        return state.d_dot > 0
+
+
+def engagementSteps(
+    aim: Role,
+    interceptor: Role,
+    target,
+    law: GuidanceLaw,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    policy: TerminationPolicy | None = None,
+    stats: Instrumentation | None = None,
+):
+    """
+    Общий генератор шагов перехвата для любого движения цели и закона наведения.
+
+    Хранит только первую и две последние точки траекторий, поэтому занимает
+    постоянный объем памяти. Траектории переданных ролей не изменяются.
+    Если перегрузка на шаге не определена (NaN, например K < |sin q| при
+    параллельном сближении), перехват завершается промахом, как в batch.py.
+
+    Без policy действует termination.DEFAULT_POLICY: не больше 100 000 шагов
+    и промах после 50 шагов подряд с ростом расстояния. Раньше policy=None
+    означало отсутствие ограничений; теперь для этого нужно передать
+    TerminationPolicy() без условий.
+
+    Args:
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        target: Функция (aim, t), добавляющая позицию цели в момент t
+            (например, TargetMotion.updater())
+        law (GuidanceLaw): Закон наведения (новый экземпляр на каждый перехват)
+        config (SimulationConfig): Параметры моделирования
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+            (None - termination.DEFAULT_POLICY; TerminationPolicy() без
+            условий снимает ограничение)
+        stats (Instrumentation | None): Сбор времени и вызовов по фазам шага
+
+    Yields:
+        Step: Состояние перехвата на очередном шаге
+
+    Returns:
+        Outcome: Итог моделирования
+    """
+    aim = windowRole(aim)
+    interceptor = windowRole(interceptor)
+    t = config.delta_t  # начальное время
+    step: int = 0  # счетчик шагов
+    monitor = (policy if policy is not None else DEFAULT_POLICY).start()
+    kernel = KinematicsKernel(aim, interceptor, law.overload_law, config)
+    law.start(interceptor.velocity, config.delta_t)
+    update_aim, move = instrumented(stats, aim=target, interceptor=law.move)
+    kernel.instrument(stats)
+    if law.capturedAtStart(kernel.d):
+        return Outcome.CAPTURED
+
+    state = None
+    while True:
+        distance = kernel.d
+        update_aim(aim, t)
+        move(aim, interceptor, t, config, state)
+        state = kernel.update(aim, interceptor)
+
+        n = law.overload(state)
+        yield makeStep(t, aim, interceptor, distance, state.q, n)
+        step += 1
+        if law.captured(state, distance):
+            return Outcome.CAPTURED
+        if law.missed(state) or isnan(n):
+            return Outcome.MISSED
+        outcome = monitor.check(step, t, state.d)
+        if outcome is not None:
+            return outcome
+        t += config.delta_t
+
+
+def fight(
+    aim: Role,
+    interceptor: Role,
+    target,
+    law: GuidanceLaw,
+    headless: bool = False,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    writer=None,
+    policy: TerminationPolicy | None = None,
+    stats: Instrumentation | None = None,
+) -> Flight:
+    """
+    Моделирует перехват по заданному движению цели и закону наведения.
+
+    Args:
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        target: Функция (aim, t), добавляющая позицию цели в момент t
+        law (GuidanceLaw): Закон наведения
+        headless (bool): Только записывать состояние, без отрисовки на каждом шаге
+        config (SimulationConfig): Параметры моделирования
+        writer (FlightWriter | None): Потоковая запись шагов в архив (storage.py)
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+        stats (Instrumentation | None): Сбор времени и вызовов по фазам шага,
+            результат доступен в flight.stats
+
+    Returns:
+        Flight: Объект с данными о полете (траектория, перегрузки, расстояния и т.д.)
+    """
+    flight = Flight([], 0, [], [], [], [])
+    steps = engagementSteps(aim, interceptor, target, law, config, policy, stats)
+    return recordFlight(steps, aim, interceptor, flight, headless, writer, stats)
@@ -0,0 +1,296 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import os
+import sys
+
+import numpy as np
+
+from batch import batchLineFight, batchParallelLineFight
+from shared import AIM_VELOCITY, DELTA_T, INTERCEPTOR_VELOCITY
+
+# Методы наведения для цели, движущейся по прямой: имя -> (функция пакетного
+# моделирования, условие остановки по умолчанию как в main.py)
+METHODS = {
+    "line": (batchLineFight, 1),
+    "parallel_line": (batchParallelLineFight, 20),
+}
+
+# Значения, которые можно вывести на тепловую карту
+VALUES = {
+    "capture_time": "время перехвата, с",
+    "peak_overload": "пиковая перегрузка, G",
+    "steps": "количество шагов",
+}
+
+
+@dataclass
+class Envelope:
+    """
+    Класс для хранения карты зоны перехвата.
+
+    Массивы результатов имеют форму (ratio, d0, q0). Для ячеек без
+    перехвата capture_time и peak_overload равны NaN.
+    """
+
+    method: str  # метод наведения
+    d0: np.ndarray  # начальные расстояния (м)
+    q0: np.ndarray  # углы направления движения цели (градусы)
+    ratio: np.ndarray  # отношения скорости перехватчика к скорости цели
+    aim_velocity: float  # скорость цели (м / с)
+    captured: np.ndarray  # перехвачена ли цель
+    capture_time: np.ndarray  # время перехвата (с)
+    peak_overload: np.ndarray  # пиковая необходимая перегрузка
+    steps: np.ndarray  # количество шагов
+
+
+def evaluateCells(
+    method: str,
+    aim_velocity,
+    interceptor_velocity,
+    d0,
+    q0,
+    stop,
+    dt: float = DELTA_T,
+    max_steps: int = 10000,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Моделирует набор ячеек одним пакетом.
+
+    Args:
+        method (str): Метод наведения: line или parallel_line
+        aim_velocity: Скорости целей
+        interceptor_velocity: Скорости перехватчиков
+        d0: Начальные расстояния
+        q0: Углы направления движения цели в градусах
+        stop: Условие остановки
+        dt (float): Шаг по времени
+        max_steps (int): Максимальное количество шагов
+
+    Returns:
+        tuple: Перехвачена ли цель, время перехвата, пиковая перегрузка (NaN без
+            перехвата) и количество шагов
+    """
+    fight, _ = METHODS[method]
+    result = fight(
+        aim_velocity, interceptor_velocity, d0, q0, stop, dt=dt, max_steps=max_steps
+    )
+    steps = result.steps
+    last = np.maximum(steps - 1, 0)
+    capture_time = np.where(result.captured, result.t[last], np.nan)
+    with np.errstate(invalid="ignore"):
+        peak = np.where(
+            result.captured & (steps > 0),
+            np.nanmax(np.where(np.isnan(result.n), -np.inf, result.n), axis=1),
+            np.nan,
+        )
+    return result.captured, capture_time, peak, steps
+
+
+def _evaluateBlock(args) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Моделирует блок ячеек одним пакетом (точка входа рабочего процесса)."""
+    return evaluateCells(*args)
+
+
+def envelopeMap(
+    method: str,
+    d0,
+    q0,
+    ratio=(INTERCEPTOR_VELOCITY / AIM_VELOCITY,),
+    aim_velocity: float = AIM_VELOCITY,
+    stop=None,
+    dt: float = DELTA_T,
+    max_steps: int = 10000,
+    jobs: int | None = None,
+    block: int = 4096,
+) -> Envelope:
+    """
+    Строит карту зоны перехвата на сетке D0 x Q0 x отношение скоростей.
+
+    Ячейки сетки моделируются построчно на массивах (batch.py) блоками по
+    block ячеек, блоки распределяются по процессам.
+
+    Args:
+        method (str): Метод наведения: line или parallel_line
+        d0: Начальные расстояния
+        q0: Углы направления движения цели в градусах
+        ratio: Отношения скорости перехватчика к скорости цели
+        aim_velocity (float): Скорость цели
+        stop: Условие остановки (по умолчанию как в main.py)
+        dt (float): Шаг по времени
+        max_steps (int): Максимальное количество шагов
+        jobs (int | None): Количество процессов (1 - без пула, по умолчанию все ядра)
+        block (int): Количество ячеек в одном блоке
+
+    Returns:
+        Envelope: Карта зоны перехвата
+    """
+    if method not in METHODS:
+        raise ValueError(f"неизвестный метод наведения: {method}")
+    if stop is None:
+        stop = METHODS[method][1]
+    d0 = np.atleast_1d(np.asarray(d0, dtype=np.float64))
+    q0 = np.atleast_1d(np.asarray(q0, dtype=np.float64))
+    ratio = np.atleast_1d(np.asarray(ratio, dtype=np.float64))
+    shape = (len(ratio), len(d0), len(q0))
+    grid_ratio, grid_d0, grid_q0 = (
+        axis.ravel() for axis in np.meshgrid(ratio, d0, q0, indexing="ij")
+    )
+
+    tasks = [
+        (
+            method,
+            aim_velocity,
+            aim_velocity * grid_ratio[i : i + block],
+            grid_d0[i : i + block],
+            grid_q0[i : i + block],
+            stop,
+            dt,
+            max_steps,
+        )
+        for i in range(0, grid_d0.size, block)
+    ]
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs == 1 or len(tasks) <= 1:
+        parts = [_evaluateBlock(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            parts = list(pool.map(_evaluateBlock, tasks))
+
+    captured, capture_time, peak, steps = (
+        np.concatenate(column).reshape(shape) for column in zip(*parts)
+    )
+    return Envelope(
+        method, d0, q0, ratio, aim_velocity, captured, capture_time, peak, steps
+    )
+
+
+def saveEnvelope(path: str, envelope: Envelope, **extra):
+    """
+    Сохраняет карту зоны перехвата в файл .npz.
+
+    Args:
+        path (str): Путь к файлу
+        envelope (Envelope): Карта зоны перехвата
+        **extra: Дополнительные массивы файла (loadEnvelope их пропускает)
+    """
+    np.savez(
+        path,
+        method=envelope.method,
+        d0=envelope.d0,
+        q0=envelope.q0,
+        ratio=envelope.ratio,
+        aim_velocity=envelope.aim_velocity,
+        captured=envelope.captured,
+        capture_time=envelope.capture_time,
+        peak_overload=envelope.peak_overload,
+        steps=envelope.steps,
+        **extra,
+    )
+
+
+def loadEnvelope(path: str) -> Envelope:
+    """
+    Загружает карту зоны перехвата из файла .npz.
+
+    Args:
+        path (str): Путь к файлу
+
+    Returns:
+        Envelope: Карта зоны перехвата
+    """
+    with np.load(path) as data:
+        return Envelope(
+            str(data["method"]),
+            data["d0"],
+            data["q0"],
+            data["ratio"],
+            float(data["aim_velocity"]),
+            data["captured"],
+            data["capture_time"],
+            data["peak_overload"],
+            data["steps"],
+        )
+
+
+def plotEnvelope(
+    envelope: Envelope, path: str, value: str = "capture_time", ratio_index: int = 0
+):
+    """
+    Строит тепловую карту значения по сетке D0 x Q0 для одного отношения скоростей.
+
+    Ячейки без перехвата не закрашиваются.
+
+    Args:
+        envelope (Envelope): Карта зоны перехвата
+        path (str): Путь к файлу рисунка
+        value (str): Значение: capture_time, peak_overload или steps
+        ratio_index (int): Индекс отношения скоростей
+    """
+    from matplotlib.figure import Figure
+
+    data = np.asarray(getattr(envelope, value)[ratio_index], dtype=np.float64)
+    data = np.ma.masked_where(~envelope.captured[ratio_index], data)
+    figure = Figure()
+    ax = figure.add_subplot()
+    mesh = ax.pcolormesh(envelope.q0, envelope.d0, data, shading="nearest")
+    figure.colorbar(mesh, ax=ax, label=VALUES[value])
+    ax.set_xlabel("Q0, градусы")
+    ax.set_ylabel("D0, М")
+    ax.set_title(
+        f"{envelope.method}: v перехватчика / v цели = "
+        f"{envelope.ratio[ratio_index]:g}"
+    )
+    figure.savefig(path)
+
+
+def _axis(text: str) -> np.ndarray:
+    """Разбирает ось сетки: 'start:stop:count' или список через запятую."""
+    if ":" in text:
+        start, stop, count = text.split(":")
+        return np.linspace(float(start), float(stop), int(count))
+    return np.array([float(value) for value in text.split(",")])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Карта зоны перехвата D0 x Q0")
+    parser.add_argument("--method", choices=sorted(METHODS), default="line")
+    parser.add_argument("--d0", type=_axis, default=_axis("500:5000:46"))
+    parser.add_argument("--q0", type=_axis, default=_axis("0:180:37"))
+    parser.add_argument(
+        "--ratio", type=_axis, default=_axis(str(INTERCEPTOR_VELOCITY / AIM_VELOCITY))
+    )
+    parser.add_argument("--aim-velocity", type=float, default=AIM_VELOCITY)
+    parser.add_argument("--dt", type=float, default=DELTA_T)
+    parser.add_argument("--max-steps", type=int, default=10000)
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--output", default="envelope.npz", help="файл .npz")
+    parser.add_argument("--plot", help="файл тепловой карты (по одной на отношение)")
+    parser.add_argument("--value", choices=sorted(VALUES), default="capture_time")
+    args = parser.parse_args(argv)
+
+    envelope = envelopeMap(
+        args.method,
+        args.d0,
+        args.q0,
+        args.ratio,
+        args.aim_velocity,
+        dt=args.dt,
+        max_steps=args.max_steps,
+        jobs=args.jobs,
+    )
+    saveEnvelope(args.output, envelope)
+    if args.plot:
+        root, ext = os.path.splitext(args.plot)
+        for i in range(len(envelope.ratio)):
+            path = args.plot if len(envelope.ratio) == 1 else f"{root}_{i}{ext}"
+            plotEnvelope(envelope, path, args.value, i)
+    print(
+        f"Ячеек: {envelope.captured.size}, с перехватом: {int(envelope.captured.sum())}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from functools import wraps
+from time import perf_counter
+
+
+@dataclass
+class PhaseStats:
+    """Класс для хранения накопленной статистики одной фазы шага."""
+
+    calls: int = 0  # количество вызовов
+    seconds: float = 0.0  # суммарное время (с)
+
+
+class PhaseHook:
+    """
+    Базовый класс подписчика на вызовы фаз (для внешних профилировщиков и счетчиков).
+
+    Методы вызываются до и после каждого вызова фазы; по умолчанию ничего не делают.
+    """
+
+    def enter(self, phase: str):
+        """Вызывается перед фазой phase."""
+
+    def exit(self, phase: str, seconds: float):
+        """Вызывается после фазы phase, seconds - время ее выполнения."""
+
+
+class Instrumentation:
+    """
+    Класс для сбора времени и количества вызовов по фазам шага моделирования.
+
+    Фазы: aim (движение цели), interceptor (движение перехватчика), части шага
+    ядра kinematics.py - distance (расстояние и линия визирования), correction
+    (угол коррекции), q_angle (угол ракурса), overload (перегрузка), - и draw
+    (отрисовка).
+    Передается в функции моделирования параметром stats и возвращается в
+    flight.stats.
+    """
+
+    def __init__(self, hooks: list[PhaseHook] | None = None):
+        self.phases: dict[str, PhaseStats] = {}
+        self.hooks = list(hooks or [])
+
+    def wrap(self, phase: str, func):
+        """
+        Оборачивает функцию фазы для учета времени и количества вызовов.
+
+        Подписчики берутся на момент вызова wrap.
+
+        Args:
+            phase (str): Имя фазы
+            func: Функция фазы
+
+        Returns:
+            Функция с той же сигнатурой
+        """
+        record = self.phases.setdefault(phase, PhaseStats())
+        hooks = tuple(self.hooks)
+
+        @wraps(func)
+        def timed(*args, **kwargs):
+            for hook in hooks:
+                hook.enter(phase)
+            started = perf_counter()
+            result = func(*args, **kwargs)
+            elapsed = perf_counter() - started
+            record.calls += 1
+            record.seconds += elapsed
+            for hook in hooks:
+                hook.exit(phase, elapsed)
+            return result
+
+        return timed
+
+    @property
+    def total(self) -> float:
+        """Суммарное время всех фаз (с)."""
+        return sum(record.seconds for record in self.phases.values())
+
+    def report(self) -> str:
+        """
+        Формирует таблицу статистики по фазам.
+
+        Returns:
+            str: Фаза, количество вызовов, суммарное время, среднее время вызова и доля
+        """
+        total = self.total or 1.0
+        lines = [f"{'фаза':<12} {'вызовы':>8} {'мс':>10} {'мкс/вызов':>10} {'%':>6}"]
+        for phase, record in self.phases.items():
+            mean = record.seconds / record.calls * 1e6 if record.calls else 0.0
+            lines.append(
+                f"{phase:<12} {record.calls:>8} {record.seconds * 1e3:>10.3f} "
+                f"{mean:>10.2f} {record.seconds / total * 100:>6.1f}"
+            )
+        return "\n".join(lines)
+
+
+def instrumented(stats: Instrumentation | None, **phases) -> tuple:
+    """
+    Возвращает функции фаз, обернутые для учета, или исходные функции.
+
+    Вызывается один раз перед циклом моделирования: при stats=None цикл
+    вызывает исходные функции и не несет дополнительных затрат.
+
+    Args:
+        stats (Instrumentation | None): Сборщик статистики
+        phases: Имя фазы -> функция
+
+    Returns:
+        tuple: Функции в порядке перечисления фаз
+    """
+    if stats is None:
+        return tuple(phases.values())
+    return tuple(stats.wrap(phase, func) for phase, func in phases.items())
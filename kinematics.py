@@ -0,0 +1,297 @@
+from dataclasses import dataclass
+from math import acos, atan2, cos, inf, nan, pi, sin, sqrt
+
+import numpy as np
+
+from instrument import Instrumentation, instrumented
+from shared import DEFAULT_CONFIG, Point, Role, SimulationConfig
+
+G = 9.8  # ускорение свободного падения (м / с^2)
+
+# Законы расчета необходимой перегрузки
+PURSUIT = "pursuit"  # метод погони
+PARALLEL = "parallel"  # параллельное сближение
+
+
+@dataclass(slots=True)
+class Kinematics:
+    """Класс для хранения кинематики перехвата после одного шага моделирования."""
+
+    d: float  # расстояние до цели
+    d_dot: float  # скорость изменения расстояния (м / с)
+    los: float  # угол линии визирования относительно оси x (рад)
+    los_rate: float  # угловая скорость линии визирования (рад / с)
+    correction: float  # угол коррекции (рад), -1 при ошибке
+    q: float  # угол ракурса
+    n: float  # необходимая перегрузка (NaN, если сближение невозможно)
+
+
+class KinematicsKernel:
+    """
+    Класс для расчета кинематики перехвата за один проход на каждом шаге.
+
+    Величины, не меняющиеся за время перехвата (начальный вектор визирования и
+    его длина, скорости, отношение скоростей), вычисляются один раз при
+    создании. На шаге расстояние, угол коррекции, угол ракурса и перегрузка
+    считаются по общим разностям координат; расстояние после шага сохраняется
+    и служит расстоянием в начале следующего шага.
+
+    Формулы совпадают с shared.correctionAngle и shared.findQAngle; перегрузка
+    погони считается по расстоянию после шага (как прежняя
+    targeting.overloadCircleTargeting), параллельного сближения - по
+    отношению скоростей K и углу ракурса.
+    """
+
+    def __init__(
+        self,
+        aim: Role,
+        interceptor: Role,
+        law: str = PURSUIT,
+        config: SimulationConfig = DEFAULT_CONFIG,
+    ):
+        """
+        Args:
+            aim (Role): Объект цели (первая точка траектории - начальная позиция)
+            interceptor (Role): Объект перехватчика
+            law (str): Закон перегрузки: PURSUIT или PARALLEL
+            config (SimulationConfig): Параметры моделирования
+        """
+        if law not in (PURSUIT, PARALLEL):
+            raise ValueError(f"неизвестный закон перегрузки: {law}")
+        aim0 = aim.trajectory[0]
+        inter0 = interceptor.trajectory[0]
+        aim_last = aim.trajectory[-1]
+        inter_last = interceptor.trajectory[-1]
+        # Начальный вектор визирования (как в shared.makeVector)
+        self.d0_x = aim0.x - inter0.x
+        self.d0_y = aim0.y - inter0.x
+        self.d0_len = sqrt(self.d0_x**2 + self.d0_y**2)
+        self.law = law
+        self.dt = config.delta_t
+        self.vv = interceptor.velocity * abs(aim.velocity)
+        self.n_zero = interceptor.velocity**2 / (G * config.r)
+        self.K = interceptor.velocity / aim.velocity
+        dx = aim_last.x - inter_last.x
+        dy = aim_last.y - inter_last.y
+        self.d = sqrt(dx**2 + dy**2)  # текущее расстояние до цели
+        self.los = atan2(dy, dx)  # текущий угол линии визирования
+
+    def update(self, aim: Role, interceptor: Role) -> Kinematics:
+        """
+        Вычисляет кинематику по двум последним точкам траекторий.
+
+        Args:
+            aim (Role): Объект цели после шага
+            interceptor (Role): Объект перехватчика после шага
+
+        Returns:
+            Kinematics: Кинематика перехвата после шага
+        """
+        aim_prev = aim.trajectory[-2]
+        aim_cur = aim.trajectory[-1]
+        inter_prev = interceptor.trajectory[-2]
+        inter_cur = interceptor.trajectory[-1]
+        d, d_dot, los, los_rate = self._distance(aim_cur, inter_cur)
+        correction = self._correction(aim_cur, inter_prev, inter_cur)
+        q = self._qAngle(aim_prev, aim_cur)
+        n = self._overload(q, d)
+        return Kinematics(d, d_dot, los, los_rate, correction, q, n)
+
+    def instrument(self, stats: Instrumentation | None):
+        """
+        Включает учет времени частей шага: distance, correction, q_angle и overload.
+
+        Части подменяются обернутыми на этом экземпляре, поэтому без stats
+        update выполняется без дополнительных затрат.
+
+        Args:
+            stats (Instrumentation | None): Сборщик статистики
+        """
+        (
+            self._distance,
+            self._correction,
+            self._qAngle,
+            self._overload,
+        ) = instrumented(
+            stats,
+            distance=self._distance,
+            correction=self._correction,
+            q_angle=self._qAngle,
+            overload=self._overload,
+        )
+
+    def _distance(self, aim_cur: Point, inter_cur: Point) -> tuple:
+        """Расстояние и линия визирования после шага и скорости их изменения."""
+        dx = aim_cur.x - inter_cur.x
+        dy = aim_cur.y - inter_cur.y
+        d = sqrt(dx**2 + dy**2)
+        los = atan2(dy, dx)
+        d_dot = (d - self.d) / self.dt
+        los_rate = (los - self.los + pi) % (2 * pi) - pi
+        los_rate /= self.dt
+        self.d = d
+        self.los = los
+        return d, d_dot, los, los_rate
+
+    def _correction(self, aim_cur: Point, inter_prev: Point, inter_cur: Point):
+        """
+        Угол коррекции между направлением на цель из предыдущей позиции
+        перехватчика и его перемещением за шаг (-1 при ошибке).
+        """
+        d_vec_x = aim_cur.x - inter_prev.x
+        d_vec_y = aim_cur.y - inter_prev.y
+        inter_vec_x = inter_cur.x - inter_prev.x
+        inter_vec_y = inter_cur.y - inter_prev.y
+        d_vec_len = sqrt(d_vec_x**2 + d_vec_y**2)
+        inter_vec_len = sqrt(inter_vec_x**2 + inter_vec_y**2)
+        try:
+            cos_corr = (d_vec_x * inter_vec_x + d_vec_y * inter_vec_y) / (
+                d_vec_len * inter_vec_len
+            )
+        except ZeroDivisionError:
+            return -1.0
+        if -1 <= cos_corr <= 1:
+            return acos(cos_corr)
+        return -1.0
+
+    def _qAngle(self, aim_prev: Point, aim_cur: Point) -> float:
+        """Угол ракурса между начальным вектором визирования и перемещением цели."""
+        move_x = aim_cur.x - aim_prev.x
+        move_y = aim_cur.y - aim_prev.x
+        move_len = sqrt(move_x**2 + move_y**2)
+        try:
+            cos_q = (self.d0_x * move_x + self.d0_y * move_y) / (self.d0_len * move_len)
+        except ZeroDivisionError:
+            cos_q = 0
+        return acos(cos_q)
+
+    def _overload(self, q: float, d: float) -> float:
+        """Необходимая перегрузка (NaN, если сближение невозможно)."""
+        if self.law == PURSUIT:
+            try:
+                return (self.vv * sin(q * pi / 180)) / (G * d)
+            except ZeroDivisionError:
+                return self.n_zero
+        radicand = self.K**2 - sin(q) ** 2
+        if radicand > 0:
+            return abs((self.K * cos(q)) / sqrt(radicand))
+        # Как в BatchKinematicsKernel: при K < |sin q| сближение
+        # невозможно и перегрузка не определена
+        return nan if radicand < 0 else inf
+
+
+@dataclass
+class BatchKinematics:
+    """Класс для хранения кинематики N перехватов после одного шага (массивы (N,))."""
+
+    d: np.ndarray  # расстояния до целей
+    d_dot: np.ndarray  # скорости изменения расстояний
+    los: np.ndarray  # углы линии визирования
+    los_rate: np.ndarray  # угловые скорости линии визирования
+    correction: np.ndarray  # углы коррекции, -1 при ошибке
+    q: np.ndarray  # углы ракурса
+    n: np.ndarray  # необходимые перегрузки (NaN, если сближение невозможно)
+
+
+def _norm(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Длины векторов по массивам координат."""
+    return np.sqrt(x**2 + y**2)
+
+
+class BatchKinematicsKernel:
+    """
+    Построчный аналог KinematicsKernel для N перехватов, моделируемых синхронно.
+
+    Позиции передаются массивами формы (N, 2).
+    """
+
+    def __init__(
+        self,
+        aim_start: np.ndarray,
+        interceptor_start: np.ndarray,
+        aim_velocity: np.ndarray,
+        interceptor_velocity: np.ndarray,
+        law: str = PURSUIT,
+        dt: float = DEFAULT_CONFIG.delta_t,
+        r=DEFAULT_CONFIG.r,
+    ):
+        """
+        Args:
+            aim_start (np.ndarray): Начальные позиции целей, (N, 2)
+            interceptor_start (np.ndarray): Начальные позиции перехватчиков, (N, 2)
+            aim_velocity (np.ndarray): Скорости целей, (N,)
+            interceptor_velocity (np.ndarray): Скорости перехватчиков, (N,)
+            law (str): Закон перегрузки: PURSUIT или PARALLEL
+            dt (float): Шаг по времени
+            r: Радиусы окружностей движения целей (перегрузка при нулевом
+                расстоянии в методе погони), скаляр или (N,)
+        """
+        if law not in (PURSUIT, PARALLEL):
+            raise ValueError(f"неизвестный закон перегрузки: {law}")
+        self.d0_x = aim_start[:, 0] - interceptor_start[:, 0]
+        self.d0_y = aim_start[:, 1] - interceptor_start[:, 0]
+        self.d0_len = _norm(self.d0_x, self.d0_y)
+        self.law = law
+        self.dt = dt
+        self.vv = interceptor_velocity * np.abs(aim_velocity)
+        self.n_zero = interceptor_velocity**2 / (G * np.asarray(r, dtype=np.float64))
+        self.K = interceptor_velocity / aim_velocity
+        dx = aim_start[:, 0] - interceptor_start[:, 0]
+        dy = aim_start[:, 1] - interceptor_start[:, 1]
+        self.d = _norm(dx, dy)
+        self.los = np.arctan2(dy, dx)
+
+    def update(
+        self,
+        aim_prev: np.ndarray,
+        aim: np.ndarray,
+        interceptor_prev: np.ndarray,
+        interceptor: np.ndarray,
+    ) -> BatchKinematics:
+        """
+        Вычисляет кинематику по позициям до и после шага.
+
+        Args:
+            aim_prev (np.ndarray): Позиции целей до шага, (N, 2)
+            aim (np.ndarray): Позиции целей после шага, (N, 2)
+            interceptor_prev (np.ndarray): Позиции перехватчиков до шага, (N, 2)
+            interceptor (np.ndarray): Позиции перехватчиков после шага, (N, 2)
+
+        Returns:
+            BatchKinematics: Кинематика перехватов после шага
+        """
+        dx = aim[:, 0] - interceptor[:, 0]
+        dy = aim[:, 1] - interceptor[:, 1]
+        d = _norm(dx, dy)
+        los = np.arctan2(dy, dx)
+        d_dot = (d - self.d) / self.dt
+        los_rate = ((los - self.los + np.pi) % (2 * np.pi) - np.pi) / self.dt
+        self.d = d
+        self.los = los
+
+        d_vec = aim - interceptor_prev
+        inter_vec = interceptor - interceptor_prev
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cos_corr = (d_vec * inter_vec).sum(axis=1) / (
+                _norm(d_vec[:, 0], d_vec[:, 1])
+                * _norm(inter_vec[:, 0], inter_vec[:, 1])
+            )
+        valid = (cos_corr >= -1) & (cos_corr <= 1)
+        correction = np.where(valid, np.arccos(np.where(valid, cos_corr, 1.0)), -1.0)
+
+        move_x = aim[:, 0] - aim_prev[:, 0]
+        move_y = aim[:, 1] - aim_prev[:, 0]
+        lengths = self.d0_len * _norm(move_x, move_y)
+        dot = self.d0_x * move_x + self.d0_y * move_y
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cos_q = np.where(lengths != 0, dot / lengths, 0.0)
+        q = np.arccos(np.clip(cos_q, -1.0, 1.0))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if self.law == PURSUIT:
+                n = np.where(
+                    d != 0, self.vv * np.sin(q * np.pi / 180) / (G * d), self.n_zero
+                )
+            else:
+                n = np.abs((self.K * np.cos(q)) / np.sqrt(self.K**2 - np.sin(q) ** 2))
+        return BatchKinematics(d, d_dot, los, los_rate, correction, q, n)
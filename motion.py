@@ -0,0 +1,169 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from math import pi
+
+import numpy as np
+
+from shared import DEFAULT_CONFIG, Point, Role, SimulationConfig
+
+TABLE_CACHE_SIZE = 64  # наибольшее количество таблиц в кэше процесса
+MIN_STEPS = 256  # наименьший размер таблицы (шагов)
+
+_tables: OrderedDict = OrderedDict()
+
+
+@dataclass(frozen=True)
+class TargetMotion:
+    """
+    Класс для описания движения цели, не зависящего от перехватчика.
+
+    Позиции цели на сетке времени dt, dt + dt, ... (время накапливается так же,
+    как при пошаговом моделировании) вычисляются одним векторным вызовом и
+    хранятся в общем кэше процесса, поэтому все методы наведения и все
+    варианты перехватчика в переборе параметров используют одну таблицу.
+    """
+
+    kind: str  # "line" или "circle"
+    velocity: float  # скорость цели (м / с)
+    dt: float  # шаг времени (с)
+    d0: float = 0.0  # начальное расстояние (прямая)
+    q0: float = 0.0  # направление движения в градусах (прямая)
+    y0: float = 0.0  # начальная ордината (прямая)
+    r: float = 0.0  # радиус окружности
+    center: tuple = (0.0, 0.0)  # центр окружности
+    start: tuple = (0.0, 0.0)  # начальная фаза по осям x и y (окружность)
+
+    def compute(self, times: np.ndarray) -> np.ndarray:
+        """
+        Вычисляет позиции цели в заданные моменты времени.
+
+        Формулы и порядок операций совпадают с targeting.UpdatePointOnLine и
+        targeting.UpdatePointOnCircle.
+
+        Args:
+            times (np.ndarray): Моменты времени
+
+        Returns:
+            np.ndarray: Позиции цели, форма (N, 2)
+        """
+        if self.kind == "line":
+            qr = self.q0 * pi / 180
+            s = self.velocity * times
+            x = s * np.cos(qr) + self.d0
+            y = s * np.sin(qr) + self.y0
+        elif self.kind == "circle":
+            omega = self.velocity / self.r
+            x = self.r * np.cos(omega * times + self.start[0]) + self.center[0]
+            y = self.r * np.sin(omega * times + self.start[1]) + self.center[1]
+        else:
+            raise ValueError(f"неизвестный вид движения цели: {self.kind}")
+        return np.stack((x, y), axis=1)
+
+    def table(self, steps: int) -> np.ndarray:
+        """
+        Возвращает таблицу позиций цели не менее чем на steps шагов.
+
+        Таблица только для чтения и берется из кэша процесса; если в кэше
+        таблица короче, она вычисляется заново с запасом (вдвое длиннее).
+
+        Args:
+            steps (int): Необходимое количество шагов
+
+        Returns:
+            np.ndarray: Позиции цели на шагах 1, 2, ..., форма (>= steps, 2)
+        """
+        points = _tables.get(self)
+        if points is not None and len(points) >= steps:
+            _tables.move_to_end(self)
+            return points
+        size = max(steps, MIN_STEPS, 2 * len(points) if points is not None else 0)
+        times = np.cumsum(np.full(size, self.dt))
+        points = self.compute(times)
+        points.flags.writeable = False
+        _tables[self] = points
+        _tables.move_to_end(self)
+        while len(_tables) > TABLE_CACHE_SIZE:
+            _tables.popitem(last=False)
+        return points
+
+    def points(self):
+        """
+        Генератор позиций цели на шагах 1, 2, ... без ограничения по длине.
+
+        Yields:
+            tuple[float, float]: Координаты цели
+        """
+        done = 0
+        while True:
+            rows = self.table(done + 1)[done : done + max(MIN_STEPS, done)].tolist()
+            yield from rows
+            done += len(rows)
+
+    def updater(self):
+        """
+        Создает функцию обновления позиции цели для пошагового моделирования.
+
+        Функция принимает те же аргументы, что и UpdatePointOnLine /
+        UpdatePointOnCircle, но берет очередную позицию из таблицы.
+
+        Returns:
+            Функция (aim, t, *args), добавляющая точку в траекторию цели
+        """
+        rows = self.points()
+
+        def update(aim: Role, t: float, *args):
+            x, y = next(rows)
+            aim.trajectory.appendXY(x, y)
+
+        return update
+
+
+def lineTarget(
+    velocity: float, config: SimulationConfig = DEFAULT_CONFIG
+) -> TargetMotion:
+    """
+    Описание движения цели по прямой, как в targeting.UpdatePointOnLine.
+
+    Args:
+        velocity (float): Скорость цели
+        config (SimulationConfig): Параметры моделирования
+
+    Returns:
+        TargetMotion: Движение цели
+    """
+    return TargetMotion(
+        "line", float(velocity), float(config.delta_t), d0=config.d0, q0=config.q0
+    )
+
+
+def circleTarget(
+    velocity: float,
+    center: Point,
+    start: Point,
+    config: SimulationConfig = DEFAULT_CONFIG,
+) -> TargetMotion:
+    """
+    Описание движения цели по окружности, как в targeting.UpdatePointOnCircle.
+
+    Args:
+        velocity (float): Скорость цели
+        center (Point): Центр окружности
+        start (Point): Начальная фаза движения по окружности
+        config (SimulationConfig): Параметры моделирования
+
+    Returns:
+        TargetMotion: Движение цели
+    """
+    return TargetMotion(
+        "circle",
+        float(velocity),
+        float(config.delta_t),
+        r=config.r,
+        center=(center.x, center.y),
+        start=(start.x, start.y),
+    )
+
+
+def clearTables():
+    """Очищает кэш таблиц движения цели."""
+    _tables.clear()
@@ -1,16 +1,22 @@
-from math import sin, cos, sqrt
+from dataclasses import dataclass
+from math import sqrt
+
+import numpy as np
 
 from shared import (
-    D0,
-    DELTA_T,
+    DEFAULT_CONFIG,
     Flight,
     Point,
     Role,
-    distanceBetween,
-    draw,
-    findQAngle,
+    SimulationConfig,
+    recordFlight,
 )
 from targeting import UpdatePointOnLine, UpdatePointOnCircle
+from engine import GuidanceLaw, engagementSteps
+from instrument import Instrumentation
+from kinematics import PARALLEL, Kinematics
+from motion import TargetMotion
+from termination import TerminationPolicy
 
 
 def updateInterceptorPoint(aim: Role, interceptor: Role, t):
@@ -24,91 +30,221 @@ def updateInterceptorPoint(aim: Role, interceptor: Role, t):
     s = interceptor.velocity * t
     y = (aim.trajectory[-1].y - aim.trajectory[-2].y) + interceptor.trajectory[-1].y
     x = sqrt(abs(s**2 - y**2))  # + interceptor.trajectory[-1].x
-    interceptor.trajectory.append(Point(x, y))
+    interceptor.trajectory.appendXY(x, y)
 
 
-def overloadForParellelConvergence(aim: Role, interceptor: Role, q: float) -> float:
+def updateInterceptorPoints(
+    aim_prev: np.ndarray,
+    aim: np.ndarray,
+    interceptor: np.ndarray,
+    velocity: np.ndarray,
+    t: float,
+) -> np.ndarray:
     """
-    Вычисляет необходимую перегрузку для параллельного сближения.
+    Построчный аналог updateInterceptorPoint.
 
     Args:
-        aim (Role): Объект цели
-        interceptor (Role): Объект перехватчика
-        q (float): Угол между векторами скорости цели и перехватчика
+        aim_prev (np.ndarray): Позиции целей до шага, (N, 2)
+        aim (np.ndarray): Позиции целей после шага, (N, 2)
+        interceptor (np.ndarray): Позиции перехватчиков, (N, 2)
+        velocity (np.ndarray): Скорости перехватчиков, (N,)
+        t (float): Текущее время
 
     Returns:
-        float: Значение необходимой перегрузки
+        np.ndarray: Новые позиции перехватчиков, (N, 2)
     """
-    K = interceptor.velocity / aim.velocity
-    n: float = abs((K * cos(q)) / sqrt(K**2 - sin(q) ** 2))
-    return n
+    s = velocity * t
+    y = (aim[:, 1] - aim_prev[:, 1]) + interceptor[:, 1]
+    x = np.sqrt(np.abs(s**2 - y**2))
+    return np.stack((x, y), axis=1)
 
 
-def fight(aim: Role, interceptor: Role, center: Point, start: Point, d: int) -> Flight:
+@dataclass
+class ParallelApproach(GuidanceLaw):
     """
-    Моделирует процесс перехвата цели параллельным сближением.
+    Параллельное сближение: линия визирования перемещается параллельно себе.
+
+    Перехват - расстояние в начале шага не больше d.
+    """
+
+    d: float = 20  # расстояние до цели, при котором моделирование завершается
+    overload_law = PARALLEL
+
+    def move(
+        self,
+        aim: Role,
+        interceptor: Role,
+        t: float,
+        config: SimulationConfig,
+        state: Kinematics | None,
+    ):
+        updateInterceptorPoint(aim, interceptor, t)
+
+    def moveBatch(self, aim_prev, aim, interceptor, velocity, t, dt, state):
+        return updateInterceptorPoints(aim_prev, aim, interceptor, velocity, t)
+
+    def capturedAtStart(self, distance):
+        return distance <= self.d
+
+    def captured(self, state: Kinematics, distance: float) -> bool:
+        return distance <= self.d
+
+
+def fightSteps(
+    aim: Role,
+    interceptor: Role,
+    center: Point,
+    start: Point,
+    d: int,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    policy: TerminationPolicy | None = None,
+    stats: Instrumentation | None = None,
+    motion: TargetMotion | None = None,
+):
+    """
+    Генератор шагов перехвата цели на окружности параллельным сближением.
+
+    Хранит только первую и две последние точки траекторий, поэтому занимает
+    постоянный объем памяти. Траектории переданных ролей не изменяются.
 
     Args:
         aim (Role): Объект цели
         interceptor (Role): Объект перехватчика
+        center (Point): Центр окружности
+        start (Point): Начальная фаза движения по окружности
+        d (int): Расстояние до цели, при котором моделирование завершается
+        config (SimulationConfig): Параметры моделирования
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+        stats (Instrumentation | None): Сбор времени и вызовов по фазам шага
+        motion (TargetMotion | None): Таблица движения цели (motion.py) вместо
+            пошагового расчета позиции цели
+
+    Yields:
+        Step: Состояние перехвата на очередном шаге
 
     Returns:
-        Flight: Объект с данными о полете (траектория, перегрузки, расстояния и т.д.)
+        Outcome: Итог моделирования
     """
-    t = DELTA_T  # начальное время
-    step: int = 0  # счетчик шагов
-    flight = Flight([], 0, [], [], [0], [])
-    distance = D0
-
-    # Пока расстояние между целью и перехватчиком больше 200 м
-    while distance > d:
-        distance = distanceBetween(aim.trajectory[-1], interceptor.trajectory[-1])
-        draw(aim, interceptor, step)
-        UpdatePointOnCircle(aim, t, center, start)
-        updateInterceptorPoint(aim, interceptor, t)
-        qi = findQAngle(aim, interceptor)
+    if motion is None:
+        target = lambda aim, t: UpdatePointOnCircle(aim, t, center, start, config)
+    else:
+        target = motion.updater()
+    return (
+        yield from engagementSteps(
+            aim, interceptor, target, ParallelApproach(d), config, policy, stats
+        )
+    )
+
+
+def lineFightSteps(
+    aim: Role,
+    interceptor: Role,
+    d: int,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    policy: TerminationPolicy | None = None,
+    stats: Instrumentation | None = None,
+    motion: TargetMotion | None = None,
+):
+    """
+    Генератор шагов перехвата цели на прямой параллельным сближением.
 
-        flight.n.append(overloadForParellelConvergence(aim, interceptor, qi))
-        flight.d.append(distance)
-        flight.q.append(qi)
-        flight.t.append(t)
-        t += DELTA_T
-        step += 1
+    Хранит только первую и две последние точки траекторий, поэтому занимает
+    постоянный объем памяти. Траектории переданных ролей не изменяются.
 
-    flight.steps = step
-    return flight
+    Args:
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        d (int): Расстояние до цели, при котором моделирование завершается
+        config (SimulationConfig): Параметры моделирования
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+        stats (Instrumentation | None): Сбор времени и вызовов по фазам шага
+        motion (TargetMotion | None): Таблица движения цели (motion.py) вместо
+            пошагового расчета позиции цели
 
+    Yields:
+        Step: Состояние перехвата на очередном шаге
 
-def lineFight(aim: Role, interceptor: Role, d: int) -> Flight:
+    Returns:
+        Outcome: Итог моделирования
+    """
+    if motion is None:
+        target = lambda aim, t: UpdatePointOnLine(aim, t, config)
+    else:
+        target = motion.updater()
+    return (
+        yield from engagementSteps(
+            aim, interceptor, target, ParallelApproach(d), config, policy, stats
+        )
+    )
+
+
+def fight(
+    aim: Role,
+    interceptor: Role,
+    center: Point,
+    start: Point,
+    d: int,
+    headless: bool = False,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    writer=None,
+    policy: TerminationPolicy | None = None,
+    stats: Instrumentation | None = None,
+    motion: TargetMotion | None = None,
+) -> Flight:
     """
     Моделирует процесс перехвата цели параллельным сближением.
 
     Args:
         aim (Role): Объект цели
         interceptor (Role): Объект перехватчика
+        headless (bool): Только записывать состояние, без отрисовки на каждом шаге
+        config (SimulationConfig): Параметры моделирования
+        writer (FlightWriter | None): Потоковая запись шагов в архив (storage.py)
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+        stats (Instrumentation | None): Сбор времени и вызовов по фазам шага,
+            результат доступен в flight.stats
+        motion (TargetMotion | None): Таблица движения цели (motion.py) вместо
+            пошагового расчета позиции цели
 
     Returns:
         Flight: Объект с данными о полете (траектория, перегрузки, расстояния и т.д.)
     """
-    t = DELTA_T  # начальное время
-    step: int = 0  # счетчик шагов
     flight = Flight([], 0, [], [], [0], [])
-    distance = D0
-
-    # Пока расстояние между целью и перехватчиком больше 200 м
-    while distance > d:
-        distance = distanceBetween(aim.trajectory[-1], interceptor.trajectory[-1])
-        draw(aim, interceptor, step)
-        UpdatePointOnLine(aim, t)
-        updateInterceptorPoint(aim, interceptor, t)
-        qi = findQAngle(aim, interceptor)
+    steps = fightSteps(
+        aim, interceptor, center, start, d, config, policy, stats, motion
+    )
+    return recordFlight(steps, aim, interceptor, flight, headless, writer, stats)
+
+
+def lineFight(
+    aim: Role,
+    interceptor: Role,
+    d: int,
+    headless: bool = False,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    writer=None,
+    policy: TerminationPolicy | None = None,
+    stats: Instrumentation | None = None,
+    motion: TargetMotion | None = None,
+) -> Flight:
+    """
+    Моделирует процесс перехвата цели параллельным сближением.
 
-        flight.n.append(overloadForParellelConvergence(aim, interceptor, qi))
-        flight.d.append(distance)
-        flight.q.append(qi)
-        flight.t.append(t)
-        t += DELTA_T
-        step += 1
+    Args:
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        headless (bool): Только записывать состояние, без отрисовки на каждом шаге
+        config (SimulationConfig): Параметры моделирования
+        writer (FlightWriter | None): Потоковая запись шагов в архив (storage.py)
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+        stats (Instrumentation | None): Сбор времени и вызовов по фазам шага,
+            результат доступен в flight.stats
+        motion (TargetMotion | None): Таблица движения цели (motion.py) вместо
+            пошагового расчета позиции цели
 
-    flight.steps = step
-    return flight
+    Returns:
+        Flight: Объект с данными о полете (траектория, перегрузки, расстояния и т.д.)
+    """
+    flight = Flight([], 0, [], [], [0], [])
+    steps = lineFightSteps(aim, interceptor, d, config, policy, stats, motion)
+    return recordFlight(steps, aim, interceptor, flight, headless, writer, stats)
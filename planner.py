@@ -0,0 +1,177 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from batch import batchGuidedFight
+from engine import GuidanceLaw
+from motion import TargetMotion
+from shared import DEFAULT_CONFIG, Role, SimulationConfig
+from targeting import Pursuit
+
+# Критерии назначения
+TOTAL = "total"  # наименьшее суммарное время перехвата
+MAX = "max"  # наименьшее наибольшее время перехвата
+
+
+@dataclass
+class Plan:
+    """Класс для хранения плана назначения перехватчиков на цели."""
+
+    capture_time: np.ndarray  # время перехвата (с), inf без перехвата, (K, M)
+    peak_overload: np.ndarray  # пиковая перегрузка, (K, M)
+    feasible: np.ndarray  # перехват с допустимой перегрузкой, (K, M)
+    pairs: list[tuple[int, int]]  # назначения (перехватчик, цель)
+    objective: float  # суммарное или наибольшее время перехвата по назначениям
+
+
+def _targetRows(targets: list[TargetMotion], columns: np.ndarray):
+    """Функция t -> позиции целей для строк пачки (строка i - цель columns[i])."""
+
+    def points(t: float) -> np.ndarray:
+        times = np.array([t])
+        return np.concatenate([target.compute(times) for target in targets])[columns]
+
+    return points
+
+
+def captureMatrices(
+    interceptors: list[Role],
+    targets: list[TargetMotion],
+    law: GuidanceLaw | None = None,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    max_steps: int = 10000,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Вычисляет матрицы времени перехвата и пиковой перегрузки для всех пар.
+
+    Все K * M пар моделируются одной пачкой (batch.batchGuidedFight) без
+    сохранения истории шагов.
+
+    Args:
+        interceptors (list[Role]): Перехватчики (последняя точка траектории -
+            начальная позиция)
+        targets (list[TargetMotion]): Движение целей
+        law (GuidanceLaw | None): Закон наведения (по умолчанию метод погони)
+        config (SimulationConfig): Параметры моделирования (шаг по времени)
+        max_steps (int): Максимальное количество шагов
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Время перехвата (inf без перехвата) и
+            пиковая перегрузка (NaN без перехвата), формы (K, M)
+    """
+    K, M = len(interceptors), len(targets)
+    rows, columns = np.divmod(np.arange(K * M), M)
+    starts = np.array(
+        [(p.x, p.y) for p in (role.trajectory[-1] for role in interceptors)],
+        dtype=np.float64,
+    ).reshape(K, 2)
+    points = _targetRows(targets, columns)
+    aim_velocity = np.array([target.velocity for target in targets])[columns]
+    # Радиус нужен только для окружности (перегрузка при нулевом расстоянии)
+    r = np.array([target.r or 1.0 for target in targets])[columns]
+    interceptor_velocity = np.array(
+        [role.velocity for role in interceptors], dtype=np.float64
+    )[rows]
+    flight = batchGuidedFight(
+        law if law is not None else Pursuit(),
+        points,
+        points(0.0),
+        starts[rows],
+        aim_velocity,
+        interceptor_velocity,
+        r,
+        dt=config.delta_t,
+        max_steps=max_steps,
+        history=False,
+    )
+    last = np.maximum(flight.steps - 1, 0)
+    times = flight.t[last] if len(flight.t) else np.zeros(K * M)
+    # Пара, перехваченная до первого шага: время и перегрузка равны нулю
+    at_start = flight.steps == 0
+    capture_time = np.where(flight.captured, np.where(at_start, 0.0, times), np.inf)
+    peak = np.where(flight.captured, np.where(at_start, 0.0, flight.peak), np.nan)
+    return capture_time.reshape(K, M), peak.reshape(K, M)
+
+
+def _solve(cost: np.ndarray, allowed: np.ndarray) -> list[tuple[int, int]]:
+    """Оптимальное назначение по разрешенным парам (наибольшее их количество)."""
+    from scipy.optimize import linear_sum_assignment
+
+    finite = np.where(allowed, cost, 0.0)
+    penalty = finite.sum() + 1.0  # больше любой суммы разрешенных пар
+    rows, columns = linear_sum_assignment(np.where(allowed, finite, penalty))
+    return [(int(k), int(m)) for k, m in zip(rows, columns) if allowed[k, m]]
+
+
+def assign(
+    capture_time: np.ndarray,
+    feasible: np.ndarray,
+    objective: str = TOTAL,
+) -> tuple[list[tuple[int, int]], float]:
+    """
+    Находит оптимальное назначение перехватчиков на цели.
+
+    Назначается наибольшее возможное количество допустимых пар. При TOTAL
+    среди таких назначений минимизируется суммарное время перехвата, при MAX
+    - наибольшее время (поиском порога), а затем суммарное время.
+
+    Args:
+        capture_time (np.ndarray): Время перехвата, (K, M)
+        feasible (np.ndarray): Допустимые пары, (K, M)
+        objective (str): TOTAL или MAX
+
+    Returns:
+        tuple[list, float]: Назначения (перехватчик, цель) и значение критерия
+    """
+    if objective not in (TOTAL, MAX):
+        raise ValueError(f"неизвестный критерий назначения: {objective}")
+    pairs = _solve(capture_time, feasible)
+    if objective == MAX and pairs:
+        # Наименьший порог времени, при котором назначается столько же пар
+        thresholds = np.unique(capture_time[feasible])
+        low, high = 0, len(thresholds) - 1
+        while low < high:
+            middle = (low + high) // 2
+            allowed = feasible & (capture_time <= thresholds[middle])
+            if len(_solve(np.zeros_like(capture_time), allowed)) == len(pairs):
+                high = middle
+            else:
+                low = middle + 1
+        pairs = _solve(capture_time, feasible & (capture_time <= thresholds[low]))
+    times = [capture_time[k, m] for k, m in pairs]
+    if not times:
+        return pairs, 0.0
+    return pairs, float(max(times) if objective == MAX else sum(times))
+
+
+def plan(
+    interceptors: list[Role],
+    targets: list[TargetMotion],
+    law: GuidanceLaw | None = None,
+    objective: str = TOTAL,
+    max_overload: float | None = None,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    max_steps: int = 10000,
+) -> Plan:
+    """
+    Строит план назначения перехватчиков на цели.
+
+    Args:
+        interceptors (list[Role]): Перехватчики
+        targets (list[TargetMotion]): Движение целей
+        law (GuidanceLaw | None): Закон наведения (по умолчанию метод погони)
+        objective (str): TOTAL - суммарное, MAX - наибольшее время перехвата
+        max_overload (float | None): Наибольшая допустимая пиковая перегрузка
+        config (SimulationConfig): Параметры моделирования
+        max_steps (int): Максимальное количество шагов
+
+    Returns:
+        Plan: Матрицы времени и перегрузки и оптимальные назначения
+    """
+    capture_time, peak = captureMatrices(interceptors, targets, law, config, max_steps)
+    feasible = np.isfinite(capture_time)
+    if max_overload is not None:
+        with np.errstate(invalid="ignore"):
+            feasible &= peak <= max_overload
+    pairs, value = assign(capture_time, feasible, objective)
+    return Plan(capture_time, peak, feasible, pairs, value)
@@ -0,0 +1,127 @@
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+import numpy as np
+
+from shared import Role
+
+
+def draw(aim: Role, interceptor: Role, i: int):
+    """
+    Отрисовывает текущее состояние системы на графике.
+
+    Args:
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        i (int): Номер текущего шага
+    """
+
+    if len(interceptor.trajectory) > 1:
+        # Отрисовка траектории перехватчика между предыдущей и текущей точками
+        line_x = [interceptor.trajectory[i - 1].x, interceptor.trajectory[i].x]
+        line_y = [interceptor.trajectory[i - 1].y, interceptor.trajectory[i].y]
+        plt.plot(line_x, line_y, color="black", linewidth=1.5)
+
+    if aim.trajectory and interceptor.trajectory:
+        # Отрисовка линии визирования (перехватчик-цель)
+        line_x = [interceptor.trajectory[-1].x, aim.trajectory[-1].x]
+        line_y = [interceptor.trajectory[-1].y, aim.trajectory[-1].y]
+        plt.plot(line_x, line_y, color="black", linewidth=0.5)
+
+    # Отрисовка точки перехватчика с меткой
+    plt.plot(
+        interceptor.trajectory[i].x,
+        interceptor.trajectory[i].y,
+        marker=".",
+        color="black",
+    )
+    plt.text(
+        interceptor.trajectory[i].x + interceptor.x_indent,
+        interceptor.trajectory[i].y + interceptor.y_indent,
+        "П" + str(i),
+    )
+
+    # Отрисовка точки цели с меткой
+    plt.plot(aim.trajectory[i].x, aim.trajectory[i].y, marker="*", color="red")
+    plt.text(
+        aim.trajectory[i].x + aim.x_indent,
+        aim.trajectory[i].y + aim.y_indent,
+        "Ц" + str(i),
+    )
+
+
+def drawEngagement(
+    aim: Role, interceptor: Role, steps: int | None = None, labels: bool = True, ax=None
+):
+    """
+    Отрисовывает весь перехват за один проход по записанным траекториям.
+
+    В отличие от draw(), которая вызывается на каждом шаге, здесь каждая роль
+    рисуется одной ломаной, а все линии визирования - одной LineCollection.
+
+    Args:
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        steps (int | None): Количество отрисовываемых шагов (по умолчанию все точки)
+        labels (bool): Подписывать ли точки номерами шагов
+        ax: Оси matplotlib (по умолчанию текущие оси pyplot)
+    """
+    if ax is None:
+        ax = plt.gca()
+    count = min(len(aim.trajectory), len(interceptor.trajectory))
+    if steps is not None:
+        count = min(count, steps)
+    aim_x = aim.trajectory.xs[:count]
+    aim_y = aim.trajectory.ys[:count]
+    inter_x = interceptor.trajectory.xs[:count]
+    inter_y = interceptor.trajectory.ys[:count]
+
+    # Линии визирования (перехватчик-цель) для всех шагов
+    segments = np.stack(
+        (interceptor.trajectory.points[:count], aim.trajectory.points[:count]), axis=1
+    )
+    ax.add_collection(LineCollection(segments, colors="black", linewidths=0.5))
+
+    # Траектория перехватчика и точки цели
+    ax.plot(inter_x, inter_y, color="black", linewidth=1.5, marker=".")
+    ax.plot(aim_x, aim_y, linestyle="none", marker="*", color="red")
+
+    if labels:
+        for i in range(count):
+            ax.text(
+                inter_x[i] + interceptor.x_indent,
+                inter_y[i] + interceptor.y_indent,
+                "П" + str(i),
+            )
+            ax.text(aim_x[i] + aim.x_indent, aim_y[i] + aim.y_indent, "Ц" + str(i))
+    ax.autoscale_view()
+
+
+def destroy(aim: Role, interceptor: Role):
+    """
+    Отрисовывает линию поражения цели.
+
+    Args:
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+    """
+    # Отрисовка линии от предпоследней позиции перехватчика к предпоследней позиции цели
+    line_x = [interceptor.trajectory[-2].x, aim.trajectory[-2].x]
+    line_y = [interceptor.trajectory[-2].y, aim.trajectory[-2].y]
+    plt.plot(line_x, line_y, color="black", linewidth="1.5")
+    plt.plot(aim.trajectory[-2].x, aim.trajectory[-2].y, color="orange", marker="X")
+
+
+def saveFig(path: str, x_label: str, y_label: str):
+    """
+    Сохраняет текущий график в файл.
+
+    Args:
+        path (str): Путь для сохранения файла
+        x_label (str): Подпись оси X
+        y_label (str): Подпись оси Y
+    """
+    # Настройка и сохранение графика
+    plt.xlabel(x_label)
+    plt.ylabel(y_label)
+    plt.savefig(path)
+    plt.clf()
@@ -0,0 +1,192 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from motion import MIN_STEPS, TargetMotion
+from shared import DEFAULT_CONFIG, Role, SimulationConfig
+from targeting import updateInterceptorPoints
+
+# Способы выбора цели перехватчиком
+NEAREST = "nearest"  # на каждом шаге ближайшая уцелевшая цель
+ASSIGNED = "assigned"  # назначенная цель, после ее уничтожения - ближайшая
+
+
+@dataclass
+class Raid:
+    """Класс для хранения результатов моделирования налета (M целей, K перехватчиков)."""
+
+    steps: int  # количество шагов
+    t: np.ndarray  # временные метки шагов, (шаги,)
+    kills: list[tuple[int, int, int]]  # (шаг, перехватчик, цель) в порядке поражения
+    target_killed: np.ndarray  # шаг поражения цели или -1, (M,)
+    interceptor_target: np.ndarray  # последняя цель перехватчика или -1, (K,)
+    aim: np.ndarray | None = None  # позиции целей, (шаги + 1, M, 2)
+    interceptor: np.ndarray | None = None  # позиции перехватчиков, (шаги + 1, K, 2)
+
+    @property
+    def survivors(self) -> np.ndarray:
+        """Индексы непораженных целей."""
+        return np.flatnonzero(self.target_killed < 0)
+
+
+def _targetPositions(targets: list[TargetMotion], steps: int) -> np.ndarray:
+    """
+    Позиции всех целей на шагах 0, 1, ..., steps - 1.
+
+    Позиции считаются TargetMotion.compute на той же сетке времени, что и
+    TargetMotion.table, но без общего кэша motion.py: он хранит
+    TABLE_CACHE_SIZE таблиц, и налет из сотен целей вытеснял бы из него все
+    таблицы на каждом удлинении. Таблица налета - возвращаемый массив.
+
+    Returns:
+        np.ndarray: Позиции, (steps, M, 2)
+    """
+    times = {}  # шаг по времени -> моменты шагов 0, 1, ..., steps - 1
+    positions = []
+    for target in targets:
+        if target.dt not in times:
+            times[target.dt] = np.concatenate(
+                ([0.0], np.cumsum(np.full(steps - 1, target.dt)))
+            )
+        positions.append(target.compute(times[target.dt]))
+    return np.stack(positions, axis=1)
+
+
+def raidFight(
+    targets: list[TargetMotion],
+    interceptors: list[Role],
+    mode: str = NEAREST,
+    assignment=None,
+    capture_radius=None,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    max_steps: int = 10000,
+    record: bool = False,
+) -> Raid:
+    """
+    Моделирует налет: M целей и K перехватчиков, наводящихся методом погони.
+
+    Движение целей не зависит от перехватчиков; позиции всех целей
+    вычисляются векторно и хранятся в таблице налета (не в кэше motion.py).
+    На каждом шаге по уцелевшим целям строится KD-дерево (scipy.spatial.cKDTree),
+    поэтому поиск ближайшей цели занимает O(K log M) вместо O(M * K).
+    Перехватчик поражает свою цель, если расстояние до нее в начале шага не
+    больше capture_radius; пораженная цель и перехватчик выбывают. Если одну
+    цель на одном шаге достигают несколько перехватчиков, ее поражает
+    перехватчик с меньшим индексом, остальные выбирают новую цель.
+
+    Args:
+        targets (list[TargetMotion]): Движение целей
+        interceptors (list[Role]): Перехватчики (последняя точка траектории -
+            начальная позиция)
+        mode (str): NEAREST - ближайшая цель на каждом шаге, ASSIGNED -
+            назначенная цель и ближайшая после ее поражения
+        assignment: Индексы назначенных целей, (K,) (для ASSIGNED; по
+            умолчанию ближайшие в начале налета)
+        capture_radius: Радиус поражения, скаляр или (K,) (по умолчанию
+            перемещение перехватчика за шаг)
+        config (SimulationConfig): Параметры моделирования (шаг по времени)
+        max_steps (int): Максимальное количество шагов
+        record (bool): Сохранить позиции всех участников и дополнить
+            траектории перехватчиков
+
+    Returns:
+        Raid: Результаты моделирования
+    """
+    from scipy.spatial import cKDTree
+
+    if mode not in (NEAREST, ASSIGNED):
+        raise ValueError(f"неизвестный способ выбора цели: {mode}")
+    dt = config.delta_t
+    count = len(interceptors)
+    velocity = np.array([role.velocity for role in interceptors], dtype=np.float64)
+    inter = np.array(
+        [(point.x, point.y) for point in (r.trajectory[-1] for r in interceptors)],
+        dtype=np.float64,
+    ).reshape(count, 2)
+    if capture_radius is None:
+        capture_radius = velocity * dt
+    radius = np.broadcast_to(np.asarray(capture_radius, dtype=np.float64), (count,))
+
+    aims = _targetPositions(targets, MIN_STEPS + 1)
+    alive = np.ones(len(targets), dtype=bool)
+    killed = np.full(len(targets), -1, dtype=np.int64)
+    active = np.ones(count, dtype=bool)
+    goal = np.full(count, -1, dtype=np.int64)
+    kills = []
+    aim_hist = [aims[0]] if record else None
+    inter_hist = [inter.copy()] if record else None
+
+    def nearest(points: np.ndarray, rows: np.ndarray, alive_index: np.ndarray):
+        """Ближайшие уцелевшие цели для перехватчиков rows."""
+        tree = cKDTree(points[alive_index])
+        _, found = tree.query(inter[rows])
+        goal[rows] = alive_index[found]
+
+    if mode == ASSIGNED:
+        if assignment is not None:
+            goal[:] = assignment
+        else:
+            nearest(aims[0], np.arange(count), np.arange(len(targets)))
+
+    t = dt
+    step = 0
+    t_hist = []
+    while active.any() and alive.any() and step < max_steps:
+        if step + 1 >= len(aims):
+            aims = _targetPositions(targets, 2 * len(aims))
+        aim_new = aims[step + 1]
+        alive_index = np.flatnonzero(alive)
+
+        # Выбор цели: все активные (NEAREST) или потерявшие цель (ASSIGNED)
+        if mode == NEAREST:
+            rows = np.flatnonzero(active)
+        else:
+            rows = np.flatnonzero(active & ((goal < 0) | ~alive[np.maximum(goal, 0)]))
+        if len(rows):
+            nearest(aim_new, rows, alive_index)
+
+        # Поражение целей: расстояние в начале шага, обе позиции - до шага
+        moving = np.flatnonzero(active)
+        target_points = aims[step][goal[moving]]
+        distance = np.sqrt(((target_points - inter[moving]) ** 2).sum(axis=1))
+        hit = moving[distance <= radius[moving]]
+        if len(hit):
+            hit_targets, first = np.unique(goal[hit], return_index=True)
+            winners = hit[first]
+            for interceptor_index, target_index in zip(winners, hit_targets):
+                kills.append((step + 1, int(interceptor_index), int(target_index)))
+            alive[hit_targets] = False
+            killed[hit_targets] = step + 1
+            active[winners] = False
+            inter[winners] = aim_new[hit_targets]
+            moving = np.flatnonzero(active)
+            # Перехватчики, чья цель поражена другим, выбирают новую цель
+            lost = moving[~alive[goal[moving]]]
+            if len(lost) and alive.any():
+                nearest(aim_new, lost, np.flatnonzero(alive))
+
+        # Движение перехватчиков методом погони
+        if alive.any() and len(moving):
+            inter[moving] = updateInterceptorPoints(
+                inter[moving], aim_new[goal[moving]], velocity[moving], dt
+            )
+        t_hist.append(t)
+        if record:
+            aim_hist.append(aim_new)
+            inter_hist.append(inter.copy())
+        t += dt
+        step += 1
+
+    if record:
+        for role, points in zip(interceptors, np.stack(inter_hist, axis=1)):
+            for x, y in points[1:].tolist():
+                role.trajectory.appendXY(x, y)
+    return Raid(
+        steps=step,
+        t=np.array(t_hist),
+        kills=kills,
+        target_killed=killed,
+        interceptor_target=goal,
+        aim=np.stack(aim_hist) if record else None,
+        interceptor=np.stack(inter_hist) if record else None,
+    )
@@ -0,0 +1,328 @@
+import asyncio
+from dataclasses import asdict, dataclass, field
+import inspect
+import json
+from statistics import fmean
+
+from shared import DEFAULT_CONFIG, Flight, Role, SimulationConfig, Step, recordSteps
+from engine import GuidanceLaw, engagementSteps
+from termination import Outcome, TerminationPolicy
+
+# Политики переполнения очереди подписчика
+DROP_OLDEST = "drop_oldest"  # вытеснить самую старую запись
+DROP_NEWEST = "drop_newest"  # отбросить новую запись
+DECIMATE = "decimate"  # вытеснить старую запись и передавать каждый k-й шаг
+
+MAX_STRIDE = 64  # наибольший шаг прореживания для DECIMATE
+
+
+@dataclass(slots=True)
+class Tick:
+    """Класс для хранения одного опубликованного шага моделирования."""
+
+    index: int  # номер шага
+    step: Step  # состояние перехвата
+    scheduled: float  # плановое время публикации (часы цикла asyncio, с)
+    published: float  # фактическое время публикации (с)
+
+
+@dataclass
+class SubscriberStats:
+    """Класс для хранения статистики доставки шагов подписчику."""
+
+    delivered: int = 0  # получено подписчиком
+    dropped: int = 0  # вытеснено или отброшено при переполнении
+    decimated: int = 0  # пропущено прореживанием
+    latency: list[float] = field(default_factory=list)  # публикация -> получение (с)
+
+
+class Subscriber:
+    """
+    Подписчик на шаги моделирования с ограниченной очередью.
+
+    Публикация никогда не ждет подписчика: при переполнении очереди запись
+    вытесняется или отбрасывается по политике, поэтому медленный подписчик не
+    задерживает моделирование. Записи читаются через get() или async for.
+    """
+
+    def __init__(self, maxsize: int = 64, policy: str = DROP_OLDEST):
+        """
+        Args:
+            maxsize (int): Наибольшая длина очереди
+            policy (str): DROP_OLDEST, DROP_NEWEST или DECIMATE
+        """
+        if policy not in (DROP_OLDEST, DROP_NEWEST, DECIMATE):
+            raise ValueError(f"неизвестная политика переполнения: {policy}")
+        if maxsize < 1:
+            raise ValueError("длина очереди должна быть положительной")
+        self.policy = policy
+        self.stats = SubscriberStats()
+        self.stride = 1  # текущий шаг прореживания
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._closed = False
+
+    def _encode(self, tick: Tick):
+        """Представление записи в очереди (переопределяется транспортом)."""
+        return tick
+
+    def _decode(self, item) -> Tick:
+        """Восстанавливает запись из представления в очереди."""
+        return item
+
+    def _evict(self):
+        """Вытесняет самую старую запись."""
+        self._queue.get_nowait()
+        self.stats.dropped += 1
+
+    def publish(self, tick: Tick):
+        """
+        Кладет запись в очередь без ожидания.
+
+        Args:
+            tick (Tick): Опубликованный шаг
+        """
+        if self.policy == DECIMATE:
+            if self._queue.empty() and self.stride > 1:
+                self.stride //= 2
+            if tick.index % self.stride:
+                self.stats.decimated += 1
+                return
+        if self._queue.full():
+            if self.policy == DROP_NEWEST:
+                self.stats.dropped += 1
+                return
+            self._evict()
+            if self.policy == DECIMATE:
+                self.stride = min(self.stride * 2, MAX_STRIDE)
+        self._queue.put_nowait(self._encode(tick))
+
+    def close(self):
+        """Завершает поток записей (маркер конца не отбрасывается)."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._queue.full():
+            self._evict()
+        self._queue.put_nowait(None)
+
+    async def get(self) -> Tick | None:
+        """
+        Ждет следующую запись.
+
+        Returns:
+            Tick | None: Запись или None после завершения моделирования
+        """
+        item = await self._queue.get()
+        if item is None:
+            # Маркер конца остается в очереди для повторных вызовов
+            self._queue.put_nowait(None)
+            return None
+        tick = self._decode(item)
+        self.stats.delivered += 1
+        self.stats.latency.append(asyncio.get_running_loop().time() - tick.published)
+        return tick
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Tick:
+        tick = await self.get()
+        if tick is None:
+            raise StopAsyncIteration
+        return tick
+
+
+class LoopbackSubscriber(Subscriber):
+    """
+    Подписчик с заменителем сетевого транспорта.
+
+    Записи хранятся в очереди в виде JSON (байты), как при передаче внешнему
+    процессу, и разбираются при получении. Позволяет проверить формат
+    сообщений и стоимость сериализации без сети.
+    """
+
+    def _encode(self, tick: Tick) -> bytes:
+        data = asdict(tick)
+        return json.dumps(data).encode()
+
+    def _decode(self, item: bytes) -> Tick:
+        data = json.loads(item)
+        data["step"] = Step(**data["step"])
+        return Tick(**data)
+
+
+@dataclass
+class RunMetrics:
+    """Класс для хранения метрик темпа моделирования в реальном времени."""
+
+    ticks: int = 0  # опубликовано шагов
+    jitter: list[float] = field(default_factory=list)  # опоздание шагов (с)
+    elapsed: float = 0.0  # длительность по часам (с)
+
+    @property
+    def mean_jitter(self) -> float:
+        """Среднее опоздание шага (с)."""
+        return fmean(self.jitter) if self.jitter else 0.0
+
+    @property
+    def max_jitter(self) -> float:
+        """Наибольшее опоздание шага (с)."""
+        return max(self.jitter, default=0.0)
+
+
+class RealTimeRunner:
+    """
+    Класс для моделирования в темпе реального времени (или кратном ему).
+
+    Шаг со временем t публикуется подписчикам не раньше, чем через
+    t / speed секунд после начала. Между шагами цикл asyncio свободен для
+    подписчиков (график, журнал, запись).
+    """
+
+    def __init__(self, speed: float | None = 1.0):
+        """
+        Args:
+            speed (float | None): Во сколько раз моделирование быстрее реального
+                времени (None - без ожидания)
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("ускорение должно быть положительным")
+        self.speed = speed
+        self.subscribers: list[Subscriber] = []
+        self.metrics = RunMetrics()
+
+    def subscribe(
+        self, maxsize: int = 64, policy: str = DROP_OLDEST, loopback: bool = False
+    ) -> Subscriber:
+        """
+        Создает подписчика на шаги моделирования.
+
+        Args:
+            maxsize (int): Наибольшая длина очереди
+            policy (str): DROP_OLDEST, DROP_NEWEST или DECIMATE
+            loopback (bool): Передавать записи через LoopbackSubscriber
+
+        Returns:
+            Subscriber: Подписчик
+        """
+        cls = LoopbackSubscriber if loopback else Subscriber
+        subscriber = cls(maxsize, policy)
+        self.subscribers.append(subscriber)
+        return subscriber
+
+    async def run(self, steps) -> Outcome | None:
+        """
+        Публикует шаги генератора в темпе реального времени.
+
+        Args:
+            steps: Генератор записей Step (например, engine.engagementSteps)
+
+        Returns:
+            Outcome | None: Итог моделирования (значение генератора)
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        t0 = None
+        index = 0
+        outcome = None
+        try:
+            while True:
+                try:
+                    record = next(steps)
+                except StopIteration as stop:
+                    outcome = stop.value
+                    break
+                if t0 is None:
+                    t0 = record.t
+                scheduled = start
+                if self.speed is not None:
+                    scheduled += (record.t - t0) / self.speed
+                delay = scheduled - loop.time()
+                # Уступаем цикл подписчикам и при отставании от расписания
+                await asyncio.sleep(max(delay, 0.0))
+                now = loop.time()
+                self.metrics.jitter.append(now - scheduled)
+                tick = Tick(index, record, scheduled, now)
+                for subscriber in self.subscribers:
+                    subscriber.publish(tick)
+                index += 1
+        finally:
+            for subscriber in self.subscribers:
+                subscriber.close()
+            self.metrics.ticks = index
+            self.metrics.elapsed = loop.time() - start
+        return outcome
+
+    def report(self) -> str:
+        """
+        Формирует таблицу метрик темпа и доставки.
+
+        Returns:
+            str: Таблица с опозданием шагов и задержкой по подписчикам
+        """
+        metrics = self.metrics
+        lines = [
+            f"шагов: {metrics.ticks}, длительность: {metrics.elapsed:.3f} с",
+            f"опоздание шага: среднее {metrics.mean_jitter * 1e3:.3f} мс, "
+            f"наибольшее {metrics.max_jitter * 1e3:.3f} мс",
+            f"{'подписчик':<12}{'получено':>10}{'вытеснено':>11}"
+            f"{'прорежено':>11}{'задержка, мс':>14}",
+        ]
+        for i, subscriber in enumerate(self.subscribers):
+            stats = subscriber.stats
+            latency = fmean(stats.latency) * 1e3 if stats.latency else 0.0
+            lines.append(
+                f"{i:<12}{stats.delivered:>10}{stats.dropped:>11}"
+                f"{stats.decimated:>11}{latency:>14.3f}"
+            )
+        return "\n".join(lines)
+
+
+async def realTimeFight(
+    runner: RealTimeRunner,
+    aim: Role,
+    interceptor: Role,
+    target,
+    law: GuidanceLaw,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    policy: TerminationPolicy | None = None,
+) -> Flight:
+    """
+    Моделирует перехват в темпе реального времени с публикацией шагов.
+
+    Args:
+        runner (RealTimeRunner): Темп и подписчики
+        aim (Role): Объект цели
+        interceptor (Role): Объект перехватчика
+        target: Функция (aim, t), добавляющая позицию цели в момент t
+        law (GuidanceLaw): Закон наведения
+        config (SimulationConfig): Параметры моделирования
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+
+    Returns:
+        Flight: Объект с данными о полете
+    """
+    flight = Flight([], 0, [], [], [], [])
+    steps = engagementSteps(aim, interceptor, target, law, config, policy)
+    await runner.run(recordSteps(steps, aim, interceptor, flight))
+    return flight
+
+
+async def consume(subscriber: Subscriber, handler) -> int:
+    """
+    Передает записи подписчика обработчику до завершения моделирования.
+
+    Args:
+        subscriber (Subscriber): Подписчик
+        handler: Функция или сопрограмма handler(tick)
+
+    Returns:
+        int: Количество обработанных записей
+    """
+    count = 0
+    async for tick in subscriber:
+        result = handler(tick)
+        if inspect.isawaitable(result):
+            await result
+        count += 1
+    return count
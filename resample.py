@@ -0,0 +1,134 @@
+import numpy as np
+
+
+def flightSpline(flight, column: str = "n"):
+    """
+    Кубический сплайн столбца полета по времени, кэшируемый в flight.splines.
+
+    Сплайн с условием not-a-knot совпадает с interp1d(kind="cubic"). Кэш
+    хранит копии времени и значений, по которым построен сплайн, и
+    перестраивается при их отличии: после изменения значений на месте или
+    при общем словаре splines у копий полета (dataclasses.replace).
+
+    Args:
+        flight (Flight | CompactFlight): Данные о полете
+        column (str): Столбец: n, d или q
+
+    Returns:
+        CubicSpline | None: Сплайн или None, если точек меньше двух
+    """
+    t = np.array(flight.t, dtype=np.float64)
+    values = np.array(getattr(flight, column), dtype=np.float64)
+    cached = flight.splines.get(column)
+    if (
+        cached is not None
+        and np.array_equal(cached[0], t)
+        and np.array_equal(cached[1], values, equal_nan=True)
+    ):
+        return cached[2]
+    spline = None
+    if len(t) >= 2:
+        from scipy.interpolate import CubicSpline
+
+        spline = CubicSpline(t, values)
+    flight.splines[column] = (t, values, spline)
+    return spline
+
+
+def resample(flight, grid: np.ndarray, column: str = "n") -> np.ndarray:
+    """
+    Значения столбца полета на заданной сетке времени.
+
+    Args:
+        flight (Flight | CompactFlight): Данные о полете
+        grid (np.ndarray): Сетка времени
+        column (str): Столбец: n, d или q
+
+    Returns:
+        np.ndarray: Значения на сетке, NaN вне времени полета
+    """
+    return resampleFlights([flight], grid, column)[0]
+
+
+def commonGrid(flights: list, count: int = 300) -> np.ndarray:
+    """
+    Равномерная сетка времени, покрывающая все полеты.
+
+    Args:
+        flights (list): Полеты (Flight или CompactFlight)
+        count (int): Количество точек
+
+    Returns:
+        np.ndarray: Сетка времени
+    """
+    times = [np.asarray(flight.t) for flight in flights if len(flight.t)]
+    if not times:
+        return np.empty(0)
+    start = min(t[0] for t in times)
+    end = max(t[-1] for t in times)
+    return np.linspace(start, end, count)
+
+
+def resampleFlights(flights: list, grid: np.ndarray, column: str = "n") -> np.ndarray:
+    """
+    Переносит столбец всех полетов на общую сетку времени одним расчетом.
+
+    Коэффициенты сплайнов (flightSpline) дополняются до общей длины, после
+    чего отрезки для всех полетов и точек сетки находятся одним поиском, а
+    многочлены вычисляются на массивах.
+
+    Args:
+        flights (list): Полеты разной длины (Flight или CompactFlight)
+        grid (np.ndarray): Сетка времени, (G,)
+        column (str): Столбец: n, d или q
+
+    Returns:
+        np.ndarray: Значения, (F, G); NaN до начала и после завершения полета
+    """
+    grid = np.asarray(grid, dtype=np.float64)
+    result = np.full((len(flights), len(grid)), np.nan)
+    splines = [flightSpline(flight, column) for flight in flights]
+    rows = [i for i, spline in enumerate(splines) if spline is not None]
+
+    # Полеты из одной точки: значение только в момент этой точки
+    for i, spline in enumerate(splines):
+        if spline is None and len(flights[i].t):
+            value = np.asarray(getattr(flights[i], column), dtype=np.float64)[0]
+            result[i, grid == flights[i].t[0]] = value
+    if not rows or not len(grid):
+        return result
+
+    segments = max(len(splines[i].x) - 1 for i in rows)
+    count = len(rows)
+    knots = np.empty((count, segments + 1))
+    coefficients = np.zeros((count, 4, segments))
+    last = np.empty(count, dtype=np.int64)  # номер последнего отрезка
+    for row, i in enumerate(rows):
+        x, c = splines[i].x, splines[i].c
+        # Дополнение последним узлом сохраняет упорядоченность строки
+        knots[row, : len(x)] = x
+        knots[row, len(x) :] = x[-1]
+        coefficients[row, :, : c.shape[1]] = c
+        last[row] = len(x) - 2
+    start = knots[:, 0]
+    end = knots[:, -1]
+
+    # Поиск отрезков для всех полетов сразу: строки сдвигаются на непересекающиеся
+    # интервалы, и выполняется один searchsorted по объединенному массиву
+    low = min(start.min(), grid.min())
+    span = max(end.max(), grid.max()) - low + 1.0
+    offset = span * np.arange(count)[:, None]
+    flat = (knots - low + offset).ravel()
+    shifted = (grid[None, :] - low + offset).ravel()
+    found = np.searchsorted(flat, shifted, side="right").reshape(count, len(grid))
+    segment = found - 1 - (segments + 1) * np.arange(count)[:, None]
+    segment = np.clip(segment, 0, last[:, None])
+
+    take = np.arange(count)[:, None]
+    dx = grid[None, :] - knots[take, segment]
+    values = coefficients[take, 0, segment]
+    for power in range(1, 4):
+        values = values * dx + coefficients[take, power, segment]
+    inside = (grid[None, :] >= start[:, None]) & (grid[None, :] <= end[:, None])
+    result[rows] = np.where(inside, values, np.nan)
+    return result
@@ -1,6 +1,9 @@
 from math import sqrt, acos
-import matplotlib.pyplot as plt
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import numpy as np
+
+from instrument import Instrumentation, instrumented
+from termination import Outcome
 
 # Константы моделирования
 D0 = 2500  # начальное расстояние между целью и перехватчиком (м)
@@ -12,6 +15,21 @@ DELTA_T = 1  # время между корректировкой (с)
 Q0 = 90  # начальный угол ракурса цели
 
 
+@dataclass(frozen=True)
+class SimulationConfig:
+    """Класс для хранения параметров моделирования одного перехвата."""
+
+    d0: float = D0  # начальное расстояние между целью и перехватчиком (м)
+    r: float = R  # радиус траектории движения цели (м)
+    aim_velocity: float = AIM_VELOCITY  # скорость движения цели (м / c)
+    interceptor_velocity: float = INTERCEPTOR_VELOCITY  # скорость перехватчика (м / с)
+    delta_t: float = DELTA_T  # время между корректировкой (с)
+    q0: float = Q0  # начальный угол ракурса цели
+
+
+DEFAULT_CONFIG = SimulationConfig()
+
+
 @dataclass
 class Point:
     """Класс для представления точки в 2D пространстве."""
@@ -20,15 +38,182 @@ class Point:
     y: float
 
 
+class Trajectory:
+    """
+    Класс для хранения траектории в непрерывном буфере float64 формы (capacity, 2).
+
+    При заполнении буфер увеличивается вдвое. Индексация целым числом
+    возвращает Point, поэтому код, написанный для list[Point], продолжает
+    работать. Свойства xs и ys - представления буфера без копирования
+    (действительны до следующего расширения буфера).
+    """
+
+    def __init__(self, points=(), capacity: int = 16):
+        points = list(points)
+        self._buffer = np.empty((max(capacity, len(points), 1), 2))
+        self._size = 0
+        for point in points:
+            self.appendXY(point.x, point.y)
+
+    @classmethod
+    def fromArray(cls, points: np.ndarray) -> "Trajectory":
+        """
+        Создает траекторию поверх готового массива (capacity, 2) без копирования.
+
+        Массив может быть доступен только для чтения (например, отображен в
+        память): при добавлении точки буфер будет скопирован и расширен.
+
+        Args:
+            points (np.ndarray): Массив точек формы (len, 2)
+
+        Returns:
+            Trajectory: Траектория, использующая этот массив как буфер
+        """
+        trajectory = cls.__new__(cls)
+        trajectory._buffer = points
+        trajectory._size = len(points)
+        return trajectory
+
+    def appendXY(self, x: float, y: float):
+        """
+        Добавляет точку в конец траектории.
+
+        Args:
+            x (float): Координата x
+            y (float): Координата y
+        """
+        if self._size == len(self._buffer):
+            buffer = np.empty((max(2 * len(self._buffer), 1), 2))
+            buffer[: self._size] = self._buffer[: self._size]
+            self._buffer = buffer
+        self._buffer[self._size, 0] = x
+        self._buffer[self._size, 1] = y
+        self._size += 1
+
+    def append(self, point: Point):
+        """
+        Добавляет точку в конец траектории.
+
+        Args:
+            point (Point): Добавляемая точка
+        """
+        self.appendXY(point.x, point.y)
+
+    @property
+    def xs(self) -> np.ndarray:
+        """Координаты x всех точек (без копирования)."""
+        return self._buffer[: self._size, 0]
+
+    @property
+    def ys(self) -> np.ndarray:
+        """Координаты y всех точек (без копирования)."""
+        return self._buffer[: self._size, 1]
+
+    @property
+    def points(self) -> np.ndarray:
+        """Массив точек формы (len, 2) (без копирования)."""
+        return self._buffer[: self._size]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("индекс вне траектории")
+        x, y = self._buffer[index].tolist()
+        return Point(x, y)
+
+    def __iter__(self):
+        for x, y in self.points.tolist():
+            yield Point(x, y)
+
+    def __repr__(self) -> str:
+        return f"Trajectory({list(self)})"
+
+
+class TrajectoryWindow(Trajectory):
+    """
+    Класс для хранения первой и последних window точек траектории.
+
+    Занимает постоянный объем памяти независимо от длины полета. Доступны
+    индексы [0] и последние window точек ([-1], [-2], ...), len() возвращает
+    полное количество добавленных точек.
+    """
+
+    def __init__(self, points=(), window: int = 2):
+        self._window = window
+        super().__init__(points, capacity=window + 1)
+
+    def appendXY(self, x: float, y: float):
+        """
+        Добавляет точку, вытесняя самую старую точку окна.
+
+        Args:
+            x (float): Координата x
+            y (float): Координата y
+        """
+        rows = len(self._buffer)
+        if self._size < rows:
+            self._buffer[self._size, 0] = x
+            self._buffer[self._size, 1] = y
+        else:
+            # Нулевая строка - первая точка траектории, она не вытесняется
+            self._buffer[1:-1] = self._buffer[2:]
+            self._buffer[-1, 0] = x
+            self._buffer[-1, 1] = y
+        self._size += 1
+
+    @property
+    def points(self) -> np.ndarray:
+        """Хранимые точки: первая и последние window (без копирования)."""
+        return self._buffer[: min(self._size, len(self._buffer))]
+
+    @property
+    def xs(self) -> np.ndarray:
+        """Координаты x хранимых точек (без копирования)."""
+        return self.points[:, 0]
+
+    @property
+    def ys(self) -> np.ndarray:
+        """Координаты y хранимых точек (без копирования)."""
+        return self.points[:, 1]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            raise TypeError("TrajectoryWindow не поддерживает срезы")
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("индекс вне траектории")
+        if index > 0:
+            index -= self._size - len(self.points)
+            if index < 1:
+                raise IndexError("точка вытеснена из окна траектории")
+        x, y = self._buffer[index].tolist()
+        return Point(x, y)
+
+    def __iter__(self):
+        raise TypeError("TrajectoryWindow не хранит всю траекторию")
+
+
 @dataclass
 class Role:
     """Класс для представления роли (цели или перехватчика)."""
 
     velocity: float
-    trajectory: list[Point]
+    trajectory: Trajectory
     x_indent: float
     y_indent: float
 
+    def __post_init__(self):
+        # Список точек преобразуется в Trajectory
+        if not isinstance(self.trajectory, Trajectory):
+            self.trajectory = Trajectory(self.trajectory)
+
 
 @dataclass
 class Flight:
@@ -40,68 +225,182 @@ class Flight:
     q: list[float]  # углы ракурса
     phi: list[float]  # углы визирования
     t: list[float]  # временные метки
+    outcome: Outcome | None = None  # итог моделирования
+    stats: Instrumentation | None = None  # время и вызовы по фазам шага
+    # Кэш сплайнов столбцов по времени (resample.py)
+    splines: dict = field(default_factory=dict, repr=False, compare=False)
 
 
-def saveFlightData(path: str, flight: Flight):
+@dataclass(slots=True)
+class Step:
+    """Класс для хранения состояния перехвата на одном шаге моделирования."""
+
+    t: float  # время
+    aim_x: float  # координата x цели
+    aim_y: float  # координата y цели
+    interceptor_x: float  # координата x перехватчика
+    interceptor_y: float  # координата y перехватчика
+    d: float  # расстояние до цели в начале шага
+    q: float  # угол ракурса
+    n: float  # перегрузка
+
+
+def windowRole(role: Role) -> Role:
     """
-    Сохранить информацию о полете в текстовый файл.
+    Создает копию роли, хранящую только первую и две последние точки траектории.
 
     Args:
-        path (str): Объект цели
-        flight (Flight): Объект перехватчика
+        role (Role): Исходная роль
+
+    Returns:
+        Role: Роль с TrajectoryWindow, начинающаяся с текущей позиции
     """
-    file = open(path, "w")
-    file.write(f"шагов: {flight.steps}\n")
-    file.write("\n")
-    file.write(f"расстояние до цели: {flight.d}\n")
-    file.write("\n")
-    file.write(f"угл q: {flight.q}\n")
-    file.write("\n")
-    file.write(f"перегрузка: {flight.n}")
+    return Role(
+        role.velocity,
+        TrajectoryWindow([role.trajectory[-1]]),
+        role.x_indent,
+        role.y_indent,
+    )
 
 
-def draw(aim: Role, interceptor: Role, i: int):
+def makeStep(t: float, aim: Role, interceptor: Role, d: float, q: float, n: float):
     """
-    Отрисовывает текущее состояние системы на графике.
+    Создает запись шага по текущим позициям цели и перехватчика.
 
     Args:
+        t (float): Время
         aim (Role): Объект цели
         interceptor (Role): Объект перехватчика
-        i (int): Номер текущего шага
+        d (float): Расстояние до цели в начале шага
+        q (float): Угол ракурса
+        n (float): Перегрузка
+
+    Returns:
+        Step: Запись шага
+    """
+    aim_point = aim.trajectory[-1]
+    inter_point = interceptor.trajectory[-1]
+    return Step(t, aim_point.x, aim_point.y, inter_point.x, inter_point.y, d, q, n)
+
+
+def recordSteps(
+    steps,
+    aim: Role,
+    interceptor: Role,
+    flight: Flight,
+    writer=None,
+    draw_step=None,
+):
     """
+    Записывает шаги генератора в траектории и flight и передает их дальше.
 
-    if len(interceptor.trajectory) > 1:
-        # Отрисовка траектории перехватчика между предыдущей и текущей точками
-        line_x = [interceptor.trajectory[i - 1].x, interceptor.trajectory[i].x]
-        line_y = [interceptor.trajectory[i - 1].y, interceptor.trajectory[i].y]
-        plt.plot(line_x, line_y, color="black", linewidth=1.5)
-
-    if aim.trajectory and interceptor.trajectory:
-        # Отрисовка линии визирования (перехватчик-цель)
-        line_x = [interceptor.trajectory[-1].x, aim.trajectory[-1].x]
-        line_y = [interceptor.trajectory[-1].y, aim.trajectory[-1].y]
-        plt.plot(line_x, line_y, color="black", linewidth=0.5)
-
-    # Отрисовка точки перехватчика с меткой
-    plt.plot(
-        interceptor.trajectory[i].x,
-        interceptor.trajectory[i].y,
-        marker=".",
-        color="black",
-    )
-    plt.text(
-        interceptor.trajectory[i].x + interceptor.x_indent,
-        interceptor.trajectory[i].y + interceptor.y_indent,
-        "П" + str(i),
-    )
+    Общая часть recordFlight и моделирования в реальном времени (realtime.py):
+    шаг отдается потребителю после записи. Значение, возвращаемое генератором
+    шагов (Outcome), записывается в flight.outcome и возвращается.
 
-    # Отрисовка точки цели с меткой
-    plt.plot(aim.trajectory[i].x, aim.trajectory[i].y, marker="*", color="red")
-    plt.text(
-        aim.trajectory[i].x + aim.x_indent,
-        aim.trajectory[i].y + aim.y_indent,
-        "Ц" + str(i),
-    )
+    Args:
+        steps: Генератор записей Step
+        aim (Role): Объект цели, в траекторию которого добавляются точки
+        interceptor (Role): Объект перехватчика
+        flight (Flight): Объект, в который добавляются данные о полете
+        writer (FlightWriter | None): Потоковая запись шагов в архив (storage.py)
+        draw_step: Функция (aim, interceptor, step), вызываемая перед записью шага
+
+    Yields:
+        Step: Записанный шаг
+
+    Returns:
+        Outcome: Итог моделирования
+    """
+    if writer is not None:
+        writer.append("aim", aim.trajectory[-1])
+        writer.append("interceptor", interceptor.trajectory[-1])
+    step: int = 0  # счетчик шагов
+    while True:
+        try:
+            record = next(steps)
+        except StopIteration as stop:
+            flight.outcome = stop.value
+            break
+        if draw_step is not None:
+            draw_step(aim, interceptor, step)
+        aim.trajectory.appendXY(record.aim_x, record.aim_y)
+        interceptor.trajectory.appendXY(record.interceptor_x, record.interceptor_y)
+        flight.n.append(record.n)
+        flight.d.append(record.d)
+        flight.q.append(record.q)
+        flight.t.append(record.t)
+        if writer is not None:
+            writer.appendStep(
+                record.t,
+                record.n,
+                record.d,
+                record.q,
+                aim.trajectory[-1],
+                interceptor.trajectory[-1],
+            )
+        step += 1
+        yield record
+    flight.steps = step
+    if writer is not None and flight.outcome is not None:
+        writer.meta["outcome"] = flight.outcome.value
+    return flight.outcome
+
+
+def recordFlight(
+    steps,
+    aim: Role,
+    interceptor: Role,
+    flight: Flight,
+    headless: bool,
+    writer=None,
+    stats: Instrumentation | None = None,
+) -> Flight:
+    """
+    Собирает данные о полете и траектории из генератора шагов.
+
+    Значение, возвращаемое генератором (Outcome), записывается в flight.outcome.
+
+    Args:
+        steps: Генератор записей Step
+        aim (Role): Объект цели, в траекторию которого добавляются точки
+        interceptor (Role): Объект перехватчика
+        flight (Flight): Объект, в который добавляются данные о полете
+        headless (bool): Только записывать состояние, без отрисовки на каждом шаге
+        writer (FlightWriter | None): Потоковая запись шагов в архив (storage.py)
+        stats (Instrumentation | None): Сбор времени отрисовки (фаза draw),
+            записывается в flight.stats
+
+    Returns:
+        Flight: Заполненный объект с данными о полете
+    """
+    draw_step = None
+    if not headless:
+        from plotting import draw
+
+        (draw_step,) = instrumented(stats, draw=draw)
+    flight.stats = stats
+    for _ in recordSteps(steps, aim, interceptor, flight, writer, draw_step):
+        pass
+    return flight
+
+
+def saveFlightData(path: str, flight: Flight):
+    """
+    Сохранить информацию о полете в текстовый файл.
+
+    Args:
+        path (str): Объект цели
+        flight (Flight): Объект перехватчика
+    """
+    with open(path, "w") as file:
+        file.write(f"шагов: {flight.steps}\n")
+        file.write("\n")
+        file.write(f"расстояние до цели: {flight.d}\n")
+        file.write("\n")
+        file.write(f"угл q: {flight.q}\n")
+        file.write("\n")
+        file.write(f"перегрузка: {flight.n}")
 
 
 def angleBetween(vec1: Point, vec2: Point) -> float:
@@ -160,21 +459,6 @@ def correctionAngle(aim: Role, interceptor: Role, pres: int) -> float:
     return angle
 
 
-def destroy(aim: Role, interceptor: Role):
-    """
-    Отрисовывает линию поражения цели.
-
-    Args:
-        aim (Role): Объект цели
-        interceptor (Role): Объект перехватчика
-    """
-    # Отрисовка линии от предпоследней позиции перехватчика к предпоследней позиции цели
-    line_x = [interceptor.trajectory[-2].x, aim.trajectory[-2].x]
-    line_y = [interceptor.trajectory[-2].y, aim.trajectory[-2].y]
-    plt.plot(line_x, line_y, color="black", linewidth="1.5")
-    plt.plot(aim.trajectory[-2].x, aim.trajectory[-2].y, color="orange", marker="X")
-
-
 def distanceBetween(p1: Point, p2: Point) -> float:
     """
     Вычисляет расстояние между двумя точками.
@@ -207,13 +491,14 @@ def makeVector(p1: Point, p2: Point) -> Point:
     return Point(x, y)
 
 
-def findQAngle(aim: Role, interceptor: Role):
+def findQAngle(aim: Role, interceptor: Role, config: SimulationConfig = DEFAULT_CONFIG):
     """
     Находит угол ракурса между целью и перехватчиком.
 
     Args:
         aim (Role): Объект цели
         interceptor (Role): Объект перехватчика
+        config (SimulationConfig): Параметры моделирования
 
     Returns:
         float: Угол ракурса в радианах
@@ -223,7 +508,7 @@ def findQAngle(aim: Role, interceptor: Role):
         aim_moving_vec = makeVector(aim.trajectory[-2], aim.trajectory[-1])
         q = angleBetween(d0_vec, aim_moving_vec)
     else:
-        q = Q0
+        q = config.q0
     return q
 
 
@@ -247,17 +532,14 @@ def findPhiAngle(aim: Role, interceptor: Role):
     return phi
 
 
-def saveFig(path: str, x_label: str, y_label: str):
-    """
-    Сохраняет текущий график в файл.
+# Функции отрисовки перенесены в plotting.py; для совместимости они доступны
+# как shared.draw и т.д., но matplotlib загружается только при первом обращении
+_PLOTTING = ("draw", "drawEngagement", "destroy", "saveFig")
 
-    Args:
-        path (str): Путь для сохранения файла
-        x_label (str): Подпись оси X
-        y_label (str): Подпись оси Y
-    """
-    # Настройка и сохранение графика
-    plt.xlabel(x_label)
-    plt.ylabel(y_label)
-    plt.savefig(path)
-    plt.clf()
+
+def __getattr__(name: str):
+    if name in _PLOTTING:
+        import plotting
+
+        return getattr(plotting, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
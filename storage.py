@@ -0,0 +1,225 @@
+import json
+import os
+
+import numpy as np
+
+from shared import Flight, Point, Trajectory
+from termination import Outcome
+
+# Столбцы архива полета: имя -> форма одной записи
+COLUMNS = {
+    "t": (),
+    "n": (),
+    "d": (),
+    "q": (),
+    "phi": (),
+    "aim": (2,),
+    "interceptor": (2,),
+}
+
+
+def _writeHeader(file, shape: tuple):
+    """Записывает заголовок .npy для столбца float64 заданной формы."""
+    np.lib.format.write_array_header_1_0(
+        file, {"descr": "<f8", "fortran_order": False, "shape": shape}
+    )
+
+
+class FlightWriter:
+    """
+    Класс для потоковой записи полета в каталог со столбцами .npy.
+
+    Каждый столбец (COLUMNS) хранится в отдельном файле <столбец>.npy,
+    данные дописываются в конец файла порциями по chunk_size записей.
+    При закрытии в заголовки записываются итоговые размеры, а в meta.json -
+    количество шагов и дополнительные сведения о полете.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 4096, meta: dict | None = None):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.chunk_size = chunk_size
+        self.meta = dict(meta or {})
+        self._files = {}
+        self._headers = {}
+        self._counts = {}
+        self._buffers = {}
+        for column, shape in COLUMNS.items():
+            file = open(os.path.join(path, column + ".npy"), "wb")
+            _writeHeader(file, (0,) + shape)
+            self._files[column] = file
+            self._headers[column] = file.tell()
+            self._counts[column] = 0
+            self._buffers[column] = []
+
+    def append(self, column: str, value):
+        """
+        Добавляет одну запись в столбец.
+
+        Args:
+            column (str): Имя столбца
+            value: Число или точка (для столбцов aim и interceptor)
+        """
+        if isinstance(value, Point):
+            value = (value.x, value.y)
+        buffer = self._buffers[column]
+        buffer.append(value)
+        if len(buffer) >= self.chunk_size:
+            self._flushColumn(column)
+
+    def extend(self, column: str, values):
+        """
+        Добавляет несколько записей в столбец.
+
+        Args:
+            column (str): Имя столбца
+            values: Последовательность чисел, точек или массив
+        """
+        if isinstance(values, Trajectory):
+            values = values.points
+        if isinstance(values, np.ndarray):
+            self._flushColumn(column)
+            self._writeColumn(column, values)
+        else:
+            for value in values:
+                self.append(column, value)
+
+    def appendStep(
+        self, t: float, n: float, d: float, q: float, aim: Point, interceptor: Point
+    ):
+        """
+        Добавляет запись одного шага моделирования.
+
+        Args:
+            t (float): Время
+            n (float): Перегрузка
+            d (float): Расстояние
+            q (float): Угол ракурса
+            aim (Point): Позиция цели
+            interceptor (Point): Позиция перехватчика
+        """
+        self.append("t", t)
+        self.append("n", n)
+        self.append("d", d)
+        self.append("q", q)
+        self.append("aim", aim)
+        self.append("interceptor", interceptor)
+
+    def _writeColumn(self, column: str, values):
+        """Дописывает значения в файл столбца."""
+        data = np.asarray(values, dtype="<f8").reshape((-1,) + COLUMNS[column])
+        self._files[column].write(data.tobytes())
+        self._counts[column] += len(data)
+
+    def _flushColumn(self, column: str):
+        """Сбрасывает буфер столбца в файл."""
+        buffer = self._buffers[column]
+        if buffer:
+            self._writeColumn(column, buffer)
+            buffer.clear()
+
+    def flush(self):
+        """Сбрасывает буферы всех столбцов в файлы."""
+        for column in COLUMNS:
+            self._flushColumn(column)
+            self._files[column].flush()
+
+    def close(self):
+        """Дописывает буферы, обновляет заголовки и сохраняет meta.json."""
+        if not self._files:
+            return
+        self.flush()
+        for column, file in self._files.items():
+            file.seek(0)
+            _writeHeader(file, (self._counts[column],) + COLUMNS[column])
+            length = file.tell()
+            file.close()
+            if length != self._headers[column]:
+                raise RuntimeError(f"заголовок столбца {column} изменил длину")
+        self._files = {}
+        self.meta.setdefault("steps", self._counts["t"])
+        with open(os.path.join(self.path, "meta.json"), "w") as file:
+            json.dump(self.meta, file, ensure_ascii=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def writeFlight(
+    path: str, flight: Flight, aim=None, interceptor=None, meta: dict | None = None
+):
+    """
+    Сохраняет полет и траектории в каталог со столбцами .npy.
+
+    Args:
+        path (str): Путь к каталогу
+        flight (Flight): Данные о полете
+        aim (Role | None): Объект цели
+        interceptor (Role | None): Объект перехватчика
+        meta (dict | None): Дополнительные сведения для meta.json
+    """
+    meta = dict(meta or {})
+    meta["steps"] = flight.steps
+    if flight.outcome is not None:
+        meta["outcome"] = flight.outcome.value
+    with FlightWriter(path, meta=meta) as writer:
+        for column in ("t", "n", "d", "q", "phi"):
+            writer.extend(column, np.asarray(getattr(flight, column), dtype=float))
+        if aim is not None:
+            writer.extend("aim", aim.trajectory)
+        if interceptor is not None:
+            writer.extend("interceptor", interceptor.trajectory)
+
+
+def readFlight(path: str, mmap: bool = True) -> tuple[Flight, Trajectory, Trajectory]:
+    """
+    Загружает полет из каталога со столбцами .npy.
+
+    При mmap=True столбцы отображаются в память без копирования и чтения
+    всего файла.
+
+    Args:
+        path (str): Путь к каталогу
+        mmap (bool): Отображать ли файлы в память
+
+    Returns:
+        tuple[Flight, Trajectory, Trajectory]: Данные о полете (столбцы - массивы
+            NumPy) и траектории цели и перехватчика
+    """
+    mode = "r" if mmap else None
+    columns = {
+        column: np.load(os.path.join(path, column + ".npy"), mmap_mode=mode)
+        for column in COLUMNS
+    }
+    meta = readMeta(path)
+    flight = Flight(
+        columns["n"],
+        meta["steps"],
+        columns["d"],
+        columns["q"],
+        columns["phi"],
+        columns["t"],
+        Outcome(meta["outcome"]) if "outcome" in meta else None,
+    )
+    return (
+        flight,
+        Trajectory.fromArray(columns["aim"]),
+        Trajectory.fromArray(columns["interceptor"]),
+    )
+
+
+def readMeta(path: str) -> dict:
+    """
+    Загружает дополнительные сведения о полете.
+
+    Args:
+        path (str): Путь к каталогу
+
+    Returns:
+        dict: Содержимое meta.json
+    """
+    with open(os.path.join(path, "meta.json")) as file:
+        return json.load(file)
@@ -0,0 +1,442 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from envelope import (
+    METHODS,
+    Envelope,
+    envelopeMap,
+    evaluateCells,
+    loadEnvelope,
+    saveEnvelope,
+)
+from shared import AIM_VELOCITY, INTERCEPTOR_VELOCITY
+
+# Оси таблицы в порядке массивов Envelope
+AXES = ("ratio", "d0", "q0")
+# Шаг по времени таблицы по умолчанию: время перехвата кратно шагу, и при
+# DELTA_T = 1 с его скачки между соседними запросами больше TOLERANCE
+TABLE_DT = 0.05
+# Допустимая относительная ошибка ответа из таблицы по умолчанию
+TOLERANCE = 0.05
+
+
+@dataclass
+class SurrogateResult:
+    """Класс для хранения ответов суррогатной модели (массивы (N,))."""
+
+    captured: np.ndarray  # перехвачена ли цель
+    capture_time: np.ndarray  # время перехвата (с), NaN без перехвата
+    peak_overload: np.ndarray  # пиковая перегрузка, NaN без перехвата
+    error: np.ndarray  # оценка относительной ошибки интерполяции
+    simulated: np.ndarray  # ответ требует моделирования (получен им при fallback)
+
+
+# Смещения 8 узлов ячейки по осям, (3, 8)
+CORNERS = np.array([[(corner >> axis) & 1 for corner in range(8)] for axis in range(3)])
+# Величины таблицы в порядке строк Surrogate._table
+QUANTITIES = ("capture_time", "peak_overload")
+# Величины, которые таблица метода отвечает по умолчанию. Пиковая перегрузка
+# погони определяется расстоянием на последнем шаге и между узлами не гладкая
+TABLE_QUANTITIES = {"line": ("capture_time",), "parallel_line": QUANTITIES}
+
+
+def _locate(axis: np.ndarray, x: np.ndarray):
+    """
+    Ячейка оси и вес правого узла для каждой точки.
+
+    Returns:
+        tuple: Индекс левого узла, вес правого узла, точка вне оси
+    """
+    if len(axis) == 1:
+        return np.zeros(x.shape, dtype=np.int64), np.zeros(x.shape), x != axis[0]
+    index = np.clip(np.searchsorted(axis, x, side="right") - 1, 0, len(axis) - 2)
+    weight = (x - axis[index]) / (axis[index + 1] - axis[index])
+    outside = (x < axis[0]) | (x > axis[-1])
+    return index, weight, outside
+
+
+class Surrogate:
+    """
+    Суррогатная модель времени перехвата и пиковой перегрузки.
+
+    Таблица - карта зоны перехвата (envelope.py) на сетке отношение скоростей x
+    D0 x Q0. Запросы интерполируются полилинейно на массивах. Ошибка
+    интерполяции оценивается невязкой таблицы: для каждой оси внутри ячейки
+    берется наибольшая по узлам ячейки невязка |f[i] - (f[i-1] + f[i+1]) / 2|
+    (ошибка предсказания узла по соседям), невязки осей складываются. Оценка
+    проверяется на контрольных точках (validate): если у контрольной точки
+    ошибка больше tolerance, из таблицы берутся только ответы с оценкой меньше
+    ее оценки.
+
+    Перехват в пошаговом моделировании - дискретное событие, и вблизи границы
+    зоны перехвата таблица негладкая. Поэтому из таблицы берутся только ответы
+    в ячейках, где перехват есть во всех узлах ячейки и в узлах на один дальше
+    по каждой оси; остальные точки, точки вне таблицы и точки с оценкой
+    относительной ошибки больше tolerance вычисляются моделированием.
+    """
+
+    def __init__(
+        self,
+        envelope: Envelope,
+        stop=None,
+        dt: float = TABLE_DT,
+        max_steps: int = 10000,
+        validation=None,
+        holdout: int = 256,
+    ):
+        """
+        Args:
+            envelope (Envelope): Таблица
+            stop: Условие остановки, с которым построена таблица
+            dt (float): Шаг по времени таблицы
+            max_steps (int): Максимальное количество шагов
+            validation: Оценки и фактические ошибки контрольных точек, пара
+                массивов (2, holdout) (по умолчанию вычисляются validate)
+            holdout (int): Количество контрольных точек для validate
+        """
+        self.envelope = envelope
+        self.stop = METHODS[envelope.method][1] if stop is None else stop
+        self.dt = dt
+        self.max_steps = max_steps
+        self._axes = [np.asarray(getattr(envelope, axis)) for axis in AXES]
+        self._size = np.array(envelope.captured.shape)[:, None]
+        # Шаг плоского индекса по каждой оси
+        self._stride = np.array(
+            [
+                envelope.captured.shape[1] * envelope.captured.shape[2],
+                envelope.captured.shape[2],
+                1,
+            ]
+        )
+        self._captured = envelope.captured.ravel()
+        self._table = np.stack(
+            (envelope.capture_time.ravel(), envelope.peak_overload.ravel())
+        )
+        # Перехват во всех узлах окрестности ячейки с левым узлом i:
+        # узлы i - 1 ... i + 2 по каждой оси
+        safe = np.asarray(envelope.captured, dtype=bool)
+        for axis, size in enumerate(safe.shape):
+            node = np.arange(size)
+            safe = np.logical_and.reduce(
+                [
+                    np.take(safe, np.clip(node + shift, 0, size - 1), axis=axis)
+                    for shift in (-1, 0, 1, 2)
+                ]
+            )
+        self._safe = safe.ravel()
+        # Невязка линейной интерполяции узла по соседям вдоль каждой оси:
+        # |f[i] - (f[i-1] + f[i+1]) / 2|, у края оси - невязка соседнего узла
+        table = self._table.reshape(2, *envelope.captured.shape)
+        self._residual = []
+        for axis, size in enumerate(envelope.captured.shape):
+            if size < 3:
+                self._residual.append(None)
+                continue
+            center = np.clip(np.arange(size), 1, size - 2)
+            left, middle, right = (
+                np.take(table, center + shift, axis=axis + 1) for shift in (-1, 0, 1)
+            )
+            with np.errstate(invalid="ignore"):
+                residual = np.abs(middle - (left + right) / 2)
+            self._residual.append(residual.reshape(2, -1))
+        if validation is None:
+            self.validate(holdout)
+        else:
+            self.holdout_estimate, self.holdout_error = (
+                np.asarray(array, dtype=np.float64) for array in validation
+            )
+
+    def _estimate(self, weight: np.ndarray, flat: np.ndarray):
+        """
+        Оценка абсолютной ошибки интерполяции по невязке узлов ячейки.
+
+        Returns:
+            np.ndarray: Оценка для времени и перегрузки, (2, N); NaN или
+                бесконечность, если невязка не определена
+        """
+        absolute = np.zeros((2, weight.shape[1]))
+        for axis in range(3):
+            size = self._size[axis, 0]
+            inner = (weight[axis] > 0) & (weight[axis] < 1)
+            if size == 1 or not inner.any():
+                continue
+            if size == 2:
+                absolute[:, inner] = np.inf
+                continue
+            residual = self._residual[axis][:, flat].max(axis=1)
+            absolute += np.where(inner, residual, 0.0)
+        return absolute
+
+    def _interpolate(self, points: list[np.ndarray]):
+        """
+        Полилинейная интерполяция таблицы и оценка ее абсолютной ошибки.
+
+        Returns:
+            tuple: Перехват во всей окрестности ячейки (N,), значения (2, N),
+                оценка абсолютной ошибки (2, N), точка вне таблицы (N,)
+        """
+        located = [_locate(axis, x) for axis, x in zip(self._axes, points)]
+        index = np.stack([item[0] for item in located])  # (3, N)
+        weight = np.stack([item[1] for item in located])
+        outside = located[0][2] | located[1][2] | located[2][2]
+        base = self._stride @ index
+
+        # Полилинейная интерполяция по 8 узлам ячейки; узлы с нулевым весом
+        # (точка на грани ячейки) не учитываются
+        nodes = np.minimum(
+            index[:, None, :] + CORNERS[:, :, None], self._size[:, :, None] - 1
+        )
+        flat = np.tensordot(self._stride, nodes, axes=1)  # (8, N)
+        corner_weight = np.where(
+            CORNERS[:, :, None], weight[:, None, :], 1 - weight[:, None, :]
+        ).prod(axis=0)
+        used = corner_weight > 0
+        captured = self._safe[base]
+        with np.errstate(invalid="ignore"):
+            values = np.where(used, corner_weight * self._table[:, flat], 0.0).sum(
+                axis=1
+            )
+        values[:, ~captured] = np.nan
+        return captured, values, self._estimate(weight, flat), outside
+
+    def _simulate(self, points: list[np.ndarray], rows: np.ndarray):
+        """
+        Моделирует точки rows с параметрами таблицы (envelope.evaluateCells).
+
+        Returns:
+            tuple: Перехват, время перехвата, пиковая перегрузка, шаги
+        """
+        va = self.envelope.aim_velocity
+        return evaluateCells(
+            self.envelope.method,
+            np.full(len(rows), va),
+            va * points[0][rows],
+            points[1][rows],
+            points[2][rows],
+            self.stop,
+            self.dt,
+            self.max_steps,
+        )
+
+    def validate(self, count: int = 256, seed: int = 0) -> np.ndarray:
+        """
+        Сравнивает ответы таблицы с моделированием в контрольных точках.
+
+        Контрольные точки - случайные точки внутри ячеек, из которых таблица
+        может отвечать (перехват во всей окрестности), не совпадающие с узлами.
+        Если моделирование не подтверждает перехват, ошибка точки бесконечна.
+
+        Args:
+            count (int): Количество контрольных точек
+            seed (int): Зерно генератора случайных чисел
+
+        Returns:
+            np.ndarray: Фактические относительные ошибки времени и
+                перегрузки, (2, count)
+        """
+        self.holdout_estimate = np.zeros((len(QUANTITIES), 0))
+        self.holdout_error = np.zeros((len(QUANTITIES), 0))
+        shape = self.envelope.captured.shape
+        cells = self._safe.reshape(shape)[
+            tuple(slice(0, max(size - 1, 1)) for size in shape)
+        ]
+        left = np.flatnonzero(cells)
+        if count <= 0 or not len(left):
+            return self.holdout_error
+
+        rng = np.random.default_rng(seed)
+        index = np.unravel_index(rng.choice(left, count), cells.shape)
+        points = []
+        for axis, i in zip(self._axes, index):
+            if len(axis) == 1:
+                points.append(np.full(count, axis[0]))
+            else:
+                u = rng.uniform(0.05, 0.95, count)
+                points.append(axis[i] + u * (axis[i + 1] - axis[i]))
+        _, values, absolute, _ = self._interpolate(points)
+        captured, time, peak, _ = self._simulate(points, np.arange(count))
+
+        exact = np.stack((time, peak))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            actual = np.abs(values - exact) / np.abs(exact)
+            self.holdout_estimate = absolute / np.abs(values)
+        actual = np.where(np.isnan(actual), np.inf, actual)
+        actual[:, ~captured] = np.inf
+        self.holdout_error = actual
+        return self.holdout_error
+
+    def _threshold(self, tolerance: float) -> np.ndarray:
+        """
+        Граница оценки ошибки, подтвержденная контрольными точками.
+
+        Returns:
+            np.ndarray: Наименьшая оценка среди контрольных точек с ошибкой
+                больше tolerance для каждой величины, (2,)
+        """
+        failed = self.holdout_error > tolerance
+        estimate = np.where(failed, self.holdout_estimate, np.inf)
+        return np.where(np.isnan(estimate), -np.inf, estimate).min(
+            axis=1, initial=np.inf
+        )
+
+    def query(
+        self,
+        ratio,
+        d0,
+        q0,
+        tolerance: float = TOLERANCE,
+        fallback: bool = True,
+        quantities=None,
+    ) -> SurrogateResult:
+        """
+        Отвечает на запросы по таблице или моделированием.
+
+        Args:
+            ratio: Отношения скорости перехватчика к скорости цели
+            d0: Начальные расстояния
+            q0: Углы направления движения цели в градусах
+            tolerance (float): Допустимая относительная ошибка интерполяции
+            fallback (bool): Моделировать ли точки, которые нельзя взять из
+                таблицы (иначе для них возвращается NaN)
+            quantities: Величины из QUANTITIES, ошибка которых проверяется
+                (по умолчанию TABLE_QUANTITIES метода); остальные величины в
+                ответах из таблицы - NaN
+
+        Returns:
+            SurrogateResult: Ответы, форма - общая форма аргументов
+        """
+        if quantities is None:
+            quantities = TABLE_QUANTITIES[self.envelope.method]
+        ratio, d0, q0 = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (ratio, d0, q0))
+        )
+        shape = ratio.shape
+        points = [x.ravel() for x in (ratio, d0, q0)]
+        captured, values, absolute, outside = self._interpolate(points)
+
+        checked = np.isin(QUANTITIES, quantities)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            relative = absolute / np.abs(values)
+        relative = np.where(np.isnan(relative), np.inf, relative)
+        accepted = (relative <= tolerance) & (
+            relative < self._threshold(tolerance)[:, None]
+        )
+        error = relative[checked].max(axis=0, initial=0.0)
+        error = np.where(outside | ~captured, np.inf, error)
+        simulated = outside | ~captured | ~accepted[checked].all(axis=0)
+        values[~checked] = np.nan
+
+        time, peak = values
+        if fallback and simulated.any():
+            rows = np.flatnonzero(simulated)
+            sim_captured, sim_time, sim_peak, _ = self._simulate(points, rows)
+            captured[rows] = sim_captured
+            time[rows] = sim_time
+            peak[rows] = sim_peak
+            error[rows] = 0.0
+        elif simulated.any():
+            captured[simulated] = False
+            time[simulated] = np.nan
+            peak[simulated] = np.nan
+        return SurrogateResult(
+            captured.reshape(shape),
+            time.reshape(shape),
+            peak.reshape(shape),
+            error.reshape(shape),
+            simulated.reshape(shape),
+        )
+
+
+def buildSurrogate(
+    method: str,
+    d0,
+    q0,
+    ratio=(INTERCEPTOR_VELOCITY / AIM_VELOCITY,),
+    aim_velocity: float = AIM_VELOCITY,
+    stop=None,
+    dt: float = TABLE_DT,
+    max_steps: int = 10000,
+    jobs: int | None = None,
+    holdout: int = 256,
+) -> Surrogate:
+    """
+    Строит суррогатную модель моделированием всех узлов сетки (envelope.envelopeMap).
+
+    Оценка ошибки проверяется моделированием holdout контрольных точек
+    (Surrogate.validate).
+
+    Args:
+        method (str): Метод наведения: line (погоня) или parallel_line
+        d0: Узлы начального расстояния
+        q0: Узлы угла направления движения цели в градусах
+        ratio: Узлы отношения скорости перехватчика к скорости цели
+        aim_velocity (float): Скорость цели
+        stop: Условие остановки (по умолчанию как в main.py)
+        dt (float): Шаг по времени
+        max_steps (int): Максимальное количество шагов
+        jobs (int | None): Количество процессов
+        holdout (int): Количество контрольных точек для проверки оценки ошибки
+
+    Returns:
+        Surrogate: Суррогатная модель
+    """
+    envelope = envelopeMap(
+        method, d0, q0, ratio, aim_velocity, stop, dt, max_steps, jobs
+    )
+    return Surrogate(envelope, stop, dt, max_steps, holdout=holdout)
+
+
+def saveSurrogate(path: str, surrogate: Surrogate):
+    """
+    Сохраняет таблицу суррогатной модели в файл .npz.
+
+    Args:
+        path (str): Путь к файлу
+        surrogate (Surrogate): Суррогатная модель
+    """
+    envelope = surrogate.envelope
+    # Таблица хранится в float32: ошибка округления много меньше ошибки интерполяции
+    compact = Envelope(
+        envelope.method,
+        envelope.d0,
+        envelope.q0,
+        envelope.ratio,
+        envelope.aim_velocity,
+        envelope.captured,
+        envelope.capture_time.astype(np.float32),
+        envelope.peak_overload.astype(np.float32),
+        envelope.steps.astype(np.int32),
+    )
+    saveEnvelope(
+        path,
+        compact,
+        stop=surrogate.stop,
+        dt=surrogate.dt,
+        max_steps=surrogate.max_steps,
+        holdout_estimate=surrogate.holdout_estimate,
+        holdout_error=surrogate.holdout_error,
+    )
+
+
+def loadSurrogate(path: str) -> Surrogate:
+    """
+    Загружает суррогатную модель из файла .npz.
+
+    Args:
+        path (str): Путь к файлу
+
+    Returns:
+        Surrogate: Суррогатная модель
+    """
+    envelope = loadEnvelope(path)
+    envelope.capture_time = envelope.capture_time.astype(np.float64)
+    envelope.peak_overload = envelope.peak_overload.astype(np.float64)
+    with np.load(path) as data:
+        return Surrogate(
+            envelope,
+            data["stop"].item(),
+            float(data["dt"]),
+            int(data["max_steps"]),
+            (data["holdout_estimate"], data["holdout_error"]),
+        )
@@ -0,0 +1,193 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields, replace
+from itertools import product
+import os
+
+import numpy as np
+
+from motion import circleTarget, lineTarget
+import parallel
+import targeting
+from shared import DEFAULT_CONFIG, Point, Role, SimulationConfig
+from termination import DEFAULT_POLICY, TerminationPolicy
+
+# Методы наведения: имя -> (функция моделирования, движется ли цель по окружности)
+METHODS = {
+    "circle": (targeting.circleFight, True),
+    "line": (targeting.lineFight, False),
+    "parallel": (parallel.fight, True),
+    "parallel_line": (parallel.lineFight, False),
+}
+
+# Условие остановки по умолчанию: точность угла коррекции для метода погони
+# и расстояние до цели для параллельного сближения (как в main.py)
+DEFAULT_STOP = {"circle": 1, "line": 1, "parallel": 150, "parallel_line": 20}
+
+PARAMS = tuple(f.name for f in fields(SimulationConfig))
+
+
+def gridParams(**axes) -> list[dict]:
+    """
+    Строит декартово произведение значений параметров.
+
+    Args:
+        axes: Имя поля SimulationConfig -> список значений
+
+    Returns:
+        list[dict]: Наборы параметров для каждой точки сетки
+    """
+    names = list(axes)
+    return [dict(zip(names, values)) for values in product(*axes.values())]
+
+
+def randomParams(count: int, seed: int | None = None, **distributions) -> list[dict]:
+    """
+    Генерирует случайные наборы параметров.
+
+    Args:
+        count (int): Количество наборов
+        seed (int | None): Зерно генератора случайных чисел
+        distributions: Имя поля SimulationConfig -> пара (min, max) для
+            равномерного распределения или функция rng -> значение
+
+    Returns:
+        list[dict]: Наборы параметров
+    """
+    rng = np.random.default_rng(seed)
+    result = []
+    for _ in range(count):
+        params = {}
+        for name, dist in distributions.items():
+            if callable(dist):
+                params[name] = float(dist(rng))
+            else:
+                params[name] = float(rng.uniform(*dist))
+        result.append(params)
+    return result
+
+
+def runEngagement(
+    method: str,
+    config: SimulationConfig,
+    center: Point,
+    start: Point,
+    stop,
+    policy: TerminationPolicy | None = DEFAULT_POLICY,
+) -> tuple[float, int, float, float, str]:
+    """
+    Моделирует один перехват без отрисовки.
+
+    Позиции цели берутся из общей таблицы motion.py, поэтому перехваты с
+    одинаковым движением цели в одном процессе не пересчитывают ее.
+
+    Args:
+        method (str): Метод наведения (ключ METHODS)
+        config (SimulationConfig): Параметры моделирования
+        center (Point): Центр окружности движения цели
+        start (Point): Начальная фаза движения по окружности
+        stop: Условие остановки (точность угла коррекции или расстояние)
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+
+    Returns:
+        tuple: Время перехвата, количество шагов, пиковая перегрузка, конечное
+            расстояние и итог моделирования
+    """
+    fight, on_circle = METHODS[method]
+    aim = Role(config.aim_velocity, [Point(config.d0, 0)], 0, 0)
+    interceptor = Role(config.interceptor_velocity, [Point(0, 0)], 0, 0)
+    if on_circle:
+        motion = circleTarget(aim.velocity, center, start, config)
+        flight = fight(
+            aim,
+            interceptor,
+            center,
+            start,
+            stop,
+            headless=True,
+            config=config,
+            policy=policy,
+            motion=motion,
+        )
+    else:
+        motion = lineTarget(aim.velocity, config)
+        flight = fight(
+            aim,
+            interceptor,
+            stop,
+            headless=True,
+            config=config,
+            policy=policy,
+            motion=motion,
+        )
+    return (
+        flight.t[-1],
+        flight.steps,
+        max(flight.n),
+        flight.d[-1],
+        flight.outcome.value,
+    )
+
+
+def _runTask(args) -> tuple[float, int, float, float, str]:
+    """Точка входа рабочего процесса."""
+    return runEngagement(*args)
+
+
+def sweep(
+    method: str,
+    params: list[dict],
+    center: Point = Point(0, 0),
+    start: Point = Point(0, 0),
+    stop=None,
+    base: SimulationConfig = DEFAULT_CONFIG,
+    jobs: int | None = None,
+    chunksize: int | None = None,
+    policy: TerminationPolicy | None = DEFAULT_POLICY,
+) -> np.ndarray:
+    """
+    Моделирует перехваты для набора параметров в пуле процессов.
+
+    Args:
+        method (str): Метод наведения: circle, line, parallel или parallel_line
+        params (list[dict]): Наборы параметров (см. gridParams и randomParams)
+        center (Point): Центр окружности движения цели
+        start (Point): Начальная фаза движения по окружности
+        stop: Условие остановки (по умолчанию DEFAULT_STOP[method])
+        base (SimulationConfig): Значения параметров, не указанных в наборе
+        jobs (int | None): Количество процессов (1 - без пула, по умолчанию все ядра)
+        chunksize (int | None): Количество перехватов в одной задаче пула
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+            каждого перехвата
+
+    Returns:
+        np.ndarray: Структурированный массив: поля SimulationConfig, capture_time,
+            steps, peak_overload, final_distance, outcome
+    """
+    if method not in METHODS:
+        raise ValueError(f"неизвестный метод наведения: {method}")
+    if stop is None:
+        stop = DEFAULT_STOP[method]
+    configs = [replace(base, **p) for p in params]
+    tasks = [(method, config, center, start, stop, policy) for config in configs]
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs == 1 or len(tasks) <= 1:
+        rows = [_runTask(task) for task in tasks]
+    else:
+        if chunksize is None:
+            chunksize = max(1, len(tasks) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            rows = list(pool.map(_runTask, tasks, chunksize=chunksize))
+
+    dtype = [(name, np.float64) for name in PARAMS] + [
+        ("capture_time", np.float64),
+        ("steps", np.int64),
+        ("peak_overload", np.float64),
+        ("final_distance", np.float64),
+        ("outcome", "U16"),
+    ]
+    result = np.empty(len(tasks), dtype=dtype)
+    for i, (config, row) in enumerate(zip(configs, rows)):
+        result[i] = tuple(getattr(config, name) for name in PARAMS) + row
+    return result
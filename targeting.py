@@ -1,57 +1,74 @@
 from shared import (
-    R,
-    D0,
-    Q0,
-    DELTA_T,
+    DEFAULT_CONFIG,
     Flight,
     Point,
     Role,
-    draw,
-    correctionAngle,
-    findQAngle,
-    distanceBetween,
+    SimulationConfig,
+    recordFlight,
 )
+from dataclasses import dataclass
 from math import sin, cos, pi, sqrt, isclose
 
+import numpy as np
 
-def UpdatePointOnCircle(aim: Role, t: float, center: Point, start: Point):
+from analytic import analyticLineFight
+from engine import GuidanceLaw, engagementSteps
+from instrument import Instrumentation
+from kinematics import Kinematics
+from motion import TargetMotion
+from termination import Outcome, TerminationPolicy
+
+
+def UpdatePointOnCircle(
+    aim: Role,
+    t: float,
+    center: Point,
+    start: Point,
+    config: SimulationConfig = DEFAULT_CONFIG,
+):
     """
     Обновляет позицию цели, движущейся по круговой траектории.
 
     Args:
         aim (Role): Объект цели
         t (float): Текущее время
+        config (SimulationConfig): Параметры моделирования
     """
+    r = config.r
     # Угловая скорость: ω = v / r (рад/с)
-    omega = aim.velocity / R
+    omega = aim.velocity / r
     # Параметрические уравнения окружности: x = r*cos(ωt), y = r*sin(ωt)
-    x = R * cos(omega * t + start.x) + center.x
-    y = R * sin(omega * t + start.y) + center.y
-    aim.trajectory.append(Point(x, y))
+    x = r * cos(omega * t + start.x) + center.x
+    y = r * sin(omega * t + start.y) + center.y
+    aim.trajectory.appendXY(x, y)
 
 
-def UpdatePointOnLine(aim: Role, t: float):
+def UpdatePointOnLine(aim: Role, t: float, config: SimulationConfig = DEFAULT_CONFIG):
     """
     Обновляет позицию цели, движущейся по прямой траектории.
 
     Args:
         aim (Role): Объект цели
         t (float): Текущее время
+        config (SimulationConfig): Параметры моделирования
     """
-    QR = Q0 * pi / 180
+    QR = config.q0 * pi / 180
     s = aim.velocity * t
-    x = s * cos(QR) + D0
+    x = s * cos(QR) + config.d0
     y = s * sin(QR)
-    aim.trajectory.append(Point(x, y))
+    aim.trajectory.appendXY(x, y)
 
 
-def updateInterceptorPoint(interceptor: Role, aim: Role):
+def updateInterceptorPoint(
+    interceptor: Role, aim: Role, config: SimulationConfig = DEFAULT_CONFIG
+):
     """
     Обновляет позицию перехватчика, движущегося по направлению к цели.
 
     Args:
         interceptor (Role): Объект перехватчика
         aim (Role): Объект цели
+        config (SimulationConfig): Параметры моделирования
     """
     if interceptor.trajectory and aim.trajectory:
         current_x = interceptor.trajectory[-1].x
@@ -69,70 +86,171 @@ def updateInterceptorPoint(interceptor: Role, aim: Role):
         norm_vec_y = vec_y / vec_len
 
         # Расстояние, которое пролетит перехватчик за время delta_t
-        d = interceptor.velocity * DELTA_T
+        d = interceptor.velocity * config.delta_t
 
         # Новая позиция перехватчика: текущая позиция + перемещение по направлению к цели
         next_x = norm_vec_x * d + current_x
         next_y = norm_vec_y * d + current_y
 
-        interceptor.trajectory.append(Point(next_x, next_y))
+        interceptor.trajectory.appendXY(next_x, next_y)
+
+
+def updateInterceptorPoints(
+    interceptor: np.ndarray, aim: np.ndarray, velocity: np.ndarray, dt: float
+) -> np.ndarray:
+    """
+    Построчный аналог updateInterceptorPoint.
+
+    Args:
+        interceptor (np.ndarray): Текущие позиции перехватчиков, (N, 2)
+        aim (np.ndarray): Текущие позиции целей, (N, 2)
+        velocity (np.ndarray): Скорости перехватчиков, (N,)
+        dt (float): Шаг по времени
+
+    Returns:
+        np.ndarray: Новые позиции перехватчиков, (N, 2)
+    """
+    vec = aim - interceptor
+    vec_len = np.sqrt(vec[:, 0] ** 2 + vec[:, 1] ** 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        norm_vec = np.nan_to_num(vec / vec_len[:, None])
+    return norm_vec * (velocity * dt)[:, None] + interceptor
+
+
+@dataclass
+class Pursuit(GuidanceLaw):
+    """
+    Метод погони: перехватчик на каждом шаге движется прямо на цель.
 
+    Перехват - угол коррекции, округленный до pres знаков, равен 0, а
+    расстояние в начале шага меньше перемещения перехватчика за шаг.
+    """
 
-def overloadLineTargeting(aim: Role, interceptor: Role, q: float) -> float:
+    pres: int = 1  # точность округления угла коррекции
+
+    def start(self, velocity, dt: float):
+        self._s = velocity * dt
+
+    def move(
+        self,
+        aim: Role,
+        interceptor: Role,
+        t: float,
+        config: SimulationConfig,
+        state: Kinematics | None,
+    ):
+        updateInterceptorPoint(interceptor, aim, config)
+
+    def moveBatch(self, aim_prev, aim, interceptor, velocity, t, dt, state):
+        return updateInterceptorPoints(interceptor, aim, velocity, dt)
+
+    def captured(self, state: Kinematics, distance: float) -> bool:
+        return round(state.correction, self.pres) == 0 and distance < self._s
+
+    def capturedBatch(self, state, distance: np.ndarray) -> np.ndarray:
+        return (np.round(state.correction, self.pres) == 0) & (distance < self._s)
+
+
+def circleFightSteps(
+    aim: Role,
+    interceptor: Role,
+    center: Point,
+    start: Point,
+    pres: int,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    policy: TerminationPolicy | None = None,
+    stats: Instrumentation | None = None,
+    motion: TargetMotion | None = None,
+):
     """
-    Вычисляет необходимую перегрузку для перехвата цели, движущейся по прямой.
+    Генератор шагов перехвата цели, движущейся по круговой траектории.
+
+    Хранит только первую и две последние точки траекторий, поэтому занимает
+    постоянный объем памяти. Траектории переданных ролей не изменяются.
 
     Args:
         aim (Role): Объект цели
         interceptor (Role): Объект перехватчика
-        q (float): Угол между векторами скорости цели и перехватчика
+        center (Point): Центр окружности
+        start (Point): Начальная фаза движения по окружности
+        pres (int): Точность округления угла коррекции
+        config (SimulationConfig): Параметры моделирования
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+        stats (Instrumentation | None): Сбор времени и вызовов по фазам шага
+        motion (TargetMotion | None): Таблица движения цели (motion.py) вместо
+            пошагового расчета позиции цели
+
+    Yields:
+        Step: Состояние перехвата на очередном шаге
 
     Returns:
-        float: Значение необходимой перегрузки
-    """
-    if aim.trajectory and interceptor.trajectory:
-        Q = q * pi / 180
-        G = 9.8
-        delta_x2 = aim.trajectory[-1].x ** 2 - interceptor.trajectory[-1].x ** 2
-        delta_y2 = aim.trajectory[-1].y ** 2 - interceptor.trajectory[-1].y ** 2
-        D = sqrt(abs(delta_x2 + delta_y2))
-        try:
-            n: float = (interceptor.velocity * aim.velocity * sin(Q)) / (G * D)
-        except ZeroDivisionError:
-            n: float = 0
+        Outcome: Итог моделирования
+    """
+    if motion is None:
+        target = lambda aim, t: UpdatePointOnCircle(aim, t, center, start, config)
     else:
-        n: float = 0
-    return n
-
-
-def overloadCircleTargeting(aim: Role, interceptor: Role, q: float) -> float:
+        target = motion.updater()
+    return (
+        yield from engagementSteps(
+            aim, interceptor, target, Pursuit(pres), config, policy, stats
+        )
+    )
+
+
+def lineFightSteps(
+    aim: Role,
+    interceptor: Role,
+    pres,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    policy: TerminationPolicy | None = None,
+    stats: Instrumentation | None = None,
+    motion: TargetMotion | None = None,
+):
     """
-    Вычисляет необходимую перегрузку для перехвата цели, движущейся по окружности.
+    Генератор шагов перехвата цели, движущейся по прямой траектории.
+
+    Хранит только первую и две последние точки траекторий, поэтому занимает
+    постоянный объем памяти. Траектории переданных ролей не изменяются.
 
     Args:
         aim (Role): Объект цели
         interceptor (Role): Объект перехватчика
-        q (float): Угол между векторами скорости цели и перехватчика
+        pres (int): Точность округления угла коррекции
+        config (SimulationConfig): Параметры моделирования
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+        stats (Instrumentation | None): Сбор времени и вызовов по фазам шага
+        motion (TargetMotion | None): Таблица движения цели (motion.py) вместо
+            пошагового расчета позиции цели
+
+    Yields:
+        Step: Состояние перехвата на очередном шаге
 
     Returns:
-        float: Значение необходимой перегрузки
-    """
-    n: float = 0
-    if aim.trajectory and interceptor.trajectory:
-        Q = q * pi / 180
-        G = 9.8
-        delta_x = aim.trajectory[-1].x - interceptor.trajectory[-1].x
-        delta_y = aim.trajectory[-1].y - interceptor.trajectory[-1].y
-        D = sqrt(delta_x**2 + delta_y**2)
-        try:
-            n: float = (interceptor.velocity * abs(aim.velocity) * sin(Q)) / (G * D)
-        except ZeroDivisionError:
-            n: float = interceptor.velocity**2 / (G * R)
-    return n
+        Outcome: Итог моделирования
+    """
+    if motion is None:
+        target = lambda aim, t: UpdatePointOnLine(aim, t, config)
+    else:
+        target = motion.updater()
+    return (
+        yield from engagementSteps(
+            aim, interceptor, target, Pursuit(pres), config, policy, stats
+        )
+    )
 
 
 def circleFight(
-    aim: Role, interceptor: Role, center: Point, start: Point, pres: int
+    aim: Role,
+    interceptor: Role,
+    center: Point,
+    start: Point,
+    pres: int,
+    headless: bool = False,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    writer=None,
+    policy: TerminationPolicy | None = None,
+    stats: Instrumentation | None = None,
+    motion: TargetMotion | None = None,
 ) -> Flight:
     """
     Моделирует процесс перехвата цели, движущейся по круговой траектории.
@@ -140,70 +258,74 @@ def circleFight(
     Args:
         aim (Role): Объект цели
         interceptor (Role): Объект перехватчика
+        headless (bool): Только записывать состояние, без отрисовки на каждом шаге
+        config (SimulationConfig): Параметры моделирования
+        writer (FlightWriter | None): Потоковая запись шагов в архив (storage.py)
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+        stats (Instrumentation | None): Сбор времени и вызовов по фазам шага,
+            результат доступен в flight.stats
+        motion (TargetMotion | None): Таблица движения цели (motion.py) вместо
+            пошагового расчета позиции цели
 
     Returns:
         Flight: Объект с данными о полете (траектория, перегрузки, расстояния и т.д.)
     """
     flight = Flight([], 0, [], [], [], [])
-    t = DELTA_T  # начальное время
-    step: int = 0  # счетчик шагов
-    distance = D0
-    s = interceptor.velocity * DELTA_T
-
-    # Цикл продолжается до тех пор, пока угол коррекции не станет равным 0
-    while True:
-        draw(aim, interceptor, step)
-        distance = distanceBetween(aim.trajectory[-1], interceptor.trajectory[-1])
-        UpdatePointOnCircle(aim, t, center, start)
-        updateInterceptorPoint(interceptor, aim)
-        qi = findQAngle(aim, interceptor)
-
-        flight.n.append(overloadCircleTargeting(aim, interceptor, qi))
-        flight.d.append(distance)
-        flight.q.append(qi)
-        flight.t.append(t)
-        t += DELTA_T
-        step += 1
-        if correctionAngle(aim, interceptor, pres) == 0 and distance < s:
-            break
-
-    flight.steps = step
-    return flight
-
-
-def lineFight(aim: Role, interceptor: Role, pres) -> Flight:
+    steps = circleFightSteps(
+        aim, interceptor, center, start, pres, config, policy, stats, motion
+    )
+    return recordFlight(steps, aim, interceptor, flight, headless, writer, stats)
+
+
+def lineFight(
+    aim: Role,
+    interceptor: Role,
+    pres,
+    headless: bool = False,
+    config: SimulationConfig = DEFAULT_CONFIG,
+    analytic: bool = False,
+    writer=None,
+    policy: TerminationPolicy | None = None,
+    stats: Instrumentation | None = None,
+    motion: TargetMotion | None = None,
+) -> Flight:
     """
     Моделирует процесс перехвата цели, движущейся по прямой траектории.
 
     Args:
         aim (Role): Объект цели
         interceptor (Role): Объект перехватчика
+        headless (bool): Только записывать состояние, без отрисовки на каждом шаге
+        config (SimulationConfig): Параметры моделирования
+        analytic (bool): Использовать аналитическое решение вместо пошагового
+            моделирования, если перехватчик быстрее цели (analytic.analyticLineFight).
+            Столбцы имеют тот же смысл: d - расстояние в начале шага, q и n -
+            угол ракурса и перегрузка ядра кинематики; значения отличаются
+            ошибкой пошаговой траектории, в основном у точки перехвата
+        writer (FlightWriter | None): Потоковая запись шагов в архив (storage.py)
+        policy (TerminationPolicy | None): Дополнительные условия завершения
+        stats (Instrumentation | None): Сбор времени и вызовов по фазам шага,
+            результат доступен в flight.stats
+        motion (TargetMotion | None): Таблица движения цели (motion.py) вместо
+            пошагового расчета позиции цели
 
     Returns:
         Flight: Объект с данными о полете (траектория, перегрузки, расстояния и т.д.)
     """
+    if analytic and interceptor.velocity > abs(aim.velocity):
+        flight = analyticLineFight(aim, interceptor, config)
+        flight.outcome = Outcome.CAPTURED
+        if writer is not None:
+            for column in ("t", "n", "d", "q"):
+                writer.extend(column, getattr(flight, column))
+            writer.extend("aim", aim.trajectory)
+            writer.extend("interceptor", interceptor.trajectory)
+        if not headless:
+            from plotting import drawEngagement
+
+            drawEngagement(aim, interceptor, flight.steps)
+        return flight
+
     flight = Flight([], 0, [], [], [], [])
-    t = DELTA_T  # начальное время
-    step: int = 0  # счетчик шагов
-    distance = D0
-    s = interceptor.velocity * DELTA_T
-
-    # Цикл продолжается до тех пор, пока угол коррекции не станет равным 0
-    while True:
-        draw(aim, interceptor, step)
-        distance = distanceBetween(aim.trajectory[-1], interceptor.trajectory[-1])
-        UpdatePointOnLine(aim, t)
-        updateInterceptorPoint(interceptor, aim)
-        qi = findQAngle(aim, interceptor)
-
-        flight.n.append(overloadLineTargeting(aim, interceptor, qi))
-        flight.d.append(distance)
-        flight.q.append(qi)
-        flight.t.append(t)
-        t += DELTA_T
-        step += 1
-        if correctionAngle(aim, interceptor, pres) == 0 and distance < s:
-            break
-
-    flight.steps = step
-    return flight
+    steps = lineFightSteps(aim, interceptor, pres, config, policy, stats, motion)
+    return recordFlight(steps, aim, interceptor, flight, headless, writer, stats)
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from enum import Enum
+from time import perf_counter
+
+
+class Outcome(Enum):
+    """Итог моделирования перехвата."""
+
+    CAPTURED = "captured"  # цель перехвачена
+    MISSED = "missed"  # расстояние до цели начало расти - промах
+    BUDGET_EXCEEDED = "budget_exceeded"  # исчерпан лимит шагов или времени
+
+
+@dataclass(frozen=True)
+class TerminationPolicy:
+    """
+    Класс для описания условий досрочного завершения моделирования.
+
+    Условия проверяются после каждого шага в дополнение к собственному
+    условию остановки метода наведения. Неуказанные (None) условия не
+    проверяются.
+    """
+
+    max_steps: int | None = None  # наибольшее количество шагов
+    max_time: float | None = None  # наибольшее моделируемое время (с)
+    wall_clock: float | None = None  # наибольшее реальное время счета (с)
+    capture_radius: float | None = None  # расстояние, считающееся перехватом (м)
+    miss_after: int | None = None  # число шагов подряд с ростом расстояния
+
+    def start(self) -> "Termination":
+        """
+        Создает проверку условий для одного запуска моделирования.
+
+        Returns:
+            Termination: Объект, хранящий состояние проверки
+        """
+        return Termination(self)
+
+
+# Ограничение стоимости одного перехвата по умолчанию: при неудачной геометрии
+# собственное условие остановки метода может не сработать никогда
+DEFAULT_POLICY = TerminationPolicy(max_steps=100_000, miss_after=50)
+
+
+class Termination:
+    """Класс для проверки условий TerminationPolicy на одном запуске."""
+
+    def __init__(self, policy: TerminationPolicy):
+        self.policy = policy
+        self._started = perf_counter()
+        self._previous = float("inf")
+        self._growing = 0
+
+    def check(self, step: int, t: float, distance: float) -> Outcome | None:
+        """
+        Проверяет условия завершения после очередного шага.
+
+        Args:
+            step (int): Количество выполненных шагов
+            t (float): Время моделирования
+            distance (float): Текущее расстояние до цели
+
+        Returns:
+            Outcome | None: Итог, если моделирование нужно завершить, иначе None
+        """
+        policy = self.policy
+        if policy.capture_radius is not None and distance <= policy.capture_radius:
+            return Outcome.CAPTURED
+        if policy.miss_after is not None:
+            self._growing = self._growing + 1 if distance > self._previous else 0
+            self._previous = distance
+            if self._growing >= policy.miss_after:
+                return Outcome.MISSED
+        if policy.max_steps is not None and step >= policy.max_steps:
+            return Outcome.BUDGET_EXCEEDED
+        if policy.max_time is not None and t >= policy.max_time:
+            return Outcome.BUDGET_EXCEEDED
+        if (
+            policy.wall_clock is not None
+            and perf_counter() - self._started >= policy.wall_clock
+        ):
+            return Outcome.BUDGET_EXCEEDED
+        return None
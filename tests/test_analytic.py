@@ -0,0 +1,71 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+import targeting
+from analytic import parallelCircleCapture, parallelLineCapture
+from batch import batchParallelCircleFight, batchParallelLineFight
+from shared import DEFAULT_CONFIG, Point, Role
+from termination import Outcome
+
+
+def test_parallel_line_capture_matches_batch():
+    rng = np.random.default_rng(0)
+    count = 300
+    va = rng.uniform(150, 350, count)
+    vi = rng.uniform(150, 600, count)
+    d0 = rng.uniform(500, 5000, count)
+    q0 = rng.uniform(0, 180, count)
+    d = rng.uniform(10, 200, count)
+    closed = parallelLineCapture(va, vi, d0, q0, d, max_steps=400)
+    batch = batchParallelLineFight(va, vi, d0, q0, d, max_steps=400)
+    assert (~closed.captured).any() and closed.captured.any()
+    np.testing.assert_array_equal(closed.captured, batch.captured)
+    np.testing.assert_array_equal(closed.steps, batch.steps)
+    # Пиковая перегрузка - за выполненные шаги, в том числе без перехвата
+    np.testing.assert_allclose(closed.peak_overload, batch.peak, rtol=1e-9)
+
+
+def test_parallel_circle_capture_matches_batch():
+    vi = np.array([200.0, 300.0, 400.0, 600.0])
+    closed = parallelCircleCapture(250, vi, d=150, max_steps=400)
+    batch = batchParallelCircleFight(250, vi, d=150, max_steps=400)
+    np.testing.assert_array_equal(closed.captured, batch.captured)
+    np.testing.assert_array_equal(closed.steps, batch.steps)
+    np.testing.assert_allclose(closed.peak_overload, batch.peak, rtol=1e-9)
+
+
+@pytest.mark.parametrize("delta_t, q0", [(1, 90), (1, 45), (0.1, 135), (0.1, 45)])
+def test_analytic_line_fight_matches_stepped(delta_t, q0):
+    """
+    lineFight(analytic=True) возвращает столбцы с тем же смыслом, что и шаги.
+
+    Угол ракурса зависит только от движения цели и совпадает точно. Пока
+    расстояние больше половины начального, расстояние и перегрузка отличаются
+    от пошаговых не больше чем на 5 %; время перехвата - не больше чем на 3 шага.
+    """
+    config = replace(DEFAULT_CONFIG, delta_t=delta_t, q0=q0)
+
+    def roles():
+        return (
+            Role(config.aim_velocity, [Point(config.d0, 0)], 0, 0),
+            Role(config.interceptor_velocity, [Point(0, 0)], 0, 0),
+        )
+
+    stepped = targeting.lineFight(*roles(), 1, headless=True, config=config)
+    closed = targeting.lineFight(
+        *roles(), 1, headless=True, config=config, analytic=True
+    )
+    assert closed.outcome == stepped.outcome == Outcome.CAPTURED
+    assert abs(closed.steps - stepped.steps) <= 3
+    steps = min(closed.steps, stepped.steps)
+    np.testing.assert_allclose(closed.t[:steps], stepped.t[:steps], rtol=1e-12)
+    np.testing.assert_allclose(closed.q[:steps], stepped.q[:steps], atol=1e-12)
+    far = np.asarray(stepped.d[:steps]) > config.d0 / 2
+    for column in ("d", "n"):
+        np.testing.assert_allclose(
+            np.asarray(getattr(closed, column)[:steps])[far],
+            np.asarray(getattr(stepped, column)[:steps])[far],
+            rtol=0.05,
+        )
@@ -0,0 +1,119 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+import parallel
+import targeting
+from batch import (
+    batchCircleFight,
+    batchLineFight,
+    batchParallelCircleFight,
+    batchParallelLineFight,
+)
+from shared import DEFAULT_CONFIG, Point, Role
+from termination import TerminationPolicy
+
+# Постановки: (скорость цели, скорость перехватчика, D0, Q0)
+LINE_CASES = [(250, 400, 2500, 90), (250, 400, 3000, 45), (200, 500, 1500, 135)]
+# Постановки: (скорость цели, скорость перехватчика, центр, начальная фаза)
+CIRCLE_CASES = [
+    (250, 400, (0, 0), (0, 0)),
+    (-250, 400, (5000, 0), (np.pi, np.pi)),
+]
+
+# Часть постановок параллельного сближения по прямой не завершается перехватом,
+# поэтому оба движка ограничены одинаковым количеством шагов
+MAX_STEPS = 300
+POLICY = TerminationPolicy(max_steps=MAX_STEPS)
+
+
+def _roles(config):
+    aim = Role(config.aim_velocity, [Point(config.d0, 0)], 0, 0)
+    interceptor = Role(config.interceptor_velocity, [Point(0, 0)], 0, 0)
+    return aim, interceptor
+
+
+def _assertSameFlight(flight, batch):
+    """Пачка из одной строки повторяет скалярный полет шаг за шагом."""
+    steps = batch.steps[0]
+    assert steps == flight.steps
+    np.testing.assert_allclose(batch.n[0, :steps], flight.n, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(batch.d[0, :steps], flight.d, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(batch.q[0, :steps], flight.q, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(batch.t[:steps], flight.t, rtol=1e-12)
+
+
+@pytest.mark.parametrize("va, vi, d0, q0", LINE_CASES)
+def test_batch_line_pursuit_matches_scalar(va, vi, d0, q0):
+    config = replace(
+        DEFAULT_CONFIG, aim_velocity=va, interceptor_velocity=vi, d0=d0, q0=q0
+    )
+    flight = targeting.lineFight(
+        *_roles(config), 1, headless=True, config=config, policy=POLICY
+    )
+    _assertSameFlight(
+        flight, batchLineFight(va, vi, d0, q0, pres=1, count=1, max_steps=MAX_STEPS)
+    )
+
+
+@pytest.mark.parametrize("va, vi, d0, q0", LINE_CASES)
+def test_batch_parallel_line_matches_scalar(va, vi, d0, q0):
+    config = replace(
+        DEFAULT_CONFIG, aim_velocity=va, interceptor_velocity=vi, d0=d0, q0=q0
+    )
+    flight = parallel.lineFight(
+        *_roles(config), 20, headless=True, config=config, policy=POLICY
+    )
+    _assertSameFlight(
+        flight,
+        batchParallelLineFight(va, vi, d0, q0, d=20, count=1, max_steps=MAX_STEPS),
+    )
+
+
+@pytest.mark.parametrize("va, vi, center, start", CIRCLE_CASES)
+def test_batch_circle_pursuit_matches_scalar(va, vi, center, start):
+    config = replace(DEFAULT_CONFIG, aim_velocity=va, interceptor_velocity=vi)
+    flight = targeting.circleFight(
+        *_roles(config),
+        Point(*center),
+        Point(*start),
+        1,
+        headless=True,
+        config=config,
+        policy=POLICY,
+    )
+    batch = batchCircleFight(
+        va, vi, config.d0, config.r, center, start, pres=1, max_steps=MAX_STEPS, count=1
+    )
+    _assertSameFlight(flight, batch)
+
+
+@pytest.mark.parametrize("va, vi, center, start", CIRCLE_CASES)
+def test_batch_parallel_circle_matches_scalar(va, vi, center, start):
+    config = replace(DEFAULT_CONFIG, aim_velocity=va, interceptor_velocity=vi)
+    flight = parallel.fight(
+        *_roles(config),
+        Point(*center),
+        Point(*start),
+        150,
+        headless=True,
+        config=config,
+        policy=POLICY,
+    )
+    batch = batchParallelCircleFight(
+        va, vi, config.d0, config.r, center, start, d=150, max_steps=MAX_STEPS, count=1
+    )
+    _assertSameFlight(flight, batch)
+
+
+def test_batch_rows_are_independent():
+    """Строка пачки не зависит от остальных строк."""
+    d0 = np.array([1500.0, 2500.0, 3500.0])
+    q0 = np.array([45.0, 90.0, 135.0])
+    batch = batchLineFight(250, 400, d0, q0)
+    for i in range(len(d0)):
+        single = batchLineFight(250, 400, d0[i], q0[i], count=1)
+        steps = single.steps[0]
+        assert batch.steps[i] == steps
+        np.testing.assert_array_equal(batch.n[i, :steps], single.n[0, :steps])
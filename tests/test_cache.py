@@ -0,0 +1,72 @@
+from dataclasses import replace
+
+import sweep
+from cache import ResultCache, cacheKey, cachedFight
+from shared import DEFAULT_CONFIG, Point, Role
+from termination import DEFAULT_POLICY, TerminationPolicy
+
+
+def _roles():
+    aim = Role(250, [Point(2500, 0)], 0, 0)
+    interceptor = Role(400, [Point(0, 0)], 0, 0)
+    return aim, interceptor
+
+
+def test_cache_hit_returns_same_flight(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+    flight, key = cachedFight(cache, "line", *_roles(), 1)
+    assert [entry[0] for entry in cache.entries()] == [key]
+
+    # Повторный запуск берется из кэша без моделирования
+    def fail(*args, **kwargs):
+        raise AssertionError("моделирование при попадании в кэш")
+
+    monkeypatch.setitem(sweep.METHODS, "line", (fail, False))
+    aim, interceptor = _roles()
+    cached, cached_key = cachedFight(cache, "line", aim, interceptor, 1)
+    assert cached_key == key
+    assert cached.steps == flight.steps
+    assert cached.outcome is flight.outcome
+    for column in ("n", "d", "q", "t"):
+        assert getattr(cached, column) == getattr(flight, column)
+    assert len(aim.trajectory) == flight.steps + 1
+    assert len(interceptor.trajectory) == flight.steps + 1
+
+
+def test_cache_key_depends_on_inputs():
+    key = cacheKey("line", *_roles(), (1,))
+    assert key == cacheKey("line", *_roles(), (1,))
+    assert key != cacheKey("line", *_roles(), (2,))
+    assert key != cacheKey("parallel_line", *_roles(), (1,))
+    config = replace(DEFAULT_CONFIG, delta_t=0.5)
+    assert key != cacheKey("line", *_roles(), (1,), config)
+
+
+def test_cache_key_uses_effective_policy(monkeypatch):
+    """policy=None хэшируется как DEFAULT_POLICY, а не как отсутствие условий."""
+    key = cacheKey("line", *_roles(), (1,))
+    assert key == cacheKey("line", *_roles(), (1,), policy=DEFAULT_POLICY)
+    assert key != cacheKey("line", *_roles(), (1,), policy=TerminationPolicy())
+    monkeypatch.setattr("cache.DEFAULT_POLICY", TerminationPolicy(max_steps=10))
+    assert key != cacheKey("line", *_roles(), (1,))
+
+
+def test_cache_invalidate(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    _, line_key = cachedFight(cache, "line", *_roles(), 1)
+    _, parallel_key = cachedFight(cache, "parallel_line", *_roles(), 20)
+    assert cache.invalidate(method="line") == 1
+    assert cache.get(line_key) is None
+    assert cache.get(parallel_key) is not None
+    assert cache.invalidate(key=parallel_key) == 1
+    assert cache.entries() == []
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    _, first = cachedFight(cache, "line", *_roles(), 1)
+    size = cache.entries()[0][2]
+    cache.max_bytes = int(size * 1.5)
+    _, second = cachedFight(cache, "parallel_line", *_roles(), 20)
+    keys = [entry[0] for entry in cache.entries()]
+    assert keys == [second]
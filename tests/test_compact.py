@@ -0,0 +1,28 @@
+import numpy as np
+
+from cli import Scenario, plotScenario
+from compact import SUMMARY, Decimation, recordCompact
+from shared import Point, Role
+from targeting import lineFight, lineFightSteps
+
+
+def _roles():
+    return Role(250, [Point(2500, 0)], 0, 0), Role(400, [Point(0, 0)], 0, 0)
+
+
+def test_summary_keeps_first_and_last_steps(tmp_path):
+    """Полет с политикой SUMMARY сохраняет крайние шаги и строится на графике."""
+    flight = lineFight(*_roles(), 1, headless=True)
+    compact = recordCompact(
+        lineFightSteps(*_roles(), 1), Decimation(SUMMARY), dtype=np.float64
+    )
+    assert compact.steps == flight.steps
+    np.testing.assert_array_equal(compact.index, [0, flight.steps - 1])
+    np.testing.assert_array_equal(compact.t, [flight.t[0], flight.t[-1]])
+    np.testing.assert_array_equal(compact.n, [flight.n[0], flight.n[-1]])
+    assert compact.summary["n"].max == max(flight.n)
+
+    path = tmp_path / "overload.png"
+    scenario = Scenario("summary", "line", 1, {}, {}, overload_plot=str(path))
+    plotScenario(scenario, compact, *_roles())
+    assert path.exists()
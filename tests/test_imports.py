@@ -0,0 +1,16 @@
+import tomllib
+from pathlib import Path
+
+from bench import IMPORTS, benchImports, heavyImports
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_imports_cover_all_modules():
+    with open(ROOT / "pyproject.toml", "rb") as file:
+        modules = tomllib.load(file)["tool"]["setuptools"]["py-modules"]
+    assert set(IMPORTS) == set(modules) - {"plotting", "bench"}
+
+
+def test_modules_import_without_heavy_libraries():
+    assert heavyImports({"imports": benchImports(repeat=1)}) == []
@@ -0,0 +1,29 @@
+from instrument import Instrumentation, PhaseHook
+from shared import Point, Role
+from targeting import lineFight
+
+
+class _Counter(PhaseHook):
+    def __init__(self):
+        self.calls = {}
+
+    def exit(self, phase, seconds):
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+
+def _roles():
+    return Role(250, [Point(2500, 0)], 0, 0), Role(400, [Point(0, 0)], 0, 0)
+
+
+def test_phases_are_timed_separately():
+    """Части ядра кинематики учитываются отдельно и не меняют результат."""
+    hook = _Counter()
+    stats = Instrumentation([hook])
+    timed = lineFight(*_roles(), 1, headless=True, stats=stats)
+    plain = lineFight(*_roles(), 1, headless=True)
+    assert timed.n == plain.n and timed.d == plain.d and timed.q == plain.q
+    phases = ("aim", "interceptor", "distance", "correction", "q_angle", "overload")
+    assert tuple(stats.phases) == phases
+    for phase in phases:
+        assert stats.phases[phase].calls == plain.steps
+        assert hook.calls[phase] == plain.steps
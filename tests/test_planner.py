@@ -0,0 +1,91 @@
+from itertools import permutations
+
+import numpy as np
+import pytest
+
+from motion import TargetMotion
+from engine import fight
+from parallel import ParallelApproach
+from planner import MAX, TOTAL, assign, captureMatrices, plan
+from shared import Point, Role
+from targeting import Pursuit
+from termination import Outcome
+
+
+def _bruteForce(capture_time, feasible, objective):
+    """Перебор всех назначений: наибольшее число пар, затем критерий."""
+    K, M = capture_time.shape
+    if K > M:
+        return _bruteForce(capture_time.T, feasible.T, objective)
+    best = (0, 0.0)
+    for columns in permutations(range(M), K):
+        times = [capture_time[k, m] for k, m in enumerate(columns) if feasible[k, m]]
+        if not times:
+            continue
+        value = max(times) if objective == MAX else sum(times)
+        if len(times) > best[0] or (len(times) == best[0] and value < best[1]):
+            best = (len(times), value)
+    return best
+
+
+@pytest.mark.parametrize("objective", [TOTAL, MAX])
+@pytest.mark.parametrize("shape", [(3, 3), (4, 5), (5, 3)])
+def test_assign_matches_brute_force(objective, shape):
+    rng = np.random.default_rng(sum(shape))
+    for _ in range(20):
+        capture_time = rng.uniform(1, 100, shape).round(1)
+        feasible = rng.random(shape) > 0.3
+        pairs, value = assign(capture_time, feasible, objective)
+        count, expected = _bruteForce(capture_time, feasible, objective)
+        assert len(pairs) == count
+        assert value == pytest.approx(expected)
+        assert len({k for k, _ in pairs}) == len({m for _, m in pairs}) == len(pairs)
+        assert all(feasible[k, m] for k, m in pairs)
+
+
+def test_plan_assigns_closest_targets():
+    interceptors = [
+        Role(400, [Point(0, 0)], 0, 0),
+        Role(400, [Point(0, 5000)], 0, 0),
+    ]
+    targets = [
+        TargetMotion("line", 250, 1.0, d0=2500, q0=90, y0=5000),
+        TargetMotion("line", 250, 1.0, d0=2500, q0=90),
+    ]
+    result = plan(interceptors, targets)
+    assert sorted(result.pairs) == [(0, 1), (1, 0)]
+    assert np.all(np.isfinite(result.capture_time))
+    assert result.objective == pytest.approx(
+        result.capture_time[0, 1] + result.capture_time[1, 0]
+    )
+
+
+def test_pair_captured_at_start_has_zero_time():
+    interceptors = [Role(400, [Point(2490, 0)], 0, 0), Role(400, [Point(0, 0)], 0, 0)]
+    targets = [TargetMotion("line", 250, 1.0, d0=2500, q0=90)]
+    capture_time, peak = captureMatrices(
+        interceptors, targets, ParallelApproach(d=20), max_steps=100
+    )
+    assert capture_time[0, 0] == 0.0
+    assert peak[0, 0] == 0.0
+    assert capture_time[1, 0] > 0.0
+
+
+def test_capture_matrices_match_scalar_engine():
+    interceptors = [Role(400, [Point(0, 0)], 0, 0), Role(500, [Point(0, 3000)], 0, 0)]
+    targets = [
+        TargetMotion("line", 250, 1.0, d0=2500, q0=60, y0=100),
+        TargetMotion(
+            "circle", -250, 1.0, r=2500, center=(5000, 0), start=(np.pi, np.pi)
+        ),
+    ]
+    capture_time, peak = captureMatrices(interceptors, targets)
+    for k, role in enumerate(interceptors):
+        for m, target in enumerate(targets):
+            start = target.compute(np.array([0.0]))[0]
+            aim = Role(target.velocity, [Point(*start)], 0, 0)
+            interceptor = Role(role.velocity, [role.trajectory[-1]], 0, 0)
+            flight = fight(aim, interceptor, target.updater(), Pursuit(), headless=True)
+            assert flight.outcome is Outcome.CAPTURED
+            assert capture_time[k, m] == flight.t[-1]
+            assert peak[k, m] == pytest.approx(max(flight.n))
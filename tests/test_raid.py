@@ -0,0 +1,52 @@
+import numpy as np
+
+from motion import MIN_STEPS, TABLE_CACHE_SIZE, TargetMotion, _tables, clearTables
+from raid import ASSIGNED, NEAREST, raidFight
+from shared import Point, Role
+
+
+def test_kill_uses_distance_at_start_of_step():
+    # Встречная цель: после шага 2 она ближе 400 м к перехватчику до шага,
+    # но в начале шага 2 расстояние 550 м, поэтому поражение - на шаге 3
+    targets = [TargetMotion("line", 250, 1.0, d0=1200, q0=180)]
+    interceptors = [Role(400, [Point(0, 0)], 0, 0)]
+    raid = raidFight(targets, interceptors, record=True)
+    assert raid.kills == [(3, 0, 0)]
+    gap = raid.aim[2, 0] - raid.interceptor[2, 0]
+    assert np.hypot(*gap) <= 400
+
+
+def test_each_target_killed_once():
+    targets = [
+        TargetMotion("line", 250, 1.0, d0=6000, q0=180, y0=y)
+        for y in range(-2000, 2001, 1000)
+    ]
+    interceptors = [Role(600, [Point(0, y)], 0, 0) for y in range(-1500, 1501, 500)]
+    for mode in (NEAREST, ASSIGNED):
+        raid = raidFight(targets, interceptors, mode=mode)
+        killed = [target for _, _, target in raid.kills]
+        assert len(killed) == len(set(killed)) == len(targets)
+        assert len(raid.survivors) == 0
+        hunters = [interceptor for _, interceptor, _ in raid.kills]
+        assert len(hunters) == len(set(hunters))
+
+
+def test_large_raid_keeps_motion_cache():
+    """Налет больше кэша таблиц motion.py не вытесняет из него таблицы."""
+    clearTables()
+    kept = TargetMotion("line", 250, 1.0, d0=2500)
+    kept.table(10)
+    targets = [
+        TargetMotion("line", 250, 1.0, d0=8000, y0=y)
+        for y in range(-TABLE_CACHE_SIZE * 50, TABLE_CACHE_SIZE * 50 + 1, 50)
+    ]
+    # Цели уходят быстрее, чем их догоняют: таблица налета удлиняется
+    interceptors = [Role(251, [Point(0, y)], 0, 0) for y in range(-3000, 3001, 600)]
+    raid = raidFight(targets, interceptors, max_steps=2 * MIN_STEPS, record=True)
+    assert raid.steps == 2 * MIN_STEPS
+    assert list(_tables) == [kept]
+    # Позиции совпадают с таблицами движения целей
+    for m in (0, len(targets) // 2, len(targets) - 1):
+        np.testing.assert_array_equal(
+            raid.aim[1:, m], targets[m].table(raid.steps)[: raid.steps]
+        )
@@ -0,0 +1,40 @@
+import asyncio
+
+from engine import fight
+from motion import lineTarget
+from realtime import RealTimeRunner, consume, realTimeFight
+from shared import Point, Role
+from targeting import Pursuit
+
+
+def _roles():
+    aim = Role(250, [Point(2500, 0)], 0, 0)
+    interceptor = Role(400, [Point(0, 0)], 0, 0)
+    return aim, interceptor
+
+
+def test_real_time_fight_records_like_fight():
+    """Записанный полет и опубликованные шаги совпадают с engine.fight."""
+    aim, interceptor = _roles()
+    expected = fight(aim, interceptor, lineTarget(250).updater(), Pursuit(1), True)
+
+    async def run():
+        runner = RealTimeRunner(speed=None)
+        log = runner.subscribe(maxsize=expected.steps + 1)
+        aim, interceptor = _roles()
+        ticks = []
+        flight, _ = await asyncio.gather(
+            realTimeFight(
+                runner, aim, interceptor, lineTarget(250).updater(), Pursuit(1)
+            ),
+            consume(log, ticks.append),
+        )
+        return flight, ticks, aim
+
+    flight, ticks, aim = asyncio.run(run())
+    assert flight.steps == expected.steps
+    assert flight.outcome is expected.outcome
+    for column in ("n", "d", "q", "t"):
+        assert getattr(flight, column) == getattr(expected, column)
+    assert [tick.step.t for tick in ticks] == expected.t
+    assert len(aim.trajectory) == expected.steps + 1
@@ -0,0 +1,76 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+from scipy.interpolate import CubicSpline, interp1d
+
+import targeting
+from compact import compactFlight
+from resample import commonGrid, flightSpline, resample, resampleFlights
+from shared import Flight, Point, Role
+
+
+def _flight(t, n):
+    return Flight(list(n), len(t), list(n), list(n), [], list(t))
+
+
+def test_resample_matches_interp1d():
+    aim = Role(250, [Point(2500, 0)], 0, 0)
+    interceptor = Role(400, [Point(0, 0)], 0, 0)
+    flight = targeting.lineFight(aim, interceptor, 1, headless=True)
+    grid = np.linspace(min(flight.t), max(flight.t), 300)
+    expected = interp1d(flight.t, flight.n, kind="cubic")(grid)
+    np.testing.assert_allclose(resample(flight, grid), expected, rtol=1e-12, atol=1e-12)
+
+
+def test_resample_flights_of_different_length():
+    rng = np.random.default_rng(0)
+    flights = []
+    for length in (2, 3, 7, 40):
+        t = np.cumsum(rng.uniform(0.1, 1.0, length))
+        flights.append(_flight(t, rng.normal(size=length)))
+    grid = commonGrid(flights, 500)
+    result = resampleFlights(flights, grid)
+    assert result.shape == (len(flights), len(grid))
+    for flight, row in zip(flights, result):
+        inside = (grid >= flight.t[0]) & (grid <= flight.t[-1])
+        expected = CubicSpline(flight.t, flight.n)(grid[inside])
+        np.testing.assert_allclose(row[inside], expected, rtol=1e-12, atol=1e-12)
+        assert np.isnan(row[~inside]).all()
+
+
+def test_single_point_flight():
+    flight = _flight([1.0], [5.0])
+    result = resampleFlights([flight], np.array([0.5, 1.0, 1.5]))
+    np.testing.assert_array_equal(result[0], [np.nan, 5.0, np.nan])
+
+
+def test_spline_cache_and_compact_flight():
+    t = np.linspace(0.1, 5.0, 50)
+    flight = _flight(t, np.sin(t))
+    assert flightSpline(flight) is flightSpline(flight)
+    compact = compactFlight(flight, dtype=np.float64)
+    grid = np.linspace(0.1, 5.0, 123)
+    np.testing.assert_allclose(
+        resample(compact, grid), resample(flight, grid), rtol=1e-12, atol=1e-12
+    )
+    # Добавление точек перестраивает кэшированный сплайн
+    flight.t.append(5.1)
+    flight.n.append(np.sin(5.1))
+    assert resample(flight, np.array([5.05]))[0] == pytest.approx(
+        np.sin(5.05), abs=1e-4
+    )
+
+
+def test_spline_cache_follows_flight_data():
+    """Полеты с тем же количеством точек не получают чужой сплайн."""
+    t = np.linspace(0.1, 5.0, 50)
+    flight = _flight(t, np.sin(t))
+    other = replace(flight, n=list(np.cos(t)))
+    assert other.splines is flight.splines
+    grid = np.array([1.0, 2.5])
+    np.testing.assert_allclose(resample(flight, grid), np.sin(grid), atol=1e-4)
+    np.testing.assert_allclose(resample(other, grid), np.cos(grid), atol=1e-4)
+    # Изменение значений на месте тоже перестраивает сплайн
+    flight.n[:] = np.cos(t)
+    np.testing.assert_allclose(resample(flight, grid), np.cos(grid), atol=1e-4)
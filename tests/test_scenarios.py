@@ -0,0 +1,26 @@
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from cli import loadScenarios, runScenario
+from main import SCENARIOS
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.mark.parametrize("scenario", loadScenarios(SCENARIOS), ids=lambda s: s.name)
+def test_scenario_matches_reference(scenario, tmp_path):
+    """
+    Данные сценариев main.py совпадают с эталоном в img/.
+
+    Эталон построен исходными циклами моделирования; для погони по прямой
+    перегрузка считается по истинному расстоянию (ядро кинематики).
+    """
+    expected = (ROOT / scenario.data).read_text()
+    data = tmp_path / "flight.txt"
+    scenario = replace(
+        scenario, data=str(data), trajectory_plot=None, overload_plot=None
+    )
+    runScenario(scenario, plot=False, cache=None)
+    assert data.read_text() == expected
@@ -0,0 +1,58 @@
+import numpy as np
+
+import targeting
+from shared import Point, Role
+from storage import FlightWriter, readFlight, readMeta, writeFlight
+from termination import Outcome
+
+
+def _lineFlight(writer=None):
+    aim = Role(250, [Point(2500, 0)], 0, 0)
+    interceptor = Role(400, [Point(0, 0)], 0, 0)
+    flight = targeting.lineFight(aim, interceptor, 1, headless=True, writer=writer)
+    return flight, aim, interceptor
+
+
+def test_write_read_roundtrip(tmp_path):
+    flight, aim, interceptor = _lineFlight()
+    writeFlight(tmp_path, flight, aim, interceptor, {"method": "line"})
+    for mmap in (True, False):
+        loaded, aim_trajectory, interceptor_trajectory = readFlight(tmp_path, mmap)
+        assert loaded.steps == flight.steps
+        assert loaded.outcome is Outcome.CAPTURED
+        for column in ("n", "d", "q", "phi", "t"):
+            np.testing.assert_array_equal(
+                getattr(loaded, column), getattr(flight, column)
+            )
+        np.testing.assert_array_equal(aim_trajectory.points, aim.trajectory.points)
+        np.testing.assert_array_equal(
+            interceptor_trajectory.points, interceptor.trajectory.points
+        )
+    assert readMeta(tmp_path)["method"] == "line"
+
+
+def test_streaming_writer_matches_flight(tmp_path):
+    # Маленькие порции проверяют дозапись столбцов несколькими блоками
+    with FlightWriter(tmp_path, chunk_size=3) as writer:
+        flight, aim, interceptor = _lineFlight(writer)
+    loaded, aim_trajectory, interceptor_trajectory = readFlight(tmp_path)
+    assert loaded.steps == flight.steps
+    assert loaded.outcome is flight.outcome
+    for column in ("n", "d", "q", "t"):
+        np.testing.assert_array_equal(getattr(loaded, column), getattr(flight, column))
+    np.testing.assert_array_equal(aim_trajectory.points, aim.trajectory.points)
+    np.testing.assert_array_equal(
+        interceptor_trajectory.points, interceptor.trajectory.points
+    )
+
+
+def test_writer_extend_and_append(tmp_path):
+    with FlightWriter(tmp_path, chunk_size=2) as writer:
+        writer.extend("t", [0.1, 0.2, 0.3])
+        writer.append("t", 0.4)
+        writer.extend("t", np.array([0.5, 0.6]))
+        writer.extend("aim", [Point(1, 2), Point(3, 4)])
+    flight, aim_trajectory, _ = readFlight(tmp_path, mmap=False)
+    np.testing.assert_array_equal(flight.t, [0.1, 0.2, 0.3, 0.4, 0.5, 0.6])
+    np.testing.assert_array_equal(aim_trajectory.points, [[1, 2], [3, 4]])
+    assert flight.steps == 6
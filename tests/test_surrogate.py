@@ -0,0 +1,88 @@
+from functools import cache
+
+import numpy as np
+import pytest
+
+from surrogate import (
+    QUANTITIES,
+    TABLE_QUANTITIES,
+    TOLERANCE,
+    buildSurrogate,
+    loadSurrogate,
+    saveSurrogate,
+)
+
+METHODS = sorted(TABLE_QUANTITIES)
+
+
+@cache
+def _table(method):
+    """Таблица с параметрами моделирования по умолчанию."""
+    return buildSurrogate(
+        method,
+        np.linspace(2000, 6000, 21),
+        np.linspace(0, 180, 37),
+        np.linspace(1.5, 2.5, 11),
+    )
+
+
+def _queries(count=600, seed=1):
+    rng = np.random.default_rng(seed)
+    return (
+        rng.uniform(1.5, 2.5, count),
+        rng.uniform(2000, 6000, count),
+        rng.uniform(0, 180, count),
+    )
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_most_queries_answered_from_table(method):
+    """При параметрах по умолчанию большинство запросов в таблице не моделируются."""
+    result = _table(method).query(*_queries(), fallback=False)
+    assert (~result.simulated).mean() > 0.5
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_table_answers_match_simulation(method):
+    """Ответы из таблицы совпадают с моделированием с точностью tolerance."""
+    surrogate = _table(method)
+    queries = _queries()
+    result = surrogate.query(*queries, fallback=False)
+    exact = surrogate.query(*queries, tolerance=-1.0, quantities=QUANTITIES)
+    table = ~result.simulated
+    assert exact.simulated.all()
+    np.testing.assert_array_equal(result.captured[table], exact.captured[table])
+    for name in TABLE_QUANTITIES[method]:
+        value = getattr(result, name)[table]
+        expected = getattr(exact, name)[table]
+        assert np.all(np.abs(value - expected) <= TOLERANCE * np.abs(expected))
+
+
+def test_missed_cells_are_simulated():
+    """Ответы без перехвата и у границы зоны перехвата из таблицы не берутся."""
+    surrogate = _table("parallel_line")
+    result = surrogate.query(*_queries(), tolerance=np.inf)
+    assert (~result.simulated).any()
+    assert result.captured[~result.simulated].all()
+    assert (~result.captured).any()
+
+
+def test_unbounded_peak_falls_back():
+    """Пиковая перегрузка погони не гладкая: ответы с ней моделируются."""
+    surrogate = _table("line")
+    assert surrogate.holdout_error[1].max() > 1e6
+    result = surrogate.query(*_queries(200), fallback=False, quantities=QUANTITIES)
+    assert result.simulated.all()
+
+
+def test_saved_surrogate_keeps_validation(tmp_path):
+    surrogate = _table("parallel_line")
+    path = tmp_path / "surrogate.npz"
+    saveSurrogate(str(path), surrogate)
+    loaded = loadSurrogate(str(path))
+    np.testing.assert_array_equal(loaded.holdout_error, surrogate.holdout_error)
+    queries = _queries(200)
+    np.testing.assert_array_equal(
+        loaded.query(*queries, fallback=False).simulated,
+        surrogate.query(*queries, fallback=False).simulated,
+    )
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from batch import batchParallelLineFight
+from sweep import gridParams, sweep
+
+
+@pytest.mark.parametrize("method", ["parallel", "parallel_line"])
+def test_slow_interceptor_sweep_reports_miss(method):
+    """Медленный перехватчик (K < |sin q|) дает промах, а не ошибку всего перебора."""
+    result = sweep(
+        method,
+        gridParams(interceptor_velocity=[200, 400], aim_velocity=[250]),
+        jobs=1,
+    )
+    assert result["outcome"].tolist() == ["missed", "captured"]
+    assert np.isnan(result["peak_overload"][0])
+
+
+def test_slow_interceptor_matches_batch():
+    row = sweep(
+        "parallel_line",
+        gridParams(interceptor_velocity=[200], aim_velocity=[250]),
+        jobs=1,
+    )[0]
+    batch = batchParallelLineFight(250, 200, d=20, count=1)
+    assert row["steps"] == batch.steps[0]
+    assert not batch.captured[0]